@@ -1,25 +1,247 @@
 #!/usr/bin/env python3
-import os, json, sys, datetime as dt
+import os, re, json, sys, time, socket, threading, datetime as dt
+
+try:
+    from .segments import SegmentedLog
+except ImportError:  # run as a script, or with la_paz itself on sys.path
+    from segments import SegmentedLog
 
 BASE = "/Users/jbear/FIELD-DEV"
 EVENTS = f"{BASE}/logs/petal_lapaz.events.jsonl"
+SOCKET = os.environ.get("PETAL_LAPAZ_SOCKET", f"{BASE}/run/petal_lapaz.events.sock")
+PETAL = "PETAL_LAPAZ_10_16_SHOWERS"
+FSYNC_POLICIES = ("never", "batch", "always")
+# Sealed segments kept per log (0 keeps them all); a year of daily rolls by default
+KEEP_SEGMENTS = int(os.environ.get("PETAL_LAPAZ_KEEP_SEGMENTS", "366"))
+# What record() writes: segments and rollups slice the day and hour out of ts
+TS_FORMAT = re.compile(r"\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}(\.\d{1,6})?(Z|[+-]00:00)?")
 
-def emit(kind, data):
-    rec = {
-        "ts": dt.datetime.utcnow().isoformat()+"Z",
-        "petal": "PETAL_LAPAZ_10_16_SHOWERS",
+def record(kind, data, ts=None):
+    return {
+        "ts": ts or dt.datetime.utcnow().isoformat()+"Z",
+        "petal": PETAL,
         "kind": kind,
         "data": data
     }
-    os.makedirs(os.path.dirname(EVENTS), exist_ok=True)
-    with open(EVENTS, "a") as f: f.write(json.dumps(rec)+"\n")
+
+class EventWriter:
+    """Appends event records to the events JSONL through one open handle.
+
+    Records are buffered and written out together once batch_size are
+    pending or the oldest has waited flush_interval seconds (checked on
+    every write and by a background thread; 0 turns the timer off), and
+    on flush()/close().
+    fsync: "never" leaves durability to the OS, "batch" fsyncs each
+    write-out, "always" writes and fsyncs every record on its own.
+    Each write-out is a single O_APPEND write, so concurrent writers
+    never interleave partial lines. With rotate (the default) the file is
+    a SegmentedLog and rolls by size/day between write-outs; the rolled
+    segment is compressed on a background thread and only the newest
+    keep segments are retained (0 keeps all).
+    """
+
+    def __init__(self, path=EVENTS, batch_size=512, flush_interval=0.5, fsync="never", rotate=True,
+                 keep=KEEP_SEGMENTS):
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f"unknown fsync policy: {fsync}")
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.path = path
+        self.batch_size = 1 if fsync == "always" else max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.fsync = fsync
+        self.log = SegmentedLog(path, keep=keep or None, background=True) if rotate else None
+        self.fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        self.pending = []
+        self.pending_ts = None
+        self.oldest = 0.0
+        self.written = 0
+        self.lock = threading.Lock()
+        self.stopped = threading.Event()
+        self.thread = None
+        if flush_interval and self.batch_size > 1:
+            self.thread = threading.Thread(target=self._flusher, name="event-writer-flush", daemon=True)
+            self.thread.start()
+
+    def emit(self, kind, data, ts=None):
+        self.write(record(kind, data, ts))
+
+    def write(self, rec):
+        line = json.dumps(rec)+"\n"
+        with self.lock:
+            if not self.pending:
+                self.oldest = time.monotonic()
+                self.pending_ts = rec.get("ts")
+            self.pending.append(line)
+            if len(self.pending) >= self.batch_size or (
+                    self.flush_interval and time.monotonic()-self.oldest >= self.flush_interval):
+                self._write_out()
+
+    def write_many(self, recs):
+        for rec in recs: self.write(rec)
+
+    def flush(self):
+        with self.lock: self._write_out()
+
+    def _write_out(self):
+        if not self.pending: return
+        data = "".join(self.pending).encode()
+        if self.log:
+            self.fd = self.log.append(self.fd, data, self.pending_ts)
+        else:
+            data = memoryview(data)
+            while data:
+                data = data[os.write(self.fd, data):]
+        if self.fsync != "never": os.fsync(self.fd)
+        self.written += len(self.pending)
+        self.pending = []
+
+    def _flusher(self):
+        # Wake at half the interval so nothing waits much past flush_interval
+        while not self.stopped.wait(self.flush_interval/2):
+            with self.lock:
+                if self.pending and time.monotonic()-self.oldest >= self.flush_interval:
+                    self._write_out()
+
+    def close(self):
+        self.stopped.set()
+        if self.thread: self.thread.join()
+        with self.lock:
+            if self.fd is None: return
+            self._write_out()
+            os.close(self.fd)
+            self.fd = None
+        if self.log: self.log.wait()
+
+    def __enter__(self): return self
+    def __exit__(self, *exc): self.close()
+
+def connect(path=SOCKET, timeout=5.0):
+    """Socket to event_daemon.py, or None if it isn't running"""
+    s = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    s.settimeout(timeout)
+    try:
+        s.connect(path)
+    except OSError:
+        s.close()
+        return None
+    return s
+
+def exchange(s, f, recs):
+    # Send a chunk and read its replies; chunks stay small enough that
+    # unread replies never fill the socket buffer
+    s.sendall("".join(json.dumps(rec)+"\n" for rec in recs).encode())
+    replies = []
+    for _ in recs:
+        line = f.readline()
+        if not line: raise ConnectionError("event daemon closed the connection")
+        replies.append(json.loads(line))
+    return replies
+
+def send(recs, path=SOCKET):
+    """Forward records to event_daemon.py; its replies, or None if it isn't running"""
+    s = connect(path)
+    if s is None: return None
+    with s, s.makefile("rb") as f:
+        return exchange(s, f, recs)
+
+def emit(kind, data):
+    rec = record(kind, data)
+    replies = send([rec])
+    if replies is None:
+        # No daemon - write directly
+        with EventWriter(batch_size=1, flush_interval=0) as w: w.write(rec)
+    elif not replies[0]["ok"]:
+        raise ValueError(replies[0]["error"])
     print(f"➤ event: {kind}")
 
+def valid_ts(ts):
+    """ISO-8601 UTC date and time, e.g. 2025-08-09T10:16:00Z"""
+    if not isinstance(ts, str) or not TS_FORMAT.fullmatch(ts): return False
+    try:
+        dt.datetime.fromisoformat(ts[:19])
+    except ValueError:
+        return False  # e.g. month 13
+    return True
+
+def parse_line(line):
+    # NDJSON input: {"kind": ..., "data": {...}} or {"kind": ..., "value": ...}, optional "ts"
+    # TypeError for a line that isn't such an object, ValueError for bad JSON or a bad ts
+    obj = json.loads(line)
+    if not isinstance(obj, dict) or not isinstance(obj.get("kind"), str):
+        raise TypeError("expected an object with a string 'kind'")
+    if "ts" in obj and not valid_ts(obj["ts"]):
+        raise ValueError(f"'ts' must be an ISO-8601 UTC timestamp, got {obj['ts']!r}")
+    data = obj["data"] if "data" in obj else {"value": obj.get("value")}
+    return record(obj["kind"], data, obj.get("ts"))
+
+def emit_stream(lines, writer):
+    ok = bad = 0
+    for n, line in enumerate(lines, 1):
+        if not line.strip(): continue
+        try:
+            writer.write(parse_line(line))
+            ok += 1
+        except (TypeError, ValueError) as e:
+            bad += 1
+            print(f"⚠️  line {n}: {e}", file=sys.stderr)
+    return ok, bad
+
+def forward_stream(lines, chunk=1000, path=SOCKET):
+    # Bulk NDJSON through the daemon on one connection; None if it isn't running
+    s = connect(path)
+    if s is None: return None
+    ok = bad = 0
+    batch, numbers = [], []
+    def drain():
+        nonlocal ok, bad
+        for n, reply in zip(numbers, exchange(s, f, batch)):
+            if reply["ok"]: ok += 1
+            else:
+                bad += 1
+                print(f"⚠️  line {n}: {reply['error']}", file=sys.stderr)
+        batch.clear(); numbers.clear()
+    with s, s.makefile("rb") as f:
+        for n, line in enumerate(lines, 1):
+            if not line.strip(): continue
+            try:
+                batch.append(parse_line(line))
+                numbers.append(n)
+            except (TypeError, ValueError) as e:
+                bad += 1
+                print(f"⚠️  line {n}: {e}", file=sys.stderr)
+            if len(batch) >= chunk: drain()
+        if batch: drain()
+    return ok, bad
+
 if __name__ == "__main__":
     # Usage: emit_event.py carrier_lock on|off  OR daily_pulse present|absent
+    #        emit_event.py --stdin [--fsync never|batch|always] < events.ndjson
+    if sys.argv[1:2] == ["--stdin"]:
+        fsync = None
+        if "--fsync" in sys.argv[2:]:
+            fsync = sys.argv[sys.argv.index("--fsync")+1]
+            daemon = connect()
+            if daemon is not None:
+                # The daemon syncs by its own --fsync policy; don't silently ignore ours
+                daemon.close()
+                print("⚠️  --fsync only applies without event_daemon.py; set it on the daemon instead",
+                      file=sys.stderr)
+                sys.exit(2)
+        result = None if fsync else forward_stream(sys.stdin)
+        if result is None:
+            with EventWriter(fsync=fsync or "never") as w:
+                result = emit_stream(sys.stdin, w)
+        ok, bad = result
+        print(f"➤ events: {ok} written, {bad} rejected")
+        sys.exit(1 if bad and not ok else 0)
     if len(sys.argv) < 3:
         print("Usage: emit_event.py <carrier_lock|daily_pulse|note> <value>")
+        print("       emit_event.py --stdin [--fsync never|batch|always] < events.ndjson")
         sys.exit(1)
     kind = sys.argv[1]
     value = " ".join(sys.argv[2:])
-    emit(kind, {"value": value})
+    try:
+        emit(kind, {"value": value})
+    except ValueError as e:
+        print(f"⚠️  {e}")
+        sys.exit(1)
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+import os, json, sys, signal, socket, asyncio, argparse
+
+try:
+    from .emit_event import EVENTS, SOCKET, FSYNC_POLICIES, KEEP_SEGMENTS, EventWriter, parse_line
+    from .segments import SegmentedLog
+    from .manifest import load_manifest
+except ImportError:  # run as a script, or with la_paz itself on sys.path
+    from emit_event import EVENTS, SOCKET, FSYNC_POLICIES, KEEP_SEGMENTS, EventWriter, parse_line
+    from segments import SegmentedLog
+    from manifest import load_manifest
+
+PETAL_DIR = os.path.dirname(os.path.abspath(__file__))
+# Accepted besides the declared signals (free-form notes, see emit_event.py usage)
+EXTRA_KINDS = ("note",)
+
+def load_signals(petal_dir=PETAL_DIR):
+    """Kinds the petal declares: constants.json signals plus petal.yml outputs.signals"""
+    y, c, _ = load_manifest(petal_dir)
+    return set(EXTRA_KINDS) | set(c.get("signals", [])) | set((y.get("outputs") or {}).get("signals", []))
+
+class GroupCommit:
+    """Single writer shared by every connection.
+
+    Records accepted during one event-loop turn are buffered, then written
+    with one write (and fsync, per policy) at the end of the turn; only then
+    are their replies sent, in arrival order per connection.
+    """
+
+    def __init__(self, events):
+        self.events = events
+        self.replies = {}  # stream writer -> [reply bytes]
+        self.scheduled = False
+        self.loop = asyncio.get_running_loop()
+
+    def add(self, stream, rec, reply):
+        if rec is not None: self.events.write(rec)
+        self.replies.setdefault(stream, []).append(reply)
+        if not self.scheduled:
+            self.scheduled = True
+            self.loop.call_soon(self.commit)
+
+    def commit(self):
+        self.scheduled = False
+        try:
+            self.events.flush()
+        except OSError as e:
+            # Nothing from this turn is durable - tell the senders so
+            failed = error_reply(f"write failed: {e}")
+            self.events.pending = []
+            self.replies = {s: [failed if r is OK else r for r in rs] for s, rs in self.replies.items()}
+        replies, self.replies = self.replies, {}
+        for stream, rs in replies.items():
+            if not stream.is_closing(): stream.write(b"".join(rs))
+
+OK = json.dumps({"ok": True}).encode()+b"\n"
+
+def error_reply(error):
+    return json.dumps({"ok": False, "error": error}).encode()+b"\n"
+
+class EventDaemon:
+    def __init__(self, path=SOCKET, events_path=EVENTS, kinds=None, fsync="never", keep=KEEP_SEGMENTS):
+        self.path = path
+        self.events_path = events_path
+        self.kinds = kinds if kinds is not None else load_signals()
+        self.fsync = fsync
+        self.keep = keep
+        self.accepted = 0
+        self.rejected = 0
+
+    async def handle(self, reader, writer):
+        try:
+            while True:
+                line = await reader.readline()
+                if not line: break
+                try:
+                    rec = parse_line(line)
+                except (TypeError, ValueError) as e:
+                    self.rejected += 1
+                    self.commits.add(writer, None, error_reply(str(e)))
+                    continue
+                if rec["kind"] not in self.kinds:
+                    self.rejected += 1
+                    self.commits.add(writer, None, error_reply(f"unknown kind: {rec['kind']}"))
+                    continue
+                self.accepted += 1
+                self.commits.add(writer, rec, OK)
+                # Back-pressure for clients that stop reading their replies
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    def claim_socket(self):
+        # A socket file nobody answers on is left over from a crash
+        if os.path.exists(self.path):
+            probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                probe.connect(self.path)
+                raise RuntimeError(f"event daemon already running on {self.path}")
+            except (ConnectionRefusedError, FileNotFoundError):
+                os.unlink(self.path)
+            finally:
+                probe.close()
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+
+    async def serve(self, ready=None):
+        self.claim_socket()
+        SegmentedLog(self.events_path, keep=self.keep or None).recover()
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try: loop.add_signal_handler(sig, stop.set)
+            except (ValueError, RuntimeError): pass  # not the main thread
+        # Timer off: GroupCommit flushes at the end of every loop turn; rolled
+        # segments are gzip'd off the loop, on the writer's seal thread
+        with EventWriter(self.events_path, batch_size=1 << 30, flush_interval=0, fsync=self.fsync,
+                         keep=self.keep) as events:
+            self.commits = GroupCommit(events)
+            server = await asyncio.start_unix_server(self.handle, path=self.path)
+            os.chmod(self.path, 0o600)
+            print(f"◼ La Paz event daemon on {self.path} → {self.events_path}")
+            if ready: ready.set()
+            try:
+                await stop.wait()
+            finally:
+                server.close()
+                await server.wait_closed()
+                if os.path.exists(self.path): os.unlink(self.path)
+        print(f"✓ stopped: {self.accepted} accepted, {self.rejected} rejected")
+
+def main():
+    ap = argparse.ArgumentParser(description="La Paz petal event-ingest daemon")
+    ap.add_argument("--socket", default=SOCKET)
+    ap.add_argument("--events", default=EVENTS)
+    ap.add_argument("--fsync", choices=FSYNC_POLICIES, default="never")
+    ap.add_argument("--keep", type=int, default=KEEP_SEGMENTS,
+                    help=f"sealed segments to retain, 0 for all (default {KEEP_SEGMENTS}, env PETAL_LAPAZ_KEEP_SEGMENTS)")
+    args = ap.parse_args()
+    try:
+        asyncio.run(EventDaemon(args.socket, args.events, fsync=args.fsync, keep=args.keep).serve())
+    except RuntimeError as e:
+        print(f"⚠️  {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+import os, json, sys, hashlib
+
+SOURCES = ("petal.yml", "constants.json")
+SNAPSHOT = "__pycache__/manifest.snapshot.json"
+SNAPSHOT_VERSION = 1
+
+def sources_stat(petal_dir):
+    # [[mtime_ns, size]] of petal.yml and constants.json - the cheap cache key
+    stat = []
+    for n in SOURCES:
+        st = os.stat(f"{petal_dir}/{n}")
+        stat.append([st.st_mtime_ns, st.st_size])
+    return stat
+
+def sources_digest(blobs):
+    h = hashlib.sha256()
+    for b in blobs:
+        h.update(b)
+        h.update(b"\0")
+    return h.hexdigest()
+
+def read_snapshot(petal_dir):
+    try:
+        with open(f"{petal_dir}/{SNAPSHOT}") as f: snap = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return snap if isinstance(snap, dict) and snap.get("version") == SNAPSHOT_VERSION else None
+
+def write_snapshot(petal_dir, snap):
+    # Cache only what JSON gives back unchanged: YAML dates don't serialize,
+    # int keys would come back as strings
+    try:
+        text = json.dumps(snap, ensure_ascii=False)
+    except (TypeError, ValueError):
+        return
+    if json.loads(text) != snap: return
+    path = f"{petal_dir}/{SNAPSHOT}"
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp, "w") as f: f.write(text)
+        os.replace(tmp, path)
+    except OSError:
+        try: os.unlink(tmp)  # read-only petal dir (or full disk): just no cache
+        except OSError: pass
+
+def parse_yaml(text):
+    # libyaml's CSafeLoader when PyYAML was built with it; never installs anything
+    try:
+        import yaml
+    except ImportError:
+        raise ImportError("PyYAML is required to read petal.yml (pip install pyyaml)") from None
+    try:
+        return yaml.load(text, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+    except yaml.YAMLError as e:
+        raise ValueError(f"petal.yml: {e}") from None
+
+def digest(petal_dir):
+    """Content hash of petal.yml + constants.json; free while the snapshot is current"""
+    snap = read_snapshot(petal_dir)
+    if snap and snap["stat"] == sources_stat(petal_dir): return snap["digest"]
+    blobs = []
+    for n in SOURCES:
+        with open(f"{petal_dir}/{n}", "rb") as f: blobs.append(f.read())
+    return sources_digest(blobs)
+
+def load_manifest(petal_dir):
+    """(petal.yml, constants.json, digest) for a petal directory.
+
+    Served from <petal>/__pycache__/manifest.snapshot.json when the sources'
+    mtimes and sizes match it; when only their mtimes moved (touch, checkout)
+    but the content hash still matches, the snapshot is re-stamped instead of
+    re-parsed. YAML is imported and parsed only on a real change.
+    """
+    stat = sources_stat(petal_dir)
+    snap = read_snapshot(petal_dir)
+    if snap and snap["stat"] == stat:
+        return snap["petal"], snap["constants"], snap["digest"]
+    blobs = []
+    for n in SOURCES:
+        with open(f"{petal_dir}/{n}", "rb") as f: blobs.append(f.read())
+    d = sources_digest(blobs)
+    if snap and snap["digest"] == d:
+        snap["stat"] = stat
+    else:
+        try:
+            c = json.loads(blobs[1])
+        except ValueError as e:
+            raise ValueError(f"constants.json: {e}") from None
+        snap = {"version": SNAPSHOT_VERSION, "digest": d, "petal": parse_yaml(blobs[0]), "constants": c}
+        snap["stat"] = stat
+    write_snapshot(petal_dir, snap)
+    return snap["petal"], snap["constants"], snap["digest"]
+
+if __name__ == "__main__":
+    # Usage: manifest.py [petal_dir]  - print the parsed manifest (and warm its snapshot)
+    y, c, d = load_manifest(sys.argv[1] if len(sys.argv) > 1 else os.path.dirname(os.path.abspath(__file__)))
+    print(json.dumps({"petal": y, "constants": c, "digest": d}, indent=2, ensure_ascii=False, default=str))
@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+import os, json, sys, glob, gzip, array, sqlite3, argparse, datetime as dt
+
+try:
+    from .emit_event import EVENTS
+    from .segments import SegmentedLog, MemberReader, gzip_members, ts_key
+except ImportError:  # run as a script, or with la_paz itself on sys.path
+    from emit_event import EVENTS
+    from segments import SegmentedLog, MemberReader, gzip_members, ts_key
+
+SCHEMA_VERSION = 2  # PRAGMA user_version; an index from another version is rebuilt
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (id INTEGER PRIMARY KEY AUTOINCREMENT, ts TEXT, day TEXT, kind TEXT, value TEXT, source TEXT, offset INTEGER);
+CREATE INDEX IF NOT EXISTS events_kind_value_ts ON events (kind, value, ts);
+CREATE INDEX IF NOT EXISTS events_kind_ts ON events (kind, ts);
+CREATE INDEX IF NOT EXISTS events_ts ON events (ts);
+CREATE INDEX IF NOT EXISTS events_source ON events (source);
+CREATE TABLE IF NOT EXISTS sources (source TEXT PRIMARY KEY, ino INTEGER, offset INTEGER);
+CREATE TABLE IF NOT EXISTS members (source TEXT PRIMARY KEY, starts BLOB);
+"""
+ACTIVE = "@active"
+FETCH = 1000  # rows resolved against the log per round
+
+class StaleIndex(Exception):
+    """An indexed (source, offset) no longer holds its record: the log rolled or was pruned"""
+
+class EventIndex:
+    """SQLite sidecar index (by ts, kind and data.value) over a segmented petal log.
+
+    Rows hold the indexed columns plus where the record lives, (source,
+    byte offset in the uncompressed file), so the sidecar stays small and
+    records are read back from the log itself. sync() only reads what is
+    new: sealed and freshly rolled segments are indexed once each (keyed by
+    name without .gz, so a segment is not read again when it is
+    compressed), and the active file from the byte offset reached last
+    time. When the active file has been rolled its rows are dropped and
+    come back from the segment it became. Queries go through the indexes;
+    a record in a sealed segment is read by inflating from the start of
+    its gzip member (see MemberReader), at most SEAL_MEMBER bytes, so a
+    query costs in proportion to what it returns. The member starts of
+    each segment are found on its first read and kept in the sidecar.
+    Segments sealed as a single member are still inflated from the start.
+    """
+
+    def __init__(self, path=EVENTS, index_path=None):
+        self.log = SegmentedLog(path)
+        self.index_path = index_path or f"{self.log.stem}.index.sqlite"
+        self.db = sqlite3.connect(self.index_path, isolation_level=None)
+        if self.db.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION: self.rebuild()
+        self.db.executescript(SCHEMA)
+
+    def rebuild(self):
+        # Older layout: start over (the next sync re-reads the log), but keep
+        # ids growing so changed_days() watermarks held by callers stay valid
+        tables = {t for (t,) in self.db.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        last = self.db.execute("SELECT COALESCE(MAX(rowid), 0) FROM events").fetchone()[0] if "events" in tables else 0
+        if "sqlite_sequence" in tables:
+            last = max([last, *(seq for (seq,) in self.db.execute("SELECT seq FROM sqlite_sequence WHERE name = 'events'"))])
+        self.db.executescript("DROP TABLE IF EXISTS events; DROP TABLE IF EXISTS sources; DROP TABLE IF EXISTS members;"+SCHEMA)
+        if last: self.db.execute("INSERT INTO sqlite_sequence (name, seq) VALUES ('events', ?)", (last,))
+        self.db.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self.db.execute("VACUUM")
+
+    def close(self): self.db.close()
+    def __enter__(self): return self
+    def __exit__(self, *exc): self.close()
+
+    def segment_sources(self):
+        # {source: path}; a raw .jsonl only exists between a roll and its seal
+        base = os.path.dirname(self.log.path)
+        found = {s["file"][:-3]: os.path.join(base, s["file"]) for s in self.log.manifest()["segments"]}
+        for seg in glob.glob(glob.escape(self.log.stem)+".*.jsonl"):
+            if seg != self.log.path: found.setdefault(os.path.basename(seg), seg)
+        return found
+
+    def sync(self):
+        """Index whatever was appended or rolled since the last sync; rows added"""
+        added = 0
+        self.db.execute("BEGIN IMMEDIATE")
+        try:
+            known = {s: (ino, off) for s, ino, off in self.db.execute("SELECT source, ino, offset FROM sources")}
+            found = self.segment_sources()
+            for source in set(known)-set(found)-{ACTIVE}:
+                self.forget(source)  # pruned by retention
+            for source, path in sorted(found.items()):
+                if source in known: continue
+                try:
+                    with (gzip.open if path.endswith(".gz") else open)(path, "rb") as f:
+                        added += self.insert(source, f)
+                except FileNotFoundError:
+                    continue  # sealed under us; picked up as .gz next time
+                self.db.execute("INSERT INTO sources VALUES (?, 0, 0)", (source,))
+            # A new segment means a roll, even when the new active file reuses the old inode
+            rolled = bool(set(found)-set(known))
+            added += self.sync_active(known.get(ACTIVE), rolled)
+            self.db.execute("COMMIT")
+        except BaseException:
+            self.db.execute("ROLLBACK")
+            raise
+        return added
+
+    def sync_active(self, known, rolled=False):
+        ino, offset = known or (None, 0)
+        try:
+            with open(self.log.path, "rb") as f:
+                st = os.fstat(f.fileno())
+                if rolled or st.st_ino != ino or st.st_size < offset:
+                    self.forget(ACTIVE)  # rolled (or replaced): now lives in a segment
+                    ino, offset = st.st_ino, 0
+                f.seek(offset)
+                added = self.insert(ACTIVE, f, partial=True)
+                offset = f.tell()
+        except FileNotFoundError:
+            self.forget(ACTIVE)
+            ino, offset, added = None, 0, 0
+        self.db.execute("INSERT OR REPLACE INTO sources VALUES (?, ?, ?)", (ACTIVE, ino, offset))
+        return added
+
+    def insert(self, source, f, partial=False):
+        rows, offset = [], f.tell()
+        for line in f:
+            if partial and not line.endswith(b"\n"):
+                f.seek(-len(line), os.SEEK_CUR)  # half-written; finish next sync
+                break
+            at, offset = offset, offset+len(line)
+            try:
+                rec = json.loads(line)
+            except ValueError:
+                continue
+            if not isinstance(rec, dict) or not rec.get("ts"): continue
+            ts = ts_key(rec["ts"])
+            value = (rec.get("data") or {}).get("value") if isinstance(rec.get("data"), dict) else None
+            rows.append((ts, ts[:10], rec.get("kind"), None if value is None else str(value), source, at))
+        self.db.executemany("INSERT INTO events (ts, day, kind, value, source, offset) VALUES (?, ?, ?, ?, ?, ?)", rows)
+        return len(rows)
+
+    def forget(self, source):
+        self.db.execute("DELETE FROM events WHERE source = ?", (source,))
+        self.db.execute("DELETE FROM sources WHERE source = ?", (source,))
+        self.db.execute("DELETE FROM members WHERE source = ?", (source,))
+
+    def where(self, kind=None, value=None, since=None, until=None):
+        clauses, args = [], []
+        for clause, arg in (("kind = ?", kind), ("value = ?", value),
+                            ("ts >= ?", since and ts_key(since)), ("ts <= ?", until and ts_key(until))):
+            if arg is not None:
+                clauses.append(clause); args.append(arg)
+        return (" WHERE "+" AND ".join(clauses) if clauses else ""), args
+
+    def select(self, kind=None, value=None, since=None, until=None, limit=None, newest=False):
+        """Matching records, oldest first (newest first with newest=True)"""
+        done, retries = 0, 3
+        while True:
+            try:
+                for n, rec in enumerate(self.resolve(kind, value, since, until, limit, newest)):
+                    if n >= done:
+                        done += 1
+                        yield rec
+                return
+            except StaleIndex:
+                retries -= 1
+                if not retries: raise
+                self.sync()  # rolled or pruned mid-query: re-point the rows, skip what was returned
+
+    def resolve(self, kind, value, since, until, limit, newest):
+        # Rows in query order, their records read back from the log a batch at a time
+        where, args = self.where(kind, value, since, until)
+        order = "DESC" if newest else "ASC"
+        sql = f"SELECT source, offset, ts FROM events{where} ORDER BY ts {order}, id {order}"
+        if limit is not None:
+            sql += " LIMIT ?"; args.append(limit)
+        cur = self.db.execute(sql, args)
+        files = {}
+        try:
+            while True:
+                rows = cur.fetchmany(FETCH)
+                if not rows: return
+                lines = {}
+                for source, offset, _ in sorted(rows):  # forward through each file
+                    f = files.get(source) or files.setdefault(source, self.open_source(source))
+                    f.seek(offset)
+                    lines[source, offset] = f.readline()
+                for source, offset, ts in rows:
+                    try:
+                        rec = json.loads(lines[source, offset])
+                    except ValueError:
+                        raise StaleIndex(source) from None
+                    if not isinstance(rec, dict) or ts_key(str(rec.get("ts", ""))) != ts: raise StaleIndex(source)
+                    yield rec
+        finally:
+            cur.close()
+            for f in files.values(): f.close()
+
+    def open_source(self, source):
+        if source == ACTIVE:
+            try:
+                return open(self.log.path, "rb")
+            except FileNotFoundError:
+                raise StaleIndex(source) from None
+        path = os.path.join(os.path.dirname(self.log.path), source)
+        try:
+            members = self.members(source, path+".gz")
+            return MemberReader(open(path+".gz", "rb"), members)
+        except FileNotFoundError:
+            pass
+        try:
+            return open(path, "rb")  # rolled but not yet sealed
+        except FileNotFoundError:
+            raise StaleIndex(source) from None
+
+    def members(self, source, path):
+        # [(uncompressed, compressed offset)] of each gzip member, found once per segment
+        row = self.db.execute("SELECT starts FROM members WHERE source = ?", (source,)).fetchone()
+        starts = array.array("q")
+        if row:
+            starts.frombytes(row[0])
+        else:
+            starts.extend(n for member in gzip_members(path) for n in member)
+            self.db.execute("INSERT OR REPLACE INTO members VALUES (?, ?)", (source, starts.tobytes()))
+        return list(zip(starts[::2], starts[1::2]))
+
+    def count(self, kind=None, value=None, since=None, until=None):
+        where, args = self.where(kind, value, since, until)
+        return self.db.execute(f"SELECT COUNT(*) FROM events{where}", args).fetchone()[0]
+
+    def last(self, kind=None, value=None, since=None, until=None):
+        return next(self.select(kind, value, since, until, limit=1, newest=True), None)
+
+    def changed_days(self, after=0):
+        """(last row id, UTC days touched by rows indexed after row id `after`);
+        ids only grow, so re-indexed rows (after a roll) show up here too"""
+        last = self.db.execute("SELECT COALESCE(MAX(id), 0) FROM events").fetchone()[0]
+        days = [d for (d,) in self.db.execute("SELECT DISTINCT day FROM events WHERE id > ? ORDER BY day", (after,))]
+        return max(last, after), days
+
+    def days(self, kind=None, value=None, since=None, until=None):
+        """[(UTC day, matching events)] for days with at least one match"""
+        where, args = self.where(kind, value, since, until)
+        return self.db.execute(f"SELECT day, COUNT(*) FROM events{where} GROUP BY day ORDER BY day", args).fetchall()
+
+def main():
+    ap = argparse.ArgumentParser(description="Query the La Paz petal event log through its sidecar index")
+    ap.add_argument("--log", default=EVENTS, help="active events JSONL (segments are found from it)")
+    ap.add_argument("--index", default=None, help="index path (default: <log stem>.index.sqlite)")
+    ap.add_argument("--kind")
+    ap.add_argument("--value", help="match data.value, e.g. present / off")
+    ap.add_argument("--since", help="ISO date or timestamp (UTC)")
+    ap.add_argument("--until", help="ISO date or timestamp (UTC)")
+    ap.add_argument("--last-days", type=int, help="shorthand for --since N days ago")
+    mode = ap.add_mutually_exclusive_group()
+    mode.add_argument("--count", action="store_true", help="number of matching events")
+    mode.add_argument("--last", action="store_true", help="most recent matching event")
+    mode.add_argument("--days", action="store_true", help="per-day counts and the number of days")
+    ap.add_argument("--limit", type=int, default=50, help="events listed (default mode)")
+    args = ap.parse_args()
+
+    since = args.since
+    if args.last_days is not None:
+        since = (dt.datetime.utcnow()-dt.timedelta(days=args.last_days)).isoformat()
+    until = args.until
+    if until and len(until) == 10: until += "T23:59:59.999999"  # a bare date covers the whole day
+    q = {"kind": args.kind, "value": args.value, "since": since, "until": until}
+
+    with EventIndex(args.log, args.index) as idx:
+        idx.sync()
+        if args.count:
+            print(idx.count(**q))
+        elif args.last:
+            rec = idx.last(**q)
+            if rec is None:
+                print("◦ no matching event")
+                sys.exit(1)
+            print(json.dumps(rec))
+        elif args.days:
+            rows = idx.days(**q)
+            for day, n in rows: print(f"{day}  {n}")
+            print(f"➤ {len(rows)} days")
+        else:
+            for rec in idx.select(**q, limit=args.limit): print(json.dumps(rec))
+
+if __name__ == "__main__":
+    main()
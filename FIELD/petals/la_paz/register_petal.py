@@ -1,30 +1,56 @@
 #!/usr/bin/env python3
-import os, json, yaml, time, datetime as dt, pathlib, sys
+import os, json, time, datetime as dt, pathlib, sys, glob, argparse
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    from .segments import SegmentedLog
+    from .manifest import load_manifest, digest
+    from .registry_store import RegistryStore, key_of
+except ImportError:  # run as a script, or with la_paz itself on sys.path
+    from segments import SegmentedLog
+    from manifest import load_manifest, digest
+    from registry_store import RegistryStore, key_of
 
 BASE = "/Users/jbear/FIELD-DEV"
 PETAL_DIR = f"{BASE}/field/petals/la_paz"
+PETALS_DIR = f"{BASE}/field/petals"
 REGISTRY_DIR = f"{BASE}/field/registry"
 AUDIT = f"{BASE}/logs/petal_lapaz.audit.jsonl"
+REGISTRY_AUDIT = f"{BASE}/logs/registry.audit.jsonl"
+# Input hash per petal dir, so a batch rewrites only entries whose sources changed
+STATE = ".register_state.json"
+INLINE_BELOW = 8  # smaller batches aren't worth a process pool
 
 def jwrite(path, obj):
     os.makedirs(os.path.dirname(path), exist_ok=True)
     with open(path, "w") as f: json.dump(obj, f, indent=2)
 
 def jappend(path, obj):
-    os.makedirs(os.path.dirname(path), exist_ok=True)
+    # Segmented: rolls into gzip'd segments by size/day (see segments.py)
     obj["ts"] = dt.datetime.utcnow().isoformat()+"Z"
-    with open(path, "a") as f: f.write(json.dumps(obj)+"\n")
+    log = SegmentedLog(path)
+    os.close(log.append(None, (json.dumps(obj)+"\n").encode(), obj["ts"]))
 
-def load_yaml(p):
-    with open(p, "r") as f:
-        return yaml.safe_load(f)
+def validate(y, c):
+    problems = [f"petal.yml: missing {k}" for k in
+                ("id", "name", "version", "symbol", "summary", "coords", "archetype") if k not in y]
+    if not (y.get("outputs") or {}).get("registry_key"): problems.append("petal.yml: missing outputs.registry_key")
+    if not all(k in (y.get("logs") or {}) for k in ("audit", "events")): problems.append("petal.yml: missing logs.audit/events")
+    problems += [f"constants.json: missing {k}" for k in ("band_celsius", "altitude_m", "pattern", "signals") if k not in c]
+    band = c.get("band_celsius")
+    if band is not None and not (isinstance(band, list) and len(band) == 2 and band[0] < band[1]):
+        problems.append("constants.json: band_celsius must be [low, high]")
+    if not isinstance(c.get("signals", []), list): problems.append("constants.json: signals must be a list")
+    if problems: raise ValueError("; ".join(problems))
 
-def main():
-    y = load_yaml(f"{PETAL_DIR}/petal.yml")
-    c = json.load(open(f"{PETAL_DIR}/constants.json"))
+def build(petal_dir, registry_dir=REGISTRY_DIR):
+    """Registry path and payload for one petal directory (ValueError/TypeError if invalid)"""
+    y, c, _ = load_manifest(petal_dir)
+    if not isinstance(y, dict) or not isinstance(c, dict): raise TypeError("petal.yml/constants.json must be mappings")
+    validate(y, c)
     reg_key = y["outputs"]["registry_key"]
 
-    registry_path = f"{REGISTRY_DIR}/{reg_key}.json"
+    registry_path = f"{registry_dir}/{reg_key}.json"
     payload = {
         "id": y["id"],
         "name": y["name"],
@@ -43,15 +69,109 @@ def main():
             "registry_file": registry_path
         }
     }
-    jwrite(registry_path, payload)
-    jappend(AUDIT, {"kind":"register", "registry": registry_path, "id": y["id"]})
-    print(f"✅ Registered {y['name']} → {registry_path}")
+    return registry_path, payload
 
-if __name__ == "__main__":
-    # lazy import yaml if needed
+def build_checked(args):
+    # Worker entry point: (petal_dir, registry_path, payload, error)
+    petal_dir, registry_dir = args
     try:
-        import yaml  # noqa
-    except Exception:
-        print("Installing pyyaml locally...")
-        os.system(f"{sys.executable} -m pip install --user pyyaml >/dev/null 2>&1")
-    main()
+        return (petal_dir, *build(petal_dir, registry_dir), None)
+    except (OSError, ValueError, TypeError, ImportError) as e:
+        return petal_dir, None, None, str(e)
+
+def main():
+    registry_path, payload = build(PETAL_DIR)
+    with RegistryStore(REGISTRY_DIR) as store: store.put(payload)
+    jappend(AUDIT, {"kind":"register", "registry": registry_path, "id": payload["id"]})
+    print(f"✅ Registered {payload['name']} → {registry_path}")
+
+def jobs_arg(text):
+    n = int(text)
+    if n < 1: raise argparse.ArgumentTypeError(f"must be at least 1, got {n}")
+    return n
+
+def register_all(petals_dir=PETALS_DIR, registry_dir=REGISTRY_DIR, jobs=None, force=False):
+    """Register every <petals_dir>/*/petal.yml; returns the batch audit record"""
+    started = time.monotonic()
+    state_path = f"{registry_dir}/{STATE}"
+    try:
+        with open(state_path) as f: state = json.load(f)
+    except (FileNotFoundError, ValueError):
+        state = {}
+    dirs = sorted(os.path.dirname(p) for p in glob.glob(f"{glob.escape(petals_dir)}/*/petal.yml"))
+    hashes, invalid = {}, {}
+    for d in dirs:
+        try:
+            hashes[d] = digest(d)
+        except OSError as e:
+            invalid[d] = str(e)
+    # Unchanged = same input hash and the registry file still there
+    todo = [d for d in hashes if force or state.get(d, {}).get("hash") != hashes[d]
+            or not os.path.exists(state[d]["registry"])]
+    work = [(d, registry_dir) for d in todo]
+    if len(work) < INLINE_BELOW or jobs == 1:
+        results = list(map(build_checked, work))
+    else:
+        with ProcessPoolExecutor(jobs) as pool:
+            results = list(pool.map(build_checked, work, chunksize=max(1, len(work)//(4*(jobs or os.cpu_count() or 1)))))
+    # Registry keys and ids must stay unique across all petals, changed or not
+    unchanged = [d for d in hashes if d not in todo and d in state]
+    owners = {state[d]["registry"]: d for d in unchanged}
+    id_owners = {state[d].get("id"): d for d in unchanged}
+    store = RegistryStore(registry_dir)
+    stored = store.keys()  # {id: registry_key}
+    registered, payloads, moved = [], [], []
+    for d, registry_path, payload, error in results:
+        old = state.get(d, {}).get("registry")
+        if error is None:
+            held = stored.get(payload["id"])
+            if owners.get(registry_path, d) != d:
+                error = f"registry key already used by {owners[registry_path]}"
+            elif id_owners.get(payload["id"], d) != d:
+                error = f"id {payload['id']} already used by {id_owners[payload['id']]}"
+            elif held is not None and held not in (key_of(registry_path), old and key_of(old)):
+                error = f"id {payload['id']} already registered as {held}"
+        if error is not None:
+            invalid[d] = error
+            state.pop(d, None)
+            continue
+        owners[registry_path] = id_owners[payload["id"]] = d
+        payloads.append(payload)
+        if old and old != registry_path: moved.append(old)  # registry_key changed
+        state[d] = {"hash": hashes[d], "registry": registry_path, "id": payload["id"]}
+        registered.append(payload["id"])
+    stale = [path for path in moved if path not in owners]
+    # One transaction for the whole batch (plus the per-petal JSON exports)
+    with store: store.put_many(payloads, retire=[key_of(path) for path in stale])
+    for path in stale:
+        if os.path.exists(path): os.unlink(path)
+    for d in set(state)-set(hashes): state.pop(d)  # petal removed
+    tmp = state_path+".tmp"
+    jwrite(tmp, state)
+    os.replace(tmp, state_path)
+    batch = {"kind": "register_batch", "petals": len(dirs), "registered": registered,
+             "unchanged": len(hashes)-len(todo), "invalid": invalid,
+             "elapsed_s": round(time.monotonic()-started, 3)}
+    jappend(REGISTRY_AUDIT, batch)
+    return batch
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="Register the La Paz petal, or every petal with --all")
+    ap.add_argument("--all", action="store_true", help="batch: every <petals>/*/petal.yml")
+    ap.add_argument("--petals", default=PETALS_DIR)
+    ap.add_argument("--registry", default=REGISTRY_DIR)
+    ap.add_argument("--jobs", type=jobs_arg, default=None, help="validation processes (default: CPUs)")
+    ap.add_argument("--force", action="store_true", help="rewrite entries even if unchanged")
+    args = ap.parse_args()
+    if not args.all:
+        try:
+            main()
+        except (ValueError, TypeError, ImportError) as e:
+            print(f"⚠️  {e}")
+            sys.exit(1)
+        sys.exit(0)
+    batch = register_all(args.petals, args.registry, args.jobs, args.force)
+    print(f"✅ Registered {len(batch['registered'])}/{batch['petals']} petals "
+          f"({batch['unchanged']} unchanged) in {batch['elapsed_s']}s → {args.registry}")
+    for d, error in sorted(batch["invalid"].items()): print(f"⚠️  {d}: {error}")
+    sys.exit(1 if batch["invalid"] else 0)
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+import os, json, sys, glob, sqlite3, argparse, datetime as dt
+
+BASE = "/Users/jbear/FIELD-DEV"
+REGISTRY_DIR = f"{BASE}/field/registry"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS petals (id TEXT PRIMARY KEY, registry_key TEXT UNIQUE, facets TEXT, payload TEXT, updated TEXT);
+"""
+
+class Registry:
+    """In-memory view of every registered petal, indexed for O(1) lookups.
+
+    Built from each row's small facets (symbol, signals, archetype names,
+    coords); a full payload is only decoded the first time it is returned.
+    List or mapping coord values are indexed as canonical JSON (see
+    coord_value), and coords that aren't a mapping are left out of by_coord.
+    """
+
+    def __init__(self, rows):
+        self.raw, self.decoded, self.by_key = {}, {}, {}
+        self.by_symbol, self.by_signal, self.by_archetype, self.by_coord = {}, {}, {}, {}
+        for petal_id, key, facets, payload in rows:
+            symbol, signals, archetypes, coords = json.loads(facets)
+            self.raw[petal_id] = payload
+            self.by_key[key] = petal_id
+            self.by_symbol.setdefault(symbol, []).append(petal_id)
+            for s in signals: self.by_signal.setdefault(s, []).append(petal_id)
+            for a in archetypes: self.by_archetype.setdefault(a, []).append(petal_id)
+            if not isinstance(coords, dict):
+                print(f"⚠️  {petal_id}: coords is not a mapping; not indexed", file=sys.stderr)
+                coords = {}
+            for axis, value in coords.items(): self.by_coord.setdefault((axis, coord_value(value)), []).append(petal_id)
+
+    def __len__(self): return len(self.raw)
+    def __iter__(self): return (self.get(i) for i in self.raw)
+
+    def get(self, petal_id):
+        p = self.decoded.get(petal_id)
+        if p is None and petal_id in self.raw:
+            p = self.decoded[petal_id] = json.loads(self.raw[petal_id])
+        return p
+
+    def all(self, ids): return [self.get(i) for i in ids]
+    def key(self, registry_key): return self.get(self.by_key.get(registry_key))
+    def with_symbol(self, symbol): return self.all(self.by_symbol.get(symbol, ()))
+    def emitting(self, signal): return self.all(self.by_signal.get(signal, ()))
+    def with_archetype(self, name): return self.all(self.by_archetype.get(name, ()))
+    def at(self, axis, value): return self.all(self.by_coord.get((axis, coord_value(value)), ()))
+
+def coord_value(value):
+    # Hashable lookup key: lists and mappings (e.g. lat_lon: [-16.5, -68.1]) as canonical JSON
+    if isinstance(value, (list, dict)): return json.dumps(value, sort_keys=True, ensure_ascii=False)
+    return value
+
+def facets(payload):
+    return json.dumps([payload.get("symbol"), payload.get("signals") or [],
+                       list(payload.get("archetype") or {}), payload.get("coords") or {}], ensure_ascii=False)
+
+def key_of(registry_file):
+    # FIELD.PETAL.LAPAZ from .../FIELD.PETAL.LAPAZ.json
+    return os.path.basename(registry_file)[:-len(".json")]
+
+def registry_key(payload):
+    return key_of(payload["paths"]["registry_file"])
+
+class RegistryStore:
+    """All registry entries in one SQLite file (<registry>/registry.sqlite).
+
+    put_many() replaces entries in a single transaction, so readers see a
+    whole batch or none of it, and still exports each entry to its
+    per-petal <registry_key>.json for existing consumers.
+    """
+
+    def __init__(self, registry_dir=REGISTRY_DIR, export=True):
+        os.makedirs(registry_dir, exist_ok=True)
+        self.registry_dir = registry_dir
+        self.export = export
+        self.db = sqlite3.connect(f"{registry_dir}/registry.sqlite", isolation_level=None)
+        self.db.executescript(SCHEMA)
+
+    def close(self): self.db.close()
+    def __enter__(self): return self
+    def __exit__(self, *exc): self.close()
+
+    def put_many(self, payloads, retire=()):
+        """Replace entries by registry_key, dropping the `retire` keys (a petal's old key) in the same transaction"""
+        now = dt.datetime.utcnow().isoformat()+"Z"
+        rows = [(p["id"], registry_key(p), facets(p), json.dumps(p, ensure_ascii=False), now) for p in payloads]
+        # Never delete by id: a repeated id is an error, not a replacement
+        for i, what in ((0, "id"), (1, "registry_key")):
+            seen = set()
+            for r in rows:
+                if r[i] in seen: raise ValueError(f"{what} {r[i]!r} appears twice in one batch")
+                seen.add(r[i])
+        self.db.execute("BEGIN IMMEDIATE")
+        try:
+            self.db.executemany("DELETE FROM petals WHERE registry_key = ?", [(k,) for k in (*retire, *(r[1] for r in rows))])
+            self.db.executemany("INSERT INTO petals VALUES (?, ?, ?, ?, ?)", rows)
+            self.db.execute("COMMIT")
+        except sqlite3.IntegrityError as e:
+            self.db.execute("ROLLBACK")
+            raise ValueError(f"registry: {e} (id already registered under another key)") from None
+        except BaseException:
+            self.db.execute("ROLLBACK")
+            raise
+        if self.export:
+            for p in payloads: self.export_json(p)
+
+    def put(self, payload): self.put_many([payload])
+
+    def export_json(self, payload):
+        path = payload["paths"]["registry_file"]
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = path+".tmp"
+        with open(tmp, "w") as f: json.dump(payload, f, indent=2)
+        os.replace(tmp, path)
+
+    def keys(self):
+        """{id: registry_key} of every stored entry"""
+        return dict(self.db.execute("SELECT id, registry_key FROM petals"))
+
+    def delete(self, petal_id):
+        self.db.execute("DELETE FROM petals WHERE id = ?", (petal_id,))
+
+    def load(self):
+        return Registry(self.db.execute("SELECT id, registry_key, facets, payload FROM petals"))
+
+    def import_json(self):
+        """Load existing per-petal JSON files into the store (no re-export)"""
+        payloads = []
+        for path in sorted(glob.glob(f"{glob.escape(self.registry_dir)}/*.json")):
+            with open(path) as f: p = json.load(f)
+            if isinstance(p, dict) and "id" in p and "paths" in p: payloads.append(p)
+        export, self.export = self.export, False
+        try:
+            self.put_many(payloads)
+        finally:
+            self.export = export
+        return len(payloads)
+
+def main():
+    ap = argparse.ArgumentParser(description="Look up petals in the consolidated registry")
+    ap.add_argument("--registry", default=REGISTRY_DIR)
+    ap.add_argument("--import-json", action="store_true", help="load existing <key>.json files first")
+    q = ap.add_mutually_exclusive_group()
+    q.add_argument("--id")
+    q.add_argument("--symbol")
+    q.add_argument("--signal")
+    q.add_argument("--archetype")
+    q.add_argument("--coord", help="axis=value, e.g. lat=▼TATA (JSON for list values)")
+    args = ap.parse_args()
+    with RegistryStore(args.registry) as store:
+        if args.import_json: print(f"➤ imported {store.import_json()} entries")
+        reg = store.load()
+    if args.id: found = [p for p in [reg.get(args.id)] if p]
+    elif args.symbol: found = reg.with_symbol(args.symbol)
+    elif args.signal: found = reg.emitting(args.signal)
+    elif args.archetype: found = reg.with_archetype(args.archetype)
+    elif args.coord:
+        axis, _, value = args.coord.partition("=")
+        if value.startswith(("[", "{")):
+            try:
+                value = json.loads(value)  # lat_lon=[-16.5, -68.1]
+            except ValueError:
+                pass
+        found = reg.at(axis, value)
+    else: found = list(reg)
+    for p in found: print(f"{p['symbol']} {p['id']}  {registry_key(p)}  signals: {', '.join(p.get('signals') or [])}")
+    print(f"➤ {len(found)} of {len(reg)} petals")
+    sys.exit(0 if found else 1)
+
+if __name__ == "__main__":
+    main()
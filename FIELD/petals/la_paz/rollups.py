@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+import os, sys, json, math, array, argparse, datetime as dt
+
+try:
+    from .emit_event import EVENTS
+    from .query_events import EventIndex
+except ImportError:  # run as a script, or with la_paz itself on sys.path
+    from emit_event import EVENTS
+    from query_events import EventIndex
+
+try:
+    import numpy as np
+except ImportError:  # stdlib arrays; same files, same answers
+    np = None
+
+PETAL_DIR = os.path.dirname(os.path.abspath(__file__))
+# name: (array typecode, numpy dtype) - raw native-endian, np.fromfile-compatible
+COLUMNS = {
+    "carrier_on":  ("q", "i8"),  # carrier_lock "on" events
+    "carrier_off": ("q", "i8"),  # carrier_lock "off" events
+    "carrier":     ("b", "i1"),  # last carrier_lock state: 1 on, 0 off, -1 none
+    "pulse":       ("b", "i1"),  # last daily_pulse: 1 present, 0 absent, -1 none
+    "liminal":     ("q", "i8"),  # threshold_liminality events
+    "temp_min":    ("f", "f4"),  # numeric threshold_liminality readings (°C), NaN if none
+    "temp_max":    ("f", "f4"),
+    "band":        ("b", "i1"),  # 1 every reading inside the band, 0 one outside, -1 no readings
+}
+EMPTY = {"carrier_on": 0, "carrier_off": 0, "carrier": -1, "pulse": -1, "liminal": 0,
+         "temp_min": math.nan, "temp_max": math.nan, "band": -1}
+STATES = {"carrier_lock": {"on": 1, "off": 0}, "daily_pulse": {"present": 1, "absent": 0}}
+RESOLUTIONS = {"day": 1, "hour": 24}  # rows per day
+META_VERSION = 2  # bump whenever COLUMNS changes; older rollups are rebuilt
+
+def load_band(petal_dir=PETAL_DIR):
+    with open(f"{petal_dir}/constants.json") as f:
+        return tuple(json.load(f)["band_celsius"])
+
+def day_number(day):
+    return dt.date.fromisoformat(day[:10]).toordinal()
+
+def fold(rows, rec, band):
+    # Apply one event to its bucket's row
+    kind, value = rec.get("kind"), (rec.get("data") or {}).get("value")
+    if kind == "carrier_lock" and value in STATES[kind]:
+        rows["carrier_on" if value == "on" else "carrier_off"] += 1
+        rows["carrier"] = STATES[kind][value]
+    elif kind == "daily_pulse" and value in STATES[kind]:
+        rows["pulse"] = STATES[kind][value]
+    elif kind == "threshold_liminality":
+        rows["liminal"] += 1
+        try:
+            c = float(value)
+        except (TypeError, ValueError):
+            return
+        if math.isnan(c): return
+        rows["temp_min"] = c if math.isnan(rows["temp_min"]) else min(rows["temp_min"], c)
+        rows["temp_max"] = c if math.isnan(rows["temp_max"]) else max(rows["temp_max"], c)
+        rows["band"] = int(rows["band"] != 0 and band[0] <= c <= band[1])
+
+class Rollups:
+    """Per-day and per-hour columns of the La Paz signals, kept next to the log.
+
+    <stem>.rollups/ holds one dense file per resolution and column (row i
+    is day origin+i, or hour i of that range), plus meta.json. update()
+    asks the event index which days gained rows since the last update and
+    recomputes just those, rewriting their rows in place, so it stays
+    incremental and idempotent (a crash before meta.json is written only
+    repeats work). A meta.json from another META_VERSION (or column
+    layout) is discarded and the rollups rebuilt from the index. Columns load with numpy when it is installed, otherwise
+    as array.array; the queries give the same answers either way.
+    """
+
+    def __init__(self, path=EVENTS, root=None, band=None, index=None):
+        self.index = index or EventIndex(path)
+        self.root = root or f"{self.index.log.stem}.rollups"
+        os.makedirs(self.root, exist_ok=True)
+        self.meta_path = f"{self.root}/meta.json"
+        try:
+            with open(self.meta_path) as f: self.meta = json.load(f)
+        except FileNotFoundError:
+            self.meta = None
+        if not self.current(self.meta):
+            self.reset(band or (self.meta or {}).get("band_celsius") or load_band())
+        self.band = tuple(self.meta["band_celsius"])
+
+    def current(self, meta):
+        return (meta is not None and meta.get("version") == META_VERSION and meta.get("byteorder") == sys.byteorder
+                and meta.get("columns") == {name: dtype for name, (_, dtype) in COLUMNS.items()})
+
+    def reset(self, band):
+        # Missing or stale layout: drop the columns; watermark 0 refolds every day
+        for resolution in RESOLUTIONS:
+            for name in COLUMNS:
+                try:
+                    os.remove(self.file(resolution, name))
+                except FileNotFoundError:
+                    pass
+        self.meta = {"version": META_VERSION, "origin": None, "days": 0, "watermark": 0, "byteorder": sys.byteorder,
+                     "band_celsius": list(band), "columns": {name: dtype for name, (_, dtype) in COLUMNS.items()}}
+
+    def file(self, resolution, name):
+        return f"{self.root}/{resolution}.{name}.bin"
+
+    def update(self):
+        """Fold newly indexed events into the columns; days recomputed"""
+        self.index.sync()
+        watermark, days = self.index.changed_days(self.meta["watermark"])
+        if days:
+            numbers = [day_number(d) for d in days]
+            self.grow(min(numbers), max(numbers))
+            for day, n in zip(days, numbers): self.recompute(day, n)
+        self.meta["watermark"] = watermark
+        tmp = self.meta_path+".tmp"
+        with open(tmp, "w") as f: json.dump(self.meta, f, indent=2)
+        os.replace(tmp, self.meta_path)
+        return len(days)
+
+    def grow(self, first, last):
+        # Extend the columns to cover days [first, last]; appends in place,
+        # rewrites only when backfilled history starts before the origin
+        origin, count = self.meta["origin"], self.meta["days"]
+        if not count: origin, count = first, 0
+        start, end = min(origin, first), max(origin+count-1, last)
+        before, after = origin-start, end-(origin+count-1)
+        if not (before or after): return
+        for resolution, per_day in RESOLUTIONS.items():
+            for name, (code, _) in COLUMNS.items():
+                fill = array.array(code, [EMPTY[name]])
+                if before:
+                    col = fill*(before*per_day)+self.load(resolution, name, native=False)+fill*(after*per_day)
+                    with open(self.file(resolution, name), "wb") as f: col.tofile(f)
+                else:
+                    with open(self.file(resolution, name), "ab") as f: (fill*(after*per_day)).tofile(f)
+        self.meta["origin"], self.meta["days"] = start, end-start+1
+
+    def recompute(self, day, number):
+        rows = [dict(EMPTY) for _ in range(25)]  # 24 hours, then the whole day
+        for rec in self.index.select(since=f"{day}T00:00:00", until=f"{day}T23:59:59.999999"):
+            if rec.get("kind") not in ("carrier_lock", "daily_pulse", "threshold_liminality"): continue
+            fold(rows[int(rec["ts"][11:13])], rec, self.band)
+            fold(rows[24], rec, self.band)
+        i = number-self.meta["origin"]
+        for name, (code, _) in COLUMNS.items():
+            self.put("day", name, i, array.array(code, [rows[24][name]]))
+            self.put("hour", name, i*24, array.array(code, [r[name] for r in rows[:24]]))
+
+    def put(self, resolution, name, row, values):
+        fd = os.open(self.file(resolution, name), os.O_WRONLY)
+        try:
+            os.pwrite(fd, values.tobytes(), row*values.itemsize)
+        finally:
+            os.close(fd)
+
+    def load(self, resolution, name, native=True):
+        """A whole column: numpy array if available (and native), else array.array"""
+        code, dtype = COLUMNS[name]
+        path = self.file(resolution, name)
+        if native and np is not None:
+            return np.fromfile(path, dtype=dtype) if os.path.exists(path) else np.empty(0, dtype=dtype)
+        col = array.array(code)
+        if os.path.exists(path):
+            with open(path, "rb") as f: col.frombytes(f.read())
+        return col
+
+    def rows(self, since=None, until=None, resolution="day"):
+        """Row slice of the columns covering [since, until] (ISO dates or timestamps)"""
+        per_day, origin = RESOLUTIONS[resolution], self.meta["origin"] or 0
+        total = self.meta["days"]*per_day
+        lo = 0 if since is None else (day_number(since)-origin)*per_day
+        hi = total if until is None else (day_number(until)-origin+1)*per_day
+        if resolution == "hour":
+            if since and len(since) > 10: lo += int(since[11:13])
+            if until and len(until) > 10: hi -= 23-int(until[11:13])
+        return slice(max(0, lo), max(0, min(total, hi)))
+
+    def column(self, name, since=None, until=None, resolution="day"):
+        return self.load(resolution, name)[self.rows(since, until, resolution)]
+
+    def band_invariance(self, since=None, until=None):
+        """Whether threshold_liminality readings held the band, day by day"""
+        band = self.column("band", since, until)
+        origin = (self.meta["origin"] or 0)+self.rows(since, until).start
+        if np is not None:
+            breaks = (np.flatnonzero(band == 0)+origin).tolist()
+            measured, held = int((band >= 0).sum()), int((band == 1).sum())
+            edges = np.flatnonzero(np.diff(np.concatenate(([0], (band == 1).astype(np.int8), [0]))))
+            longest = int((edges[1::2]-edges[::2]).max()) if len(edges) else 0
+        else:
+            held, outside = band.count(1), band.count(0)
+            measured = held+outside
+            breaks = [origin+i for i, b in enumerate(band) if b == 0] if outside else []
+            longest = run = 0
+            for b in band:
+                run = run+1 if b == 1 else 0
+                longest = max(longest, run)
+        return {"band_celsius": list(self.band), "days_measured": measured, "days_in_band": held,
+                "ratio": held/measured if measured else None, "longest_in_band_run": longest,
+                "breaks": [dt.date.fromordinal(d).isoformat() for d in breaks]}
+
+    def pulse_days(self, since=None, until=None):
+        """(days with daily_pulse present, days with a daily_pulse recorded)"""
+        pulse = self.column("pulse", since, until)
+        if np is not None: return int((pulse == 1).sum()), int((pulse >= 0).sum())
+        return pulse.count(1), len(pulse)-pulse.count(-1)
+
+    def carrier_uptime(self, since=None, until=None, resolution="hour"):
+        """Share of buckets whose last carrier_lock was "on", among buckets with one"""
+        carrier = self.column("carrier", since, until, resolution)
+        if np is not None: on, known = int((carrier == 1).sum()), int((carrier >= 0).sum())
+        else: on, known = carrier.count(1), len(carrier)-carrier.count(-1)
+        return on/known if known else None
+
+def main():
+    ap = argparse.ArgumentParser(description="Update and query the La Paz columnar signal rollups")
+    ap.add_argument("--log", default=EVENTS)
+    ap.add_argument("--since", help="ISO date (UTC)")
+    ap.add_argument("--until", help="ISO date (UTC)")
+    ap.add_argument("--update-only", action="store_true", help="fold new events in and exit")
+    args = ap.parse_args()
+    r = Rollups(args.log)
+    n = r.update()
+    print(f"➤ rollups: {n} days recomputed, {r.meta['days']} days stored in {r.root}")
+    if args.update_only: return
+    inv = r.band_invariance(args.since, args.until)
+    present, recorded = r.pulse_days(args.since, args.until)
+    uptime = r.carrier_uptime(args.since, args.until)
+    lo, hi = inv["band_celsius"]
+    print(f"  band {lo}–{hi} °C held on {inv['days_in_band']}/{inv['days_measured']} measured days"
+          f" (longest run {inv['longest_in_band_run']})")
+    if inv["breaks"]: print(f"  ⚠️  out of band: {', '.join(inv['breaks'][:10])}{' …' if len(inv['breaks']) > 10 else ''}")
+    print(f"  daily_pulse present on {present}/{recorded} days")
+    print(f"  carrier_lock on {'—' if uptime is None else f'{uptime:.1%}'} of hours with a reading")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+import os, json, gzip, glob, time, zlib, fcntl, bisect, argparse, threading
+from contextlib import contextmanager
+
+ROTATE_BYTES = 64 << 20   # roll the active file past this size
+ROTATE_DAILY = True       # ... or when the first event of a new UTC day arrives
+SEAL_MEMBER = 256 << 10   # uncompressed bytes per gzip member; a random read inflates at most about this much
+READ_CHUNK = 64 << 10     # compressed bytes read at a time when inflating
+
+def ts_key(ts):
+    # ISO timestamps compare correctly as strings once the trailing Z is gone
+    # ("...:00" < "...:00.5", whereas "...:00Z" > "...:00.5Z")
+    return ts[:-1] if ts.endswith("Z") else ts
+
+class SegmentedLog:
+    """An append-only JSONL log that rolls into gzip'd segments.
+
+    The active file keeps its original path, so existing appenders still
+    work. When it passes max_bytes, or an event from a later UTC day than its
+    first arrives, it is renamed to <stem>.<first ts>.jsonl, compressed to
+    .jsonl.gz, and recorded in <stem>.manifest.json with its first/last ts,
+    record count and sizes. Readers use the manifest to open only segments
+    that overlap a time window. With keep set, only the newest keep segments
+    are retained; older ones are deleted each time a segment is sealed.
+    With background, append() only renames the active file and a thread
+    compresses it, so writers never wait on gzip (wait() joins it; a
+    segment left raw by an exit is sealed by recover()). Each SEAL_MEMBER
+    bytes of a segment is its own gzip member, so gzip_members() and
+    MemberReader can read a record without inflating everything before it.
+
+    Appenders hold a shared flock on <path>.lock while writing and a roll
+    takes it exclusively, so a writer whose descriptor still points at a
+    renamed file notices (inode check) and reopens before writing.
+    """
+
+    def __init__(self, path, max_bytes=ROTATE_BYTES, daily=ROTATE_DAILY, keep=None, background=False):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.daily = daily
+        self.keep = keep
+        self.background = background
+        self.sealer = None  # newest background seal thread; each one waits for the one before
+        self.stem = path[:-len(".jsonl")] if path.endswith(".jsonl") else path
+        self.manifest_path = f"{self.stem}.manifest.json"
+        self.lock_path = f"{path}.lock"
+        self.first_day = None  # (inode, first ts day) of the active file
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+
+    @contextmanager
+    def locked(self, mode):
+        fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, mode)
+            yield
+        finally:
+            os.close(fd)
+
+    def open(self):
+        return os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+
+    def append(self, fd, data, ts):
+        """Append data (whole lines, first timestamped ts) through fd, rolling first
+        if due; returns the descriptor to keep using (reopened after a roll)."""
+        fd = self.open() if fd is None else self.current(fd)
+        if self.due(fd, len(data), ts):
+            self.roll(os.fstat(fd).st_ino)
+        with self.locked(fcntl.LOCK_SH):
+            fd = self.current(fd)
+            data = memoryview(data)
+            while data:
+                data = data[os.write(fd, data):]
+        return fd
+
+    def current(self, fd):
+        # Reopen when the path no longer names the file fd points at
+        try:
+            if os.stat(self.path).st_ino == os.fstat(fd).st_ino: return fd
+        except FileNotFoundError:
+            pass
+        os.close(fd)
+        self.first_day = None  # inode numbers are reused once a sealed segment is unlinked
+        return self.open()
+
+    def due(self, fd, incoming, ts):
+        st = os.fstat(fd)
+        if st.st_size == 0: return False
+        if self.max_bytes and st.st_size+incoming > self.max_bytes: return True
+        if self.daily and ts:
+            if self.first_day is None or self.first_day[0] != st.st_ino:
+                first = self.first_ts()
+                self.first_day = (st.st_ino, first[:10] if first else None)
+            return self.first_day[1] is not None and ts[:10] > self.first_day[1]
+        return False
+
+    def first_ts(self, path=None):
+        try:
+            with open(path or self.path, "rb") as f:
+                return json.loads(f.readline()).get("ts")
+        except (OSError, ValueError):
+            return None
+
+    def roll(self, expected_ino=None):
+        """Close the active file as a segment (no-op if it is empty, or is no
+        longer expected_ino because another process rolled it first); returns
+        its manifest entry, or None when it is sealed in the background"""
+        with self.locked(fcntl.LOCK_EX):
+            try:
+                st = os.stat(self.path)
+            except FileNotFoundError:
+                return None
+            if st.st_size == 0 or (expected_ino is not None and st.st_ino != expected_ino): return None
+            first = self.first_ts() or "unknown"
+            name = f"{self.stem}.{first.replace(':', '').replace('-', '')}"
+            seg, n = f"{name}.jsonl", 1
+            while os.path.exists(seg) or os.path.exists(seg+".gz"):
+                seg, n = f"{name}.{n}.jsonl", n+1
+            os.rename(self.path, seg)
+        self.first_day = None
+        if not self.background: return self.seal(seg)
+        self.seal_later(seg)
+        return None
+
+    def seal_later(self, seg):
+        previous = self.sealer
+        def run():
+            if previous: previous.join()  # one at a time, in roll order
+            try:
+                self.seal(seg)
+            except OSError as e:
+                print(f"⚠️  sealing {seg} failed ({e}); recover() will retry")
+        self.sealer = threading.Thread(target=run, name="segment-seal", daemon=True)
+        self.sealer.start()
+
+    def wait(self):
+        """Block until background seals have finished"""
+        if self.sealer: self.sealer.join()
+
+    def seal(self, seg):
+        # Compress a renamed segment and record it in the manifest
+        entry = {"file": os.path.basename(seg)+".gz", "first_ts": None, "last_ts": None,
+                 "records": 0, "bytes": 0}
+        lo = hi = None
+        def scan(line):
+            nonlocal lo, hi
+            if not line.strip(): return
+            entry["records"] += 1
+            if line.startswith(b'{"ts": "'):  # record() puts ts first; skip the full parse
+                ts = line[8:line.find(b'"', 8)].decode(errors="replace")
+            else:
+                try:
+                    ts = json.loads(line).get("ts")
+                except (ValueError, AttributeError):
+                    return
+            if ts:
+                k = ts_key(ts)
+                if lo is None or k < lo: lo, entry["first_ts"] = k, ts
+                if hi is None or k > hi: hi, entry["last_ts"] = k, ts
+        # Block-wise, so zlib (which releases the GIL) does most of the work;
+        # one gzip member per block (concatenated members are still one gzip file)
+        with open(seg, "rb") as src, open(seg+".gz.tmp", "wb") as dst:
+            tail = b""
+            for block in iter(lambda: src.read(SEAL_MEMBER), b""):
+                dst.write(gzip.compress(block, compresslevel=6, mtime=0))
+                entry["bytes"] += len(block)
+                lines = (tail+block).split(b"\n")
+                tail = lines.pop()
+                for line in lines: scan(line)
+            scan(tail)
+        os.replace(seg+".gz.tmp", seg+".gz")
+        entry["compressed_bytes"] = os.path.getsize(seg+".gz")
+        with self.locked(fcntl.LOCK_EX):
+            manifest = self.manifest()
+            manifest["segments"] = [s for s in manifest["segments"] if s["file"] != entry["file"]]+[entry]
+            manifest["segments"].sort(key=lambda s: ts_key(s["first_ts"] or ""))
+            dropped = []
+            if self.keep is not None and len(manifest["segments"]) > self.keep:
+                dropped = manifest["segments"][:-self.keep] if self.keep else manifest["segments"]
+                manifest["segments"] = manifest["segments"][len(dropped):]
+            self.write_manifest(manifest)
+            os.unlink(seg)
+            for s in dropped:
+                try: os.unlink(os.path.join(os.path.dirname(self.path), s["file"]))
+                except FileNotFoundError: pass
+        return entry
+
+    def recover(self, min_age=60):
+        """Seal segments left uncompressed by an interrupted roll (ones older
+        than min_age seconds, so a roll still in progress is left alone)"""
+        for seg in sorted(glob.glob(glob.escape(self.stem)+".*.jsonl")):
+            if seg != self.path and time.time()-os.path.getmtime(seg) >= min_age: self.seal(seg)
+
+    def manifest(self):
+        try:
+            with open(self.manifest_path) as f: return json.load(f)
+        except FileNotFoundError:
+            return {"log": os.path.basename(self.path), "segments": []}
+
+    def write_manifest(self, manifest):
+        tmp = self.manifest_path+".tmp"
+        with open(tmp, "w") as f: json.dump(manifest, f, indent=2)
+        os.replace(tmp, self.manifest_path)
+
+    def segments(self, since=None, until=None):
+        """Paths of sealed segments overlapping [since, until], oldest first"""
+        base = os.path.dirname(self.path)
+        for s in self.manifest()["segments"]:
+            if since and s["last_ts"] and ts_key(s["last_ts"]) < ts_key(since): continue
+            if until and s["first_ts"] and ts_key(s["first_ts"]) > ts_key(until): continue
+            yield os.path.join(base, s["file"])
+
+    def lines(self, since=None, until=None):
+        """Raw lines of every segment overlapping the window, then the active file"""
+        for seg in self.segments(since, until):
+            with gzip.open(seg, "rb") as f: yield from f
+        try:
+            with open(self.path, "rb") as f: yield from f
+        except FileNotFoundError:
+            pass
+
+    def records(self, since=None, until=None):
+        """Parsed records with since <= ts <= until, oldest segment first"""
+        lo = ts_key(since) if since else None
+        hi = ts_key(until) if until else None
+        for line in self.lines(since, until):
+            if not line.strip(): continue
+            try:
+                rec = json.loads(line)
+            except ValueError:
+                continue
+            k = ts_key(rec.get("ts", ""))
+            if (lo is None or k >= lo) and (hi is None or k <= hi): yield rec
+
+def gzip_members(path):
+    """[(uncompressed offset, compressed offset)] where each gzip member of path starts"""
+    found, coff, uoff = [], 0, 0
+    with open(path, "rb") as f:
+        d, data = None, f.read(READ_CHUNK)
+        while data:
+            if d is None:
+                found.append((uoff, coff))
+                d = zlib.decompressobj(31)
+            uoff += len(d.decompress(data))
+            if d.eof:
+                coff += len(data)-len(d.unused_data)
+                data, d = d.unused_data or f.read(READ_CHUNK), None
+            else:
+                coff += len(data)
+                data = f.read(READ_CHUNK)
+    return found
+
+class MemberReader:
+    """seek()/readline() at uncompressed offsets of a sealed segment (raw file f).
+
+    A seek starts inflating at the gzip member holding the offset (members
+    from gzip_members()), so a read costs at most about one member
+    however deep into the segment it is; forward reads within what is
+    already inflated continue from there. A segment written as a single
+    member is inflated from its start.
+    """
+
+    def __init__(self, f, members):
+        self.f = f
+        self.members = members
+        self.starts = [u for u, _ in members]
+        self.d = None
+        self.pos, self.buf, self.at = 0, b"", 0  # buf holds uncompressed bytes from pos
+
+    def seek(self, offset):
+        i = max(0, bisect.bisect_right(self.starts, offset)-1)
+        if self.d is None or offset < self.pos or self.starts[i] > self.pos+len(self.buf):
+            self.f.seek(self.members[i][1] if self.members else 0)
+            self.d = zlib.decompressobj(31)
+            self.pos, self.buf = (self.starts[i] if self.members else 0), b""
+        self.at = offset
+
+    def readline(self):
+        if self.d is None: self.seek(0)
+        while True:
+            if self.at-self.pos > len(self.buf):  # skipping ahead: drop what we pass
+                self.pos, self.buf = self.pos+len(self.buf), b""
+            start = self.at-self.pos
+            end = self.buf.find(b"\n", start)
+            if end >= 0 or not self.inflate():
+                end = len(self.buf)-1 if end < 0 else end
+                line = self.buf[start:end+1]
+                self.pos, self.buf = self.pos+end+1, self.buf[end+1:]
+                self.at = self.pos
+                return line
+
+    def inflate(self):
+        # More of the stream into buf, across member boundaries; False at the end
+        while True:
+            data = b""
+            if self.d.eof:
+                data = self.d.unused_data
+                self.d = zlib.decompressobj(31)
+            data = data or self.f.read(READ_CHUNK)
+            if not data: return False
+            out = self.d.decompress(data)
+            if out:
+                self.buf += out
+                return True
+
+    def close(self): self.f.close()
+    def __enter__(self): return self
+    def __exit__(self, *exc): self.close()
+
+def main():
+    ap = argparse.ArgumentParser(description="Inspect or roll a segmented petal JSONL log")
+    ap.add_argument("log", help="active JSONL path, e.g. .../logs/petal_lapaz.events.jsonl")
+    ap.add_argument("--roll", action="store_true", help="seal the active file now")
+    ap.add_argument("--keep", type=int, default=None, help="keep only the newest N segments")
+    args = ap.parse_args()
+    log = SegmentedLog(args.log, keep=args.keep)
+    log.recover()
+    if args.roll:
+        entry = log.roll()
+        print(f"✅ sealed {entry['file']} ({entry['records']} records)" if entry else "◦ nothing to roll")
+    for s in log.manifest()["segments"]:
+        print(f"  {s['file']}  {s['first_ts']} → {s['last_ts']}  {s['records']} records  "
+              f"{s['bytes']} B → {s['compressed_bytes']} B")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+"""
+FIELD report stream
+NDJSON scan results written while the scan runs, the readers that fold them
+back into a report, and the atomic report-file writers the scanner CLI and
+watch mode share.
+"""
+
+import json
+import os
+from pathlib import Path
+from datetime import datetime
+from typing import TYPE_CHECKING, Dict, Any, Iterator, Tuple
+
+if TYPE_CHECKING:
+    from FIELD_symbolic_scanner import FIELDSymbolicScanner
+
+class NDJSONReportWriter:
+    """
+    Writes a scan report as newline-delimited JSON while the scan runs.
+    
+    Key directory files are written as they are analyzed rather than
+    collected, so memory stays flat however large the tree. One record per
+    line, in this order:
+    
+        {"record": "scan", "scan_timestamp": ..., "base_path": ...}
+        {"record": "file", "directory": <key directory path>, "file": {...}}
+        {"record": "directory", "name": <key directory>, "directory": {... minus "files"}}
+        {"record": "breathing_file", "file": {...}}
+        {"record": "spine_candidate", "candidate": {...}}
+        {"record": "section", "name": <report key>, "value": ...}
+    
+    load_report_stream() turns the records back into the report dict.
+    """
+    
+    # Report keys written as their own record kinds (or in the header)
+    STREAMED_KEYS = ("scan_timestamp", "base_path", "living_components",
+                     "breathing_files", "field_spine_candidates")
+    
+    def __init__(self, f, compact: bool = False):
+        self.f = f
+        self.separators = (",", ":") if compact else None
+    
+    def write(self, record: Dict[str, Any]):
+        self.f.write(json.dumps(record, separators=self.separators))
+        self.f.write("\n")
+    
+    def start(self, scan_timestamp: str, base_path: str):
+        self.write({"record": "scan", "scan_timestamp": scan_timestamp, "base_path": base_path})
+    
+    def file(self, directory: str, file_info: Dict[str, Any]):
+        self.write({"record": "file", "directory": directory, "file": file_info})
+    
+    def finish(self, report: Dict[str, Any]):
+        """Write everything the scan did not stream already"""
+        for name, component in report["living_components"].items():
+            # Files listed outside the walk (see _scan_directory) are only known now
+            for file_info in component["files"]:
+                self.file(component["path"], file_info)
+            directory = {k: v for k, v in component.items() if k != "files"}
+            self.write({"record": "directory", "name": name, "directory": directory})
+        for file_info in report["breathing_files"]:
+            self.write({"record": "breathing_file", "file": file_info})
+        for candidate in report["field_spine_candidates"]:
+            self.write({"record": "spine_candidate", "candidate": candidate})
+        for name, value in report.items():
+            if name not in self.STREAMED_KEYS:
+                self.write({"record": "section", "name": name, "value": value})
+        self.f.flush()
+
+def read_report_stream(path) -> Iterator[Dict[str, Any]]:
+    """Records of an NDJSON scan report, parsed one line at a time"""
+    with open(path) as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+def load_report_stream(records) -> Dict[str, Any]:
+    """Rebuild the full report dict from NDJSONReportWriter records"""
+    report = {"scan_timestamp": None, "base_path": None, "living_components": {},
+              "breathing_files": [], "field_spine_candidates": []}
+    files = {}
+    for record in records:
+        kind = record["record"]
+        if kind == "scan":
+            report["scan_timestamp"] = record["scan_timestamp"]
+            report["base_path"] = record["base_path"]
+        elif kind == "file":
+            files.setdefault(record["directory"], []).append(record["file"])
+        elif kind == "directory":
+            directory = dict(record["directory"])
+            directory["files"] = files.pop(directory["path"], [])
+            report["living_components"][record["name"]] = directory
+        elif kind == "breathing_file":
+            report["breathing_files"].append(record["file"])
+        elif kind == "spine_candidate":
+            report["field_spine_candidates"].append(record["candidate"])
+        elif kind == "section":
+            report[record["name"]] = record["value"]
+    return report
+
+def summarize_report_stream(records) -> Dict[str, Any]:
+    """
+    Fold NDJSON report records into just what generate_weave_report()
+    renders - no file listings and only the first 5 spine candidates - so a
+    report of any size is read in one pass and constant memory.
+    """
+    summary = {
+        "scan_timestamp": None,
+        "base_path": None,
+        "breathing_files": [],
+        "field_spine_candidates": [],
+        "trident_detections": {"complete_flows": [], "partial_implementations": []}
+    }
+    for record in records:
+        kind = record["record"]
+        if kind == "scan":
+            summary["scan_timestamp"] = record["scan_timestamp"]
+            summary["base_path"] = record["base_path"]
+        elif kind == "breathing_file":
+            summary["breathing_files"].append(record["file"])
+        elif kind == "spine_candidate" and len(summary["field_spine_candidates"]) < 5:
+            summary["field_spine_candidates"].append(record["candidate"])
+        elif kind == "section" and record["name"] == "trident_detections":
+            summary["trident_detections"] = record["value"]
+    return summary
+
+def _write_atomic(path: Path, write):
+    """Write-then-rename so readers (and watch mode) never see a partial file"""
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, 'w') as f:
+        write(f)
+    os.replace(tmp_path, path)
+
+def _report_paths(scanner: "FIELDSymbolicScanner", suffix: str) -> Tuple[Path, Path]:
+    stamp = datetime.now().strftime('%Y%m%d')
+    results_file = scanner.reflection_dir / f"◎_weave_report_{stamp}{suffix}"
+    report_file = scanner.reflection_dir / f"◎_weave_report_{stamp}.md"
+    results_file.parent.mkdir(parents=True, exist_ok=True)
+    return results_file, report_file
+
+def save_reports(scanner: "FIELDSymbolicScanner", results: Dict[str, Any], report: str,
+                 compact: bool = False) -> Tuple[Path, Path]:
+    """Write the JSON results and the weave report into the reflection directory"""
+    results_file, report_file = _report_paths(scanner, ".json")
+    if compact:
+        _write_atomic(results_file, lambda f: json.dump(results, f, separators=(",", ":")))
+    else:
+        _write_atomic(results_file, lambda f: json.dump(results, f, indent=2))
+    _write_atomic(report_file, lambda f: f.write(report))
+    return results_file, report_file
+
+def stream_reports(scanner: "FIELDSymbolicScanner", compact: bool = False) -> Tuple[Path, Path, str]:
+    """
+    Scan straight into an NDJSON results file, then render the weave report
+    by reading that file back lazily. Returns (results_file, report_file, report).
+    """
+    results_file, report_file = _report_paths(scanner, ".ndjson")
+    _write_atomic(results_file, lambda f: scanner.scan_living_architecture(NDJSONReportWriter(f, compact)))
+    report = scanner.generate_weave_report(summarize_report_stream(read_report_stream(results_file)))
+    _write_atomic(report_file, lambda f: f.write(report))
+    return results_file, report_file, report
@@ -0,0 +1,91 @@
+"""
+FIELD scan index
+Persistent per-file analysis cache for FIELD_symbolic_scanner.
+"""
+
+import json
+import sqlite3
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, Any, Optional
+
+class ScanIndex:
+    """
+    Persistent cache of per-file analysis results keyed by (path, size, mtime).
+    
+    Only the time-independent features (sacred symbols and living pattern
+    matches) are stored; the resonance score carries a recency bonus and is
+    always recomputed by the scanner when an entry is served.
+    """
+    
+    VERSION = 2
+    
+    # Files modified this recently may still change within the same mtime tick,
+    # so they are analyzed but not cached
+    RACY_WINDOW_SECONDS = 2.0
+    
+    def __init__(self, db_path, signature: str):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.db_path))
+        self.conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS files ("
+            "path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, features TEXT)"
+        )
+        
+        # Pattern definitions changed since the cache was written - start over
+        signature = f"{self.VERSION}:{signature}"
+        row = self.conn.execute("SELECT value FROM meta WHERE key = 'signature'").fetchone()
+        if row is None or row[0] != signature:
+            self.conn.execute("DELETE FROM files")
+            self.conn.execute("INSERT OR REPLACE INTO meta VALUES ('signature', ?)", (signature,))
+            self.conn.commit()
+        
+        self.pending = []
+        self.seen = set()
+        self.hits = 0
+        self.misses = 0
+    
+    def lookup(self, path: str, stat) -> Optional[Dict[str, Any]]:
+        """Cached features for path, or None when missing or stale"""
+        self.seen.add(path)
+        row = self.conn.execute(
+            "SELECT size, mtime_ns, features FROM files WHERE path = ?", (path,)
+        ).fetchone()
+        if row is not None and row[0] == stat.st_size and row[1] == stat.st_mtime_ns:
+            self.hits += 1
+            return json.loads(row[2])
+        self.misses += 1
+        return None
+    
+    def store(self, path: str, stat, features: Dict[str, Any]):
+        """Queue features for path; written on the next flush"""
+        if datetime.now().timestamp() - stat.st_mtime < self.RACY_WINDOW_SECONDS:
+            return
+        self.pending.append((path, stat.st_size, stat.st_mtime_ns, json.dumps(features)))
+        if len(self.pending) >= 1000:
+            self.flush()
+    
+    def mark_seen(self, path: str):
+        """Record that path still exists so prune() keeps its entry"""
+        self.seen.add(path)
+    
+    def flush(self):
+        """Write queued entries in a single transaction"""
+        if self.pending:
+            self.conn.executemany("INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?)", self.pending)
+            self.conn.commit()
+            self.pending = []
+    
+    def prune(self):
+        """Drop entries for files the last walk did not see"""
+        self.flush()
+        stale = [(path,) for (path,) in self.conn.execute("SELECT path FROM files") if path not in self.seen]
+        if stale:
+            self.conn.executemany("DELETE FROM files WHERE path = ?", stale)
+            self.conn.commit()
+    
+    def close(self):
+        self.flush()
+        self.conn.close()
@@ -7,13 +7,560 @@ Uncover what's already alive in the architecture - don't rewrite, just weave.
 import os
 import json
 import re
+import hashlib
+import mmap
+import stat as stat_module
+import argparse
+import heapq
+import signal
+import time
+import cProfile
+from contextlib import contextmanager, nullcontext
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Iterator, Tuple
+
+from FIELD_scan_index import ScanIndex
+from FIELD_report_stream import NDJSONReportWriter, save_reports, stream_reports
+from FIELD_watcher import FIELDWatcher
+
+# Characters re.IGNORECASE equates with an ASCII letter that str.lower() does
+# not fold onto it (U+0130 even lowers to two characters)
+CASE_FOLD_FIXES = {0x130: "i", 0x131: "i", 0x17f: "s"}
+
+# Distinct line numbers kept per (term, file) posting
+MAX_POSTING_LINES = 64
+
+def _count_newlines(buffer, start: int, end: int) -> int:
+    """Newlines in buffer[start:end] for str, bytes or mmap buffers"""
+    if isinstance(buffer, str):
+        return buffer.count("\n", start, end)
+    if isinstance(buffer, bytes):
+        return buffer.count(b"\n", start, end)
+    # mmap has no count() - slice it a megabyte at a time
+    total = 0
+    for pos in range(start, end, 1 << 20):
+        total += buffer[pos:min(end, pos + (1 << 20))].count(b"\n")
+    return total
+
+class SymbolicMatcher:
+    """
+    Compiled matcher for sacred symbols and living patterns.
+    
+    The content is case-folded once and each living pattern runs
+    case-sensitively over the folded copy, so the regex engine can use its
+    literal/charset prefix scans instead of the slow IGNORECASE paths. Counts
+    and examples are identical to re.findall(pattern, content, re.IGNORECASE);
+    patterns that can't be folded safely (character classes, alphanumeric
+    escapes, non-ASCII) keep using exactly that call.
+    
+    Patterns named in indexed also report postings: for each lowercased
+    matched token, the line numbers it occurs on (see PatternIndex).
+    """
+    
+    def __init__(self, sacred_symbols: Dict[str, str], living_patterns: Dict[str, str],
+                 indexed: Optional[List[str]] = None):
+        self.sacred_symbols = list(sacred_symbols.items())
+        self.indexed = set(indexed or ())
+        self.patterns = []
+        for pattern_name, pattern_regex in living_patterns.items():
+            folded = self._fold_pattern(pattern_regex)
+            if folded is not None:
+                self.patterns.append((pattern_name, folded, True))
+            else:
+                self.patterns.append((pattern_name, re.compile(pattern_regex, re.IGNORECASE), False))
+        
+        # Bytes variants for matching memory-mapped files without decoding them
+        self.bytes_patterns = None
+        if all(pattern_regex.isascii() for pattern_regex in living_patterns.values()):
+            self.bytes_patterns = [
+                (pattern_name, re.compile(pattern_regex.encode('ascii'), re.IGNORECASE))
+                for pattern_name, pattern_regex in living_patterns.items()
+            ]
+    
+    @staticmethod
+    def _fold_pattern(pattern_regex: str):
+        """Case-sensitive equivalent of pattern_regex for folded text, or None"""
+        if not pattern_regex.isascii() or "[" in pattern_regex:
+            return None
+        if re.search(r"\\[0-9A-Za-z]", pattern_regex):
+            return None
+        try:
+            return re.compile(pattern_regex.lower())
+        except re.error:
+            return None
+    
+    @staticmethod
+    def fold(content: str) -> str:
+        """Same-length lowercase copy of content matching IGNORECASE semantics"""
+        if any(chr(c) in content for c in CASE_FOLD_FIXES):
+            content = content.translate(CASE_FOLD_FIXES)
+        return content.lower()
+    
+    @staticmethod
+    def _example(match, content: str, groups: int):
+        """What re.findall would return for match, taken from the original content"""
+        if groups == 0:
+            return content[match.start():match.end()]
+        spans = [match.span(g) for g in range(1, groups + 1)]
+        values = tuple(content[s:e] if s >= 0 else content[:0] for s, e in spans)
+        return values[0] if groups == 1 else values
+    
+    def scan(self, content: str) -> Dict[str, Any]:
+        """Sacred symbols and living pattern matches in content"""
+        return self.scan_segments([content])
+    
+    def scan_segments(self, segments: List[str]) -> Dict[str, Any]:
+        """Like scan(), over separately sampled pieces of one file (no match spans a seam)"""
+        features = {
+            "sacred_symbols": [],
+            "living_patterns": []
+        }
+        
+        if self.indexed:
+            features["postings"] = {}
+        
+        for symbol, meaning in self.sacred_symbols:
+            if any(symbol in segment for segment in segments):
+                features["sacred_symbols"].append({"symbol": symbol, "meaning": meaning})
+        
+        folded = [None] * len(segments)
+        for pattern_name, pattern, on_folded in self.patterns:
+            count = 0
+            examples = []
+            for i, segment in enumerate(segments):
+                if on_folded and folded[i] is None:
+                    folded[i] = self.fold(segment)
+                if pattern_name in self.indexed:
+                    # Only the first segment starts at line 1
+                    found = self._collect(features["postings"], pattern_name,
+                                          folded[i] if on_folded else segment, segment,
+                                          pattern, 0, None, examples, with_lines=(i == 0))
+                elif on_folded:
+                    found = len(pattern.findall(folded[i]))
+                    if found and len(examples) < 3:
+                        examples += [self._example(m, segment, pattern.groups)
+                                     for m in islice(pattern.finditer(folded[i]), 3 - len(examples))]
+                else:
+                    matches = pattern.findall(segment)
+                    found = len(matches)
+                    examples += matches[:3 - len(examples)]
+                count += found
+            
+            if count:
+                features["living_patterns"].append({
+                    "pattern": pattern_name, 
+                    "matches": count,
+                    "examples": examples  # First 3 matches
+                })
+        
+        return features
+    
+    def _collect(self, postings: Dict[str, Dict[str, List[int]]], pattern_name: str, target, source,
+                 pattern, start: int, end: Optional[int], examples: List[Any], with_lines: bool) -> int:
+        """
+        Walk every match of pattern in target[start:end], appending up to 3
+        examples (taken from source, which has target's offsets) and recording
+        token -> line postings. Returns the match count.
+        """
+        tokens = postings.setdefault(pattern_name, {})
+        matches = pattern.finditer(target, start) if end is None else pattern.finditer(target, start, end)
+        count = 0
+        line = 1
+        last = 0
+        for match in matches:
+            count += 1
+            if len(examples) < 3:
+                example = self._example(match, source, pattern.groups)
+                examples.append(example if isinstance(source, str) else self._decode(example))
+            token = match.group()
+            if not isinstance(token, str):
+                token = token.decode('utf-8', errors='ignore')
+            lines = tokens.setdefault(token.lower(), [])
+            if with_lines:
+                line += _count_newlines(target, last, match.start())
+                last = match.start()
+                if len(lines) < MAX_POSTING_LINES and (not lines or lines[-1] != line):
+                    lines.append(line)
+        if not tokens:
+            del postings[pattern_name]
+        return count
+    
+    @staticmethod
+    def _decode(match):
+        """str form of a bytes findall result"""
+        if isinstance(match, tuple):
+            return tuple(m.decode('utf-8', errors='ignore') for m in match)
+        return match.decode('utf-8', errors='ignore')
+    
+    def scan_bytes(self, buffer, spans: List[Tuple[int, int]]) -> Dict[str, Any]:
+        """
+        Like scan(), directly over a bytes-like buffer (e.g. an mmap).
+        
+        Only the (start, end) byte spans are searched and nothing is decoded
+        except the examples. Bytes IGNORECASE folds ASCII only, so the
+        handful of non-ASCII letters text mode equates with ASCII (see
+        CASE_FOLD_FIXES) are not matched here.
+        """
+        features = {
+            "sacred_symbols": [],
+            "living_patterns": []
+        }
+        
+        if self.indexed:
+            features["postings"] = {}
+        
+        for symbol, meaning in self.sacred_symbols:
+            encoded = symbol.encode('utf-8')
+            if any(buffer.find(encoded, start, end) != -1 for start, end in spans):
+                features["sacred_symbols"].append({"symbol": symbol, "meaning": meaning})
+        
+        for pattern_name, pattern in self.bytes_patterns:
+            count = 0
+            examples = []
+            for start, end in spans:
+                if pattern_name in self.indexed:
+                    count += self._collect(features["postings"], pattern_name, buffer, buffer,
+                                           pattern, start, end, examples, with_lines=(start == 0))
+                    continue
+                matches = pattern.findall(buffer, start, end)
+                count += len(matches)
+                examples += [self._decode(m) for m in matches[:3 - len(examples)]]
+            
+            if count:
+                features["living_patterns"].append({
+                    "pattern": pattern_name, 
+                    "matches": count,
+                    "examples": examples  # First 3 matches
+                })
+        
+        return features
+
+class TopK:
+    """
+    Bounded best-K collector for scored report entries.
+    
+    Keeps the K highest scores in a min-heap, so memory is O(K) however many
+    items stream past, and returns them exactly as a stable descending sort
+    would - equal scores stay in arrival order. K=None keeps everything.
+    """
+    
+    def __init__(self, k: Optional[int] = None):
+        self.k = k
+        self.heap = []
+        self.seq = 0
+    
+    def push(self, score: float, item: Any):
+        # Later arrivals rank lower on ties, hence the negated sequence number
+        entry = (score, -self.seq, item)
+        self.seq += 1
+        if self.k is None or len(self.heap) < self.k:
+            heapq.heappush(self.heap, entry)
+        elif self.k > 0 and entry[:2] > self.heap[0][:2]:
+            heapq.heapreplace(self.heap, entry)
+    
+    def items(self) -> List[Any]:
+        """Collected items, best score first"""
+        return [item for _, _, item in sorted(self.heap, key=lambda e: (-e[0], -e[1]))]
+
+class PatternIndex:
+    """
+    Inverted index from living-pattern terms to the files that mention them.
+    
+    Terms are pattern names ("sacred_frequency") and lowercased matched
+    tokens ("atlas", "432.0"); each maps to postings of path -> line numbers
+    (the first MAX_POSTING_LINES distinct lines; empty when the token was
+    only seen in a sampled tail). Built from the features the scan already
+    produces, so sections and queries never re-read a file, and a lookup
+    costs the same however large the tree is.
+    """
+    
+    def __init__(self):
+        self.postings = {}  # term -> {path: [line numbers]}
+    
+    def add(self, path: str, postings: Dict[str, Dict[str, List[int]]]):
+        """Index one file's matcher postings ({pattern: {token: lines}})"""
+        for pattern_name, tokens in postings.items():
+            merged = set()
+            for token, lines in tokens.items():
+                self.postings.setdefault(token, {})[path] = lines
+                merged.update(lines)
+            self.postings.setdefault(pattern_name, {})[path] = sorted(merged)[:MAX_POSTING_LINES]
+    
+    def resolve(self, term: str) -> List[str]:
+        """Index terms a query term stands for: itself, else the tokens it prefixes ("432" -> "432.", "432.0")"""
+        term = term.lower()
+        if term in self.postings:
+            return [term]
+        return [t for t in self.postings if t.startswith(term)]
+    
+    def files(self, term: str) -> Dict[str, List[int]]:
+        """path -> line numbers for every file mentioning term"""
+        resolved = self.resolve(term)
+        if len(resolved) == 1:
+            return self.postings[resolved[0]]
+        merged = {}
+        for t in resolved:
+            for path, lines in self.postings[t].items():
+                merged[path] = sorted(set(merged.get(path, [])) | set(lines))[:MAX_POSTING_LINES]
+        return merged
+    
+    def query(self, *terms: str) -> Dict[str, Dict[str, List[int]]]:
+        """Files mentioning every term, as path -> {term: line numbers}"""
+        if not terms:
+            return {}
+        hits = [(term, self.files(term)) for term in terms]
+        # Intersect starting from the shortest postings list
+        smallest = min(hits, key=lambda h: len(h[1]))[1]
+        return {
+            path: {term: postings[path] for term, postings in hits}
+            for path in smallest
+            if all(path in postings for _, postings in hits)
+        }
+
+def _clock() -> Tuple[float, float]:
+    """(wall, CPU) timestamp for _elapsed()"""
+    return time.perf_counter(), time.process_time()
+
+def _elapsed(start: Tuple[float, float]) -> Tuple[float, float]:
+    """(wall, CPU) seconds since a _clock() timestamp"""
+    return time.perf_counter() - start[0], time.process_time() - start[1]
+
+class ScanMetrics:
+    """
+    Per-phase wall and CPU time, I/O counters and the slowest files of one scan.
+    
+    Main-process phases (walk, stat, index, analyze, dispatch, report, write)
+    are timed where they run; stat is part of walk, and analyze includes
+    waiting on worker processes. read and match are measured per file
+    inside whichever process analyzed it, so with --jobs their CPU time can
+    exceed the scan's wall time.
+    """
+    
+    def __init__(self, slowest: int = 10):
+        self.started = _clock()
+        self.phases = {}  # name -> [wall, cpu, calls]
+        self.counters = {
+            "dirs_walked": 0,
+            "dirs_ignored": 0,
+            "files_walked": 0,
+            "files_ignored": 0,
+            "files_skipped": 0,     # walked but needed by no report section
+            "files_analyzed": 0,    # read and matched
+            "files_cached": 0,      # served from the scan index
+            "read_errors": 0,
+            "bytes_read": 0
+        }
+        self.slowest = TopK(slowest)
+    
+    def add(self, phase: str, wall: float, cpu: float, calls: int = 1):
+        totals = self.phases.setdefault(phase, [0.0, 0.0, 0])
+        totals[0] += wall
+        totals[1] += cpu
+        totals[2] += calls
+    
+    @contextmanager
+    def phase(self, name: str):
+        start = _clock()
+        try:
+            yield
+        finally:
+            self.add(name, *_elapsed(start))
+    
+    def timed(self, iterable, phase: str) -> Iterator[Any]:
+        """Iterate, charging the time spent producing each item to phase"""
+        iterator = iter(iterable)
+        while True:
+            start = _clock()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                self.add(phase, *_elapsed(start))
+                return
+            self.add(phase, *_elapsed(start))
+            yield item
+    
+    def count(self, counter: str, n: int = 1):
+        self.counters[counter] += n
+    
+    def file(self, path: str, profile: Dict[str, Any]):
+        """Record the per-file profile a reader attached to its features"""
+        self.counters["files_analyzed"] += 1
+        self.counters["bytes_read"] += profile["bytes"]
+        wall = 0.0
+        for phase in ("read", "match"):
+            if phase in profile:
+                self.add(phase, *profile[phase])
+                wall += profile[phase][0]
+        self.slowest.push(wall, {
+            "path": path,
+            "ms": round(wall * 1000, 3),
+            "read_ms": round(profile.get("read", (0.0,))[0] * 1000, 3),
+            "match_ms": round(profile.get("match", (0.0,))[0] * 1000, 3),
+            "bytes": profile["bytes"]
+        })
+    
+    def to_dict(self) -> Dict[str, Any]:
+        wall, cpu = _elapsed(self.started)
+        return {
+            "total": {"wall_s": round(wall, 6), "cpu_s": round(cpu, 6)},
+            "phases": {
+                name: {"wall_s": round(w, 6), "cpu_s": round(c, 6), "calls": calls}
+                for name, (w, c, calls) in self.phases.items()
+            },
+            "counters": dict(self.counters),
+            "slowest_files": self.slowest.items()
+        }
+    
+    def summary(self) -> str:
+        """Human-readable phase table for --profile"""
+        data = self.to_dict()
+        lines = [f"\n⏱  Scan profile (total {data['total']['wall_s']:.3f} s wall, "
+                 f"{data['total']['cpu_s']:.3f} s CPU)"]
+        for name, phase in data["phases"].items():
+            lines.append(f"  {name:<10} {phase['wall_s']:9.3f} s wall  {phase['cpu_s']:9.3f} s CPU  {phase['calls']:>8} calls")
+        lines.append("  " + "  ".join(f"{k}={v}" for k, v in data["counters"].items()))
+        if data["slowest_files"]:
+            lines.append("  Slowest files:")
+            for entry in data["slowest_files"]:
+                lines.append(f"    {entry['ms']:9.3f} ms  {entry['bytes']:>10} B  {entry['path']}")
+        return "\n".join(lines)
+
+# Directories the walk never enters: dot dirs, dependencies and build outputs
+DEFAULT_IGNORE = [".*/", "node_modules/", ".next/", ".git/", "build/", "dist/", ".build/",
+                  "DerivedData/", "__pycache__/"]
+
+class IgnoreRules:
+    """
+    gitignore-style path filter for the walk.
+    
+    Supported syntax: "name" matches that name at any depth, a pattern
+    containing "/" is anchored to base_path, a trailing "/" matches
+    directories only, "*", "?", "[...]" and "**" glob as in gitignore, and
+    a leading "!" re-includes what an earlier pattern excluded. The last
+    matching pattern wins; an ignored directory is not entered at all.
+    """
+    
+    def __init__(self, patterns: List[str]):
+        self.patterns = list(patterns)
+        self.rules = []  # (negate, dir_only, anchored, literal name or None, compiled)
+        for pattern in self.patterns:
+            pattern = pattern.strip()
+            if not pattern or pattern.startswith("#"):
+                continue
+            negate = pattern.startswith("!")
+            if negate:
+                pattern = pattern[1:]
+            dir_only = pattern.endswith("/")
+            pattern = pattern.rstrip("/")
+            anchored = "/" in pattern
+            pattern = pattern.lstrip("/")
+            literal = pattern if not anchored and not any(c in pattern for c in "*?[") else None
+            self.rules.append((negate, dir_only, anchored, literal, re.compile(self._translate(pattern))))
+        self.has_file_rules = any(not dir_only for _, dir_only, _, _, _ in self.rules)
+    
+    @staticmethod
+    def _translate(pattern: str) -> str:
+        """Regex for a gitignore glob, matched against a whole relative path or name"""
+        out = []
+        i = 0
+        while i < len(pattern):
+            if pattern.startswith("**/", i):
+                out.append("(?:.*/)?")
+                i += 3
+            elif pattern.startswith("**", i):
+                out.append(".*")
+                i += 2
+            elif pattern[i] == "*":
+                out.append("[^/]*")
+                i += 1
+            elif pattern[i] == "?":
+                out.append("[^/]")
+                i += 1
+            elif pattern[i] == "[" and "]" in pattern[i + 2:]:
+                end = pattern.index("]", i + 2)
+                body = pattern[i + 1:end]
+                if body.startswith("!"):
+                    body = "^" + body[1:]
+                out.append("[" + body.replace("\\", "\\\\") + "]")
+                i = end + 1
+            else:
+                out.append(re.escape(pattern[i]))
+                i += 1
+        return "".join(out) + r"\Z"
+    
+    def ignored(self, relative: str, name: str, is_dir: bool) -> bool:
+        """Whether an entry (relative path from base_path, "/"-separated) is excluded"""
+        if not is_dir and not self.has_file_rules:
+            return False
+        for negate, dir_only, anchored, literal, compiled in reversed(self.rules):
+            if dir_only and not is_dir:
+                continue
+            if literal is not None:
+                hit = name == literal
+            else:
+                hit = compiled.match(relative if anchored else name) is not None
+            if hit:
+                return not negate
+        return False
+
+# Per-process scanner used by worker processes (see _init_worker)
+_worker_scanner = None
+
+def _init_worker(state: Dict[str, Any]):
+    """ProcessPoolExecutor initializer - build the matcher once per worker"""
+    global _worker_scanner
+    _worker_scanner = FIELDSymbolicScanner.from_worker_state(state)
+
+def _read_chunk(paths: List[str]) -> List[Tuple[Optional[Dict[str, Any]], Optional[str]]]:
+    """Read and match a batch of files inside a worker process"""
+    return [_worker_scanner._read_features(Path(p)) for p in paths]
 
 class FIELDSymbolicScanner:
-    def __init__(self, base_path="/Users/jbear/FIELD-DEV"):
+    def __init__(self, base_path="/Users/jbear/FIELD-DEV", index_path=None, workers=1,
+                 breathing_limit=20, spine_limit=None, read_mode="text", max_bytes=None,
+                 sample_policy="head", index_all=False, ignore=None, profile=False, slowest=10):
         self.base_path = Path(base_path)
+        self.reflection_dir = self.base_path / "◼_dojo" / "_reflection"
+        
+        # Optional on-disk analysis cache (see ScanIndex); None disables it
+        self.index_path = Path(index_path) if index_path else None
+        self.index = None
+        
+        # Processes used for file analysis; 0/None means one per CPU
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = 64
+        
+        # How many breathing files / spine candidates the report keeps (None = all)
+        self.breathing_limit = breathing_limit
+        self.spine_limit = spine_limit
+        
+        # How file content is read: "text" decodes it, "mmap" matches bytes in place.
+        # Files over max_bytes are sampled ("head", or "ends" = first and last half)
+        # and flagged as truncated.
+        if read_mode not in ("text", "mmap"):
+            raise ValueError(f"unknown read_mode: {read_mode}")
+        if sample_policy not in ("head", "ends"):
+            raise ValueError(f"unknown sample_policy: {sample_policy}")
+        self.read_mode = read_mode
+        self.max_bytes = max_bytes
+        self.sample_policy = sample_policy
+        
+        # Per-phase timing (see ScanMetrics), collected only when profiling
+        self.profile = profile
+        self.slowest = slowest
+        self.metrics = None
+        
+        # What the walk skips (gitignore-style, see IgnoreRules)
+        self.ignore = IgnoreRules(DEFAULT_IGNORE if ignore is None else ignore)
+        
+        # The pattern index covers the files the report sections analyze;
+        # index_all analyzes every scannable file so queries see the whole tree
+        self.index_all = index_all
+        self.pattern_index = None
+        
         self.sacred_symbols = {
             "●": "observer",
             "▼": "validator", 
@@ -38,8 +585,115 @@ class FIELDSymbolicScanner:
             "sacred_geometry": r"(sacred|geometric|harmony|fractal)"
         }
         
-    def scan_living_architecture(self) -> Dict[str, Any]:
-        """Main scanning function - uncover what's already breathing"""
+        # Patterns that get postings in the pattern index (field_references
+        # is in nearly every file, so it would only be noise)
+        self.indexed_patterns = [name for name in self.living_patterns if name != "field_references"]
+        
+        # Report section -> pattern whose postings fill it
+        self.sacred_sections = {
+            "sacred_frequency_432": "sacred_frequency",
+            "phi_ratio_1618": "phi_ratio",
+            "resonance_threshold_085": "resonance_threshold",
+            "chakra_alignments": "chakra_references",
+            "geometric_harmony": "sacred_geometry"
+        }
+        self.trident_nodes = ["OB1", "TATA", "ATLAS", "DOJO"]
+        
+        self.key_directories = [
+            "◼_dojo",
+            "DOJO-App", 
+            "sacred_repositories",
+            "config",
+            "monitoring"
+        ]
+        
+        self.scan_suffixes = ('.swift', '.py', '.json', '.md', '.tsx', '.ts')
+        
+        self.spine_indicators = [
+            "Controller",
+            "Manager", 
+            "Bridge",
+            "Orchestrator",
+            "Engine",
+            "Processor"
+        ]
+        
+        self.matcher = SymbolicMatcher(self.sacred_symbols, self.living_patterns, self.indexed_patterns)
+        
+    def worker_state(self) -> Dict[str, Any]:
+        """Picklable settings a worker process needs to analyze files like this scanner"""
+        return {
+            "base_path": str(self.base_path),
+            "sacred_symbols": self.sacred_symbols,
+            "living_patterns": self.living_patterns,
+            "indexed_patterns": self.indexed_patterns,
+            "read_mode": self.read_mode,
+            "max_bytes": self.max_bytes,
+            "sample_policy": self.sample_policy,
+            "profile": self.profile
+        }
+    
+    @classmethod
+    def from_worker_state(cls, state: Dict[str, Any]) -> "FIELDSymbolicScanner":
+        """Rebuild a scanner from worker_state() inside a worker process"""
+        scanner = cls(state["base_path"], read_mode=state["read_mode"],
+                      max_bytes=state["max_bytes"], sample_policy=state["sample_policy"],
+                      profile=state["profile"])
+        scanner.sacred_symbols = state["sacred_symbols"]
+        scanner.living_patterns = state["living_patterns"]
+        scanner.indexed_patterns = state["indexed_patterns"]
+        scanner.matcher = SymbolicMatcher(scanner.sacred_symbols, scanner.living_patterns,
+                                          scanner.indexed_patterns)
+        return scanner
+    
+    def scan_living_architecture(self, writer: Optional["NDJSONReportWriter"] = None) -> Dict[str, Any]:
+        """
+        Main scanning function - uncover what's already breathing.
+        
+        With a writer, living component files are streamed to it as they are
+        analyzed (and left out of the returned report), followed by the
+        remaining sections once the walk is done.
+        """
+        if writer:
+            writer.start(datetime.now().isoformat(), str(self.base_path))
+        self.metrics = ScanMetrics(self.slowest) if self.profile else None
+        
+        # Walk the tree once - every section below reads from the same table
+        self.index = self._open_index()
+        try:
+            table = self._traverse(writer)
+            if self.index:
+                self.index.prune()
+        finally:
+            if self.index:
+                self.index.close()
+                self.index = None
+        
+        # Kept for ad-hoc queries ("which files mention ATLAS and 432")
+        self.pattern_index = table["patterns"]
+        with self._phase("report"):
+            report = self._assemble_report(table)
+        if self.metrics:
+            report["scan_metrics"] = self.metrics.to_dict()
+        if writer:
+            writer.finish(report)
+        return report
+    
+    def _phase(self, name: str):
+        """Context manager timing a phase when profiling, else a no-op"""
+        return self.metrics.phase(name) if self.metrics else nullcontext()
+    
+    def query(self, *terms: str) -> Dict[str, Dict[str, List[int]]]:
+        """
+        Files from the last scan mentioning every term (see PatternIndex.query);
+        complete only with index_all, otherwise just the files some report section analyzed
+        """
+        if self.pattern_index is None:
+            self.pattern_index = self._traverse()["patterns"]
+        return self.pattern_index.query(*terms)
+    
+    def _assemble_report(self, table: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the scan report from a filled set of section sinks"""
         report = {
             "scan_timestamp": datetime.now().isoformat(),
             "base_path": str(self.base_path),
@@ -48,38 +702,301 @@ class FIELDSymbolicScanner:
             "trident_detections": {},
             "breathing_files": [],
             "field_spine_candidates": [],
-            "integration_points": []
+            "integration_points": [],
+            "truncated_files": []
         }
         
         # Scan key directories
-        key_directories = [
-            "◼_dojo",
-            "DOJO-App", 
-            "sacred_repositories",
-            "config",
-            "monitoring"
-        ]
-        
-        for dir_name in key_directories:
+        for dir_name in self.key_directories:
             dir_path = self.base_path / dir_name
             if dir_path.exists():
-                report["living_components"][dir_name] = self._scan_directory(dir_path)
+                report["living_components"][dir_name] = self._scan_directory(dir_path, table)
         
         # Detect sacred patterns across the codebase
-        report["sacred_alignments"] = self._detect_sacred_patterns()
+        report["sacred_alignments"] = self._detect_sacred_patterns(table["patterns"])
         
         # Find trident flow implementations
-        report["trident_detections"] = self._detect_trident_flows()
+        report["trident_detections"] = self._detect_trident_flows(table["patterns"])
         
         # Identify breathing files (recently modified, contains living patterns)
-        report["breathing_files"] = self._find_breathing_files()
+        report["breathing_files"] = self._find_breathing_files(table)
         
         # Find field spine integration points
-        report["field_spine_candidates"] = self._find_field_spine_candidates()
+        report["field_spine_candidates"] = self._find_field_spine_candidates(table)
+        
+        # Files only partially scanned because they exceeded max_bytes
+        report["truncated_files"] = table["truncated"]
         
         return report
     
-    def _scan_directory(self, dir_path: Path) -> Dict[str, Any]:
+    def _open_index(self) -> Optional[ScanIndex]:
+        """Open the persistent scan index if one is configured"""
+        if self.index_path is None:
+            return None
+        definitions = json.dumps([self.sacred_symbols, self.living_patterns, self.indexed_patterns,
+                                  self.read_mode, self.max_bytes, self.sample_policy], sort_keys=True)
+        return ScanIndex(self.index_path, hashlib.sha1(definitions.encode('utf-8')).hexdigest())
+    
+    def _traverse(self, writer: Optional["NDJSONReportWriter"] = None) -> Dict[str, Any]:
+        """
+        Walk base_path once and analyze every file any report section needs.
+        
+        Each file is stat'ed and analyzed at most once. Results are produced
+        in walk-order batches and handed straight to the section sinks
+        (key directory listings and the breathing/spine top-K collectors), so
+        only what the report keeps stays in memory. With a writer, key
+        directory files go straight to it instead of their listing.
+        """
+        table = self._new_table()
+        table["stream"] = writer
+        pending = []  # (key, Path, stat, listing, breathing, spine) in walk order
+        batch_size = self.chunk_size * self.workers * 4
+        
+        cutoff_time = datetime.now().timestamp() - (7 * 24 * 3600)  # 7 days ago
+        
+        def record_listing(root, subdirs):
+            table["directories"][root] = {"path": root, "files": [], "subdirs": subdirs}
+        
+        candidates = self._walk_candidates(on_key_directory=record_listing)
+        if self.metrics:
+            candidates = self.metrics.timed(candidates, "walk")
+        
+        with self._worker_pool() as pool:
+            for key, file_path, stat, key_dir, scannable, spine in candidates:
+                listing = table["directories"][key_dir] if key_dir and scannable else None
+                breathing = scannable and stat.st_mtime >= cutoff_time
+                if listing is not None or breathing or spine or (self.index_all and scannable):
+                    pending.append((key, file_path, stat, listing, breathing, spine))
+                elif self.metrics:
+                    self.metrics.count("files_skipped")
+                
+                if len(pending) >= batch_size:
+                    self._analyze_pending(table, pending, pool)
+                    pending = []
+            
+            self._analyze_pending(table, pending, pool)
+        
+        return table
+    
+    def _classify_file(self, root: str, name: str, key_paths: set) -> Optional[Tuple[Optional[str], bool, bool]]:
+        """(key_dir, scannable, spine) for a file some section could use, else None"""
+        scannable = name.endswith(self.scan_suffixes)
+        spine = any(indicator in name for indicator in self.spine_indicators)
+        if not (scannable or spine):
+            return None
+        key_dir = root if root in key_paths else None
+        return key_dir, scannable, spine
+    
+    def _key_paths(self) -> set:
+        """Absolute paths of the key directories, as the walk spells them"""
+        return {str(self.base_path / d) for d in self.key_directories}
+    
+    def _walk_candidates(self, top=None, on_directory=None, on_key_directory=None) -> Iterator[tuple]:
+        """
+        Yield (key, path, stat, key_dir, scannable, spine) for every regular
+        file under top (default base_path) that a report section could use.
+        
+        on_directory(root) is called for each directory walked, and
+        on_key_directory(root, subdirs) for each key directory with its
+        visible subdirectories.
+        """
+        key_paths = self._key_paths()
+        
+        for root, dirs, files in self._scandir_walk(top):
+            if on_directory:
+                on_directory(root)
+            if on_key_directory and root in key_paths:
+                on_key_directory(root, [d for d in dirs if not d.startswith('.')])
+            
+            for entry in files:
+                roles = self._classify_file(root, entry.name, key_paths)
+                if roles is None:
+                    if self.metrics:
+                        self.metrics.count("files_skipped")
+                    continue
+                
+                # Served from the entry: one stat call, none for skipped files
+                try:
+                    with self._phase("stat"):
+                        stat = entry.stat()
+                except OSError:
+                    continue
+                if not stat_module.S_ISREG(stat.st_mode):
+                    continue
+                
+                key = entry.path
+                if self.index:
+                    self.index.mark_seen(key)
+                yield (key, Path(key), stat) + roles
+    
+    def _scandir_walk(self, top=None) -> Iterator[Tuple[str, List[str], List[os.DirEntry]]]:
+        """
+        Top-down walk like os.walk, yielding (root, visible dir names, file
+        DirEntries) in the same order, with the ignore rules applied here
+        and nowhere else. Directory names are listed before ignore rules
+        apply (report listings show them); ignored ones are never entered.
+        Symlinked directories are listed but not followed.
+        """
+        top = str(top or self.base_path)
+        base = str(self.base_path)
+        relative = os.path.relpath(top, base).replace(os.sep, "/")
+        stack = [(top, "" if relative == "." else relative)]
+        while stack:
+            root, relative = stack.pop()
+            dirs = []
+            files = []
+            descend = []
+            ignored_files = 0
+            try:
+                with os.scandir(root) as it:
+                    for entry in it:
+                        try:
+                            is_dir = entry.is_dir()
+                        except OSError:
+                            is_dir = False
+                        child = f"{relative}/{entry.name}" if relative else entry.name
+                        if is_dir:
+                            dirs.append(entry.name)
+                            if not self.ignore.ignored(child, entry.name, True) and not entry.is_symlink():
+                                descend.append((entry.path, child))
+                        elif not self.ignore.ignored(child, entry.name, False):
+                            files.append(entry)
+                        else:
+                            ignored_files += 1
+            except OSError:
+                continue
+            
+            if self.metrics:
+                self.metrics.count("dirs_walked")
+                self.metrics.count("dirs_ignored", len(dirs) - len(descend))
+                self.metrics.count("files_walked", len(files))
+                self.metrics.count("files_ignored", ignored_files)
+            yield root, dirs, files
+            stack.extend(reversed(descend))
+    
+    def is_ignored(self, path: str) -> bool:
+        """Whether the walk would skip path (a file or directory under base_path)"""
+        relative = os.path.relpath(path, self.base_path).replace(os.sep, "/")
+        if relative == "." or relative.startswith("../"):
+            return False
+        parts = relative.split("/")
+        for i, name in enumerate(parts):
+            is_dir = i < len(parts) - 1 or os.path.isdir(path)
+            if self.ignore.ignored("/".join(parts[:i + 1]), name, is_dir):
+                return True
+        return False
+    
+    def _worker_pool(self):
+        """Process pool for file analysis, or a no-op context when running serially"""
+        if self.workers <= 1:
+            return nullcontext()
+        # Worker processes only start once the first chunk is submitted
+        return ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                   initargs=(self.worker_state(),))
+    
+    def _analyze_pending(self, table: Dict[str, Any], pending: List[tuple], pool=None):
+        """Analyze a walk-order batch of queued files and feed each report section"""
+        with self._phase("analyze"):
+            outcomes = self._features_for([entry[:3] for entry in pending], pool)
+        with self._phase("dispatch"):
+            for (_, file_path, stat, listing, breathing, spine), (features, error) in zip(pending, outcomes):
+                file_info = self._file_info(file_path, stat, features, error)
+                self._dispatch(table, file_info, listing, breathing, spine, features)
+    
+    def _features_for(self, batch: List[tuple], pool=None) -> List[Tuple[Optional[Dict[str, Any]], Optional[str]]]:
+        """(features, error) for each (key, path, stat), served from the index when unchanged"""
+        outcomes = [None] * len(batch)
+        misses = []
+        with self._phase("index"):
+            for i, (key, file_path, stat) in enumerate(batch):
+                features = self.index.lookup(key, stat) if self.index else None
+                if features is not None:
+                    outcomes[i] = (features, None)
+                else:
+                    misses.append(i)
+        if self.metrics:
+            self.metrics.count("files_cached", len(batch) - len(misses))
+        
+        for i, outcome in zip(misses, self._read_many([batch[i][1] for i in misses], pool)):
+            key, _, stat = batch[i]
+            self._record_read(key, outcome)
+            if outcome[0] is not None and self.index:
+                with self._phase("index"):
+                    self.index.store(key, stat, outcome[0])
+            outcomes[i] = outcome
+        return outcomes
+    
+    def _record_read(self, key: str, outcome: Tuple[Optional[Dict[str, Any]], Optional[str]]):
+        """Take the per-file profile off fresh features (it is never cached) and record it"""
+        features, error = outcome
+        profile = features.pop("_profile", None) if features is not None else None
+        if self.metrics:
+            if error is not None:
+                self.metrics.count("read_errors")
+            elif profile is not None:
+                self.metrics.file(key, profile)
+    
+    def _dispatch(self, table: Dict[str, Any], file_info: Dict[str, Any], listing, breathing: bool, spine: bool,
+                  features: Optional[Dict[str, Any]] = None):
+        """Hand one analyzed file to every report section it belongs to"""
+        if features is not None and features.get("postings"):
+            table["patterns"].add(file_info["path"], features["postings"])
+        if file_info.get("truncated"):
+            table["truncated"].append(file_info["path"])
+        if listing is not None and file_info["is_alive"]:
+            if table["stream"] is not None:
+                table["stream"].file(listing["path"], file_info)
+            else:
+                listing["files"].append(file_info)
+        if breathing and file_info["is_alive"]:
+            table["breathing"].push(file_info["resonance_score"], file_info)
+        if spine and file_info["resonance_score"] > 0.2:
+            table["spine"].push(file_info["resonance_score"], {
+                "file": file_info,
+                "spine_potential": file_info["resonance_score"],
+                "suggested_symbol": self._suggest_sacred_symbol(file_info["name"])
+            })
+    
+    def _read_many(self, paths: List[Path], pool=None) -> Iterator[Tuple[Optional[Dict[str, Any]], Optional[str]]]:
+        """
+        Read and match paths, yielding (features, error) in input order.
+        
+        With a worker pool the paths are fanned out in chunks so each IPC
+        round trip carries a batch of files rather than one.
+        """
+        if pool is None or len(paths) <= self.chunk_size:
+            for file_path in paths:
+                yield self._read_features(file_path)
+            return
+        
+        # Small batches get smaller chunks so every worker still has work
+        size = max(1, min(self.chunk_size, -(-len(paths) // (self.workers * 4))))
+        chunks = [[str(p) for p in paths[i:i + size]] for i in range(0, len(paths), size)]
+        for results in pool.map(_read_chunk, chunks):
+            yield from results
+    
+    def _new_table(self) -> Dict[str, Any]:
+        """Empty set of report section sinks for one walk"""
+        return {
+            "files": {},                              # files analyzed outside the walk
+            "directories": {},                        # key directory path -> {"path", "files", "subdirs"}
+            "breathing": TopK(self.breathing_limit),  # alive, recently modified files
+            "spine": TopK(self.spine_limit),          # spine candidate entries
+            "truncated": [],                          # paths sampled under max_bytes
+            "patterns": PatternIndex(),               # living pattern postings
+            "stream": None                            # NDJSONReportWriter for listing files
+        }
+    
+    def _analyze_once(self, table: Dict[str, Any], file_path: Path, stat=None) -> Dict[str, Any]:
+        """Analyze a file through the shared result table so it is read at most once"""
+        key = str(file_path)
+        file_info = table["files"].get(key)
+        if file_info is None:
+            file_info = self._analyze_file(file_path, stat)
+            table["files"][key] = file_info
+        return file_info
+    
+    def _scan_directory(self, dir_path: Path, table: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Scan a directory for living patterns"""
         result = {
             "path": str(dir_path),
@@ -92,22 +1009,148 @@ class FIELDSymbolicScanner:
         
         if not dir_path.exists():
             return result
-            
+        
+        if table is None:
+            table = self._new_table()
+        
+        listing = table["directories"].get(str(dir_path))
+        if listing is not None:
+            result["files"] = list(listing["files"])
+            result["subdirs"] = list(listing["subdirs"])
+            return result
+        
+        # Not reached by the walk (symlinked or unreadable) - list it directly
         try:
-            for item in dir_path.iterdir():
-                if item.is_file() and item.suffix in ['.swift', '.py', '.json', '.md', '.tsx', '.ts']:
-                    file_info = self._analyze_file(item)
-                    if file_info["is_alive"]:
-                        result["files"].append(file_info)
-                elif item.is_dir() and not item.name.startswith('.'):
-                    result["subdirs"].append(str(item.name))
+            with os.scandir(dir_path) as it:
+                for entry in it:
+                    if entry.is_file() and os.path.splitext(entry.name)[1] in self.scan_suffixes:
+                        try:
+                            stat = entry.stat()
+                        except OSError:
+                            stat = None  # _analyze_file reports the error
+                        file_info = self._analyze_once(table, Path(entry.path), stat)
+                        if file_info["is_alive"]:
+                            result["files"].append(file_info)
+                    elif entry.is_dir() and not entry.name.startswith('.'):
+                        result["subdirs"].append(entry.name)
         except PermissionError:
             result["error"] = "Permission denied"
             
         return result
     
-    def _analyze_file(self, file_path: Path) -> Dict[str, Any]:
-        """Analyze individual file for living patterns"""
+    def _analyze_file(self, file_path: Path, stat=None) -> Dict[str, Any]:
+        """Analyze individual file for living patterns (reuses stat when given)"""
+        try:
+            if stat is None:
+                stat = file_path.stat()
+        except Exception as e:
+            return self._file_info(file_path, None, error=str(e))
+        
+        # Unchanged files are served from the index without being read
+        key = str(file_path)
+        features = self.index.lookup(key, stat) if self.index else None
+        error = None
+        if features is None:
+            features, error = self._read_features(file_path)
+            self._record_read(key, (features, error))
+            if features is not None and self.index:
+                self.index.store(key, stat, features)
+        
+        return self._file_info(file_path, stat, features, error)
+    
+    def _read_features(self, file_path: Path) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """
+        Read file_path and match it, returning (features, None) or (None, error).
+        
+        When profiling, features carry a "_profile" entry with the (wall, CPU)
+        time spent reading and matching and the bytes read; _record_read()
+        removes it.
+        """
+        profile = {} if self.profile else None
+        try:
+            if self.read_mode == "mmap" and self.matcher.bytes_patterns is not None:
+                features = self._read_features_mmap(file_path, profile)
+            elif self.max_bytes is not None:
+                features = self._read_features_sampled(file_path, profile)
+            else:
+                start = _clock() if profile is not None else None
+                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+                    content = f.read()
+                    if profile is not None:
+                        profile["bytes"] = f.buffer.tell()
+                        profile["read"] = _elapsed(start)
+                        start = _clock()
+                features = self._extract_features(content)
+                if profile is not None:
+                    profile["match"] = _elapsed(start)
+        except Exception as e:
+            return None, str(e)
+        if profile is not None:
+            features["_profile"] = profile
+        return features, None
+    
+    def _sample_spans(self, size: int) -> List[Tuple[int, int]]:
+        """Byte ranges of a size-byte file to scan under max_bytes/sample_policy"""
+        if self.max_bytes is None or size <= self.max_bytes:
+            return [(0, size)]
+        if self.sample_policy == "ends":
+            head = self.max_bytes // 2
+            return [(0, head), (size - (self.max_bytes - head), size)]
+        return [(0, self.max_bytes)]
+    
+    @staticmethod
+    def _mark_truncated(features: Dict[str, Any], size: int, spans: List[Tuple[int, int]]):
+        scanned = sum(end - start for start, end in spans)
+        if scanned < size:
+            features["truncated"] = True
+            features["bytes_scanned"] = scanned
+    
+    def _read_features_sampled(self, file_path: Path, profile: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Decode and match only the sampled byte ranges of file_path"""
+        clock = _clock() if profile is not None else None
+        with open(file_path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            spans = self._sample_spans(size)
+            segments = []
+            for start, end in spans:
+                f.seek(start)
+                segments.append(f.read(end - start).decode('utf-8', errors='ignore'))
+        if profile is not None:
+            profile["bytes"] = sum(end - start for start, end in spans)
+            profile["read"] = _elapsed(clock)
+            clock = _clock()
+        features = self.matcher.scan_segments(segments)
+        if profile is not None:
+            profile["match"] = _elapsed(clock)
+        self._mark_truncated(features, size, spans)
+        return features
+    
+    def _read_features_mmap(self, file_path: Path, profile: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Match bytes regexes against a read-only mmap of file_path (no decode copy).
+        Pages are faulted in while matching, so profiling counts it all as match.
+        """
+        clock = _clock() if profile is not None else None
+        with open(file_path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            spans = self._sample_spans(size)
+            if size == 0:
+                features = self.matcher.scan_bytes(b"", spans)
+            else:
+                # Map only as far as the last byte we will look at
+                with mmap.mmap(f.fileno(), spans[-1][1], access=mmap.ACCESS_READ) as mm:
+                    if hasattr(mm, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+                        mm.madvise(mmap.MADV_SEQUENTIAL)
+                    features = self.matcher.scan_bytes(mm, spans)
+        if profile is not None:
+            profile["bytes"] = sum(end - start for start, end in spans)
+            profile["match"] = _elapsed(clock)
+        self._mark_truncated(features, size, spans)
+        return features
+    
+    def _file_info(self, file_path: Path, stat, features: Optional[Dict[str, Any]] = None,
+                   error: Optional[str] = None) -> Dict[str, Any]:
+        """Assemble a file result from its stat and features and score it"""
         result = {
             "path": str(file_path),
             "name": file_path.name,
@@ -120,131 +1163,98 @@ class FIELDSymbolicScanner:
             "resonance_score": 0.0
         }
         
-        try:
-            stat = file_path.stat()
+        if stat is not None:
             result["size"] = stat.st_size
             result["last_modified"] = datetime.fromtimestamp(stat.st_mtime).isoformat()
-            
-            # Read file content
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-            
-            # Check for sacred symbols
-            for symbol, meaning in self.sacred_symbols.items():
-                if symbol in content:
-                    result["sacred_symbols"].append({"symbol": symbol, "meaning": meaning})
-            
-            # Check for living patterns
-            for pattern_name, pattern_regex in self.living_patterns.items():
-                matches = re.findall(pattern_regex, content, re.IGNORECASE)
-                if matches:
-                    result["living_patterns"].append({
-                        "pattern": pattern_name, 
-                        "matches": len(matches),
-                        "examples": matches[:3]  # First 3 matches
-                    })
-            
-            # Calculate resonance score
-            resonance_score = 0.0
-            resonance_score += len(result["sacred_symbols"]) * 0.2
-            resonance_score += len(result["living_patterns"]) * 0.15
-            
-            # Bonus for recent activity (within last 7 days)
-            days_since_modified = (datetime.now().timestamp() - stat.st_mtime) / (24 * 3600)
-            if days_since_modified <= 7:
-                resonance_score += 0.3
-            
-            result["resonance_score"] = resonance_score
-            result["is_alive"] = resonance_score >= 0.3
-            
-        except Exception as e:
-            result["error"] = str(e)
-            
+        
+        if error is not None or features is None:
+            result["error"] = error
+            return result
+        
+        result["sacred_symbols"] = features["sacred_symbols"]
+        result["living_patterns"] = features["living_patterns"]
+        trident_tokens = features.get("postings", {}).get("trident_flow", {})
+        result["trident_references"] = [node for node in self.trident_nodes if node.lower() in trident_tokens]
+        if features.get("truncated"):
+            result["truncated"] = True
+            result["bytes_scanned"] = features["bytes_scanned"]
+        
+        # Calculate resonance score
+        resonance_score = 0.0
+        resonance_score += len(result["sacred_symbols"]) * 0.2
+        resonance_score += len(result["living_patterns"]) * 0.15
+        
+        # Bonus for recent activity (within last 7 days)
+        days_since_modified = (datetime.now().timestamp() - stat.st_mtime) / (24 * 3600)
+        if days_since_modified <= 7:
+            resonance_score += 0.3
+        
+        result["resonance_score"] = resonance_score
+        result["is_alive"] = resonance_score >= 0.3
+        
         return result
     
-    def _detect_sacred_patterns(self) -> Dict[str, List]:
+    def _extract_features(self, content: str) -> Dict[str, Any]:
+        """Sacred symbols and living pattern matches in content (time-independent)"""
+        return self.matcher.scan(content)
+    
+    def _detect_sacred_patterns(self, index: Optional[PatternIndex] = None) -> Dict[str, List]:
         """Detect sacred geometric patterns across the codebase"""
-        patterns = {
-            "sacred_frequency_432": [],
-            "phi_ratio_1618": [],
-            "resonance_threshold_085": [],
-            "chakra_alignments": [],
-            "geometric_harmony": []
-        }
+        if index is None:
+            index = self._traverse()["patterns"]
         
-        # This would be implemented to search across files
-        # For now, return structure
+        patterns = {}
+        for section, pattern_name in self.sacred_sections.items():
+            postings = index.postings.get(pattern_name, {})
+            patterns[section] = [{"path": path, "lines": lines} for path, lines in postings.items()]
         return patterns
     
-    def _detect_trident_flows(self) -> Dict[str, Any]:
+    def _detect_trident_flows(self, index: Optional[PatternIndex] = None) -> Dict[str, Any]:
         """Detect existing Metatron Trident flow implementations"""
+        if index is None:
+            index = self._traverse()["patterns"]
+        
         trident_flows = {
             "complete_flows": [],
             "partial_implementations": [],
-            "node_definitions": {
-                "OB1": [],
-                "TATA": [], 
-                "ATLAS": [],
-                "DOJO": []
-            }
+            "node_definitions": {}
         }
         
+        # Which nodes each file mentions
+        nodes_by_file = {}
+        for node in self.trident_nodes:
+            postings = index.postings.get(node.lower(), {})
+            trident_flows["node_definitions"][node] = [
+                {"path": path, "lines": lines} for path, lines in postings.items()
+            ]
+            for path in postings:
+                nodes_by_file.setdefault(path, []).append(node)
+        
+        # All four nodes in one file is a complete flow; two or three a partial one
+        for path, nodes in nodes_by_file.items():
+            if len(nodes) == len(self.trident_nodes):
+                trident_flows["complete_flows"].append({"path": path, "nodes": nodes})
+            elif len(nodes) > 1:
+                missing = [node for node in self.trident_nodes if node not in nodes]
+                trident_flows["partial_implementations"].append({"path": path, "nodes": nodes, "missing": missing})
+        
         return trident_flows
     
-    def _find_breathing_files(self) -> List[Dict[str, Any]]:
+    def _find_breathing_files(self, table: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """Find files that show signs of recent life/activity"""
-        breathing_files = []
-        
-        # Look for recently modified files with living patterns
-        cutoff_time = datetime.now().timestamp() - (7 * 24 * 3600)  # 7 days ago
+        if table is None:
+            table = self._traverse()
         
-        for root, dirs, files in os.walk(self.base_path):
-            # Skip node_modules and other noise
-            dirs[:] = [d for d in dirs if not d.startswith('.') and d != 'node_modules']
-            
-            for file in files:
-                if file.endswith(('.swift', '.py', '.json', '.md', '.tsx', '.ts')):
-                    file_path = Path(root) / file
-                    try:
-                        if file_path.stat().st_mtime >= cutoff_time:
-                            file_info = self._analyze_file(file_path)
-                            if file_info["is_alive"]:
-                                breathing_files.append(file_info)
-                    except:
-                        continue
-        
-        # Sort by resonance score
-        breathing_files.sort(key=lambda x: x["resonance_score"], reverse=True)
-        return breathing_files[:20]  # Top 20
-    
-    def _find_field_spine_candidates(self) -> List[Dict[str, Any]]:
+        # Recently modified alive files, best resonance first (top breathing_limit)
+        return table["breathing"].items()
+    
+    def _find_field_spine_candidates(self, table: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """Find files that could serve as FIELD spine integration points"""
-        candidates = []
+        if table is None:
+            table = self._traverse()
         
-        spine_indicators = [
-            "Controller",
-            "Manager", 
-            "Bridge",
-            "Orchestrator",
-            "Engine",
-            "Processor"
-        ]
-        
-        for root, dirs, files in os.walk(self.base_path):
-            dirs[:] = [d for d in dirs if not d.startswith('.') and d != 'node_modules']
-            
-            for file in files:
-                if any(indicator in file for indicator in spine_indicators):
-                    file_path = Path(root) / file
-                    file_info = self._analyze_file(file_path)
-                    if file_info["resonance_score"] > 0.2:
-                        candidates.append({
-                            "file": file_info,
-                            "spine_potential": file_info["resonance_score"],
-                            "suggested_symbol": self._suggest_sacred_symbol(file)
-                        })
-        
-        return sorted(candidates, key=lambda x: x["spine_potential"], reverse=True)
+        # Best spine potential first (top spine_limit, or all when unset)
+        return table["spine"].items()
     
     def _suggest_sacred_symbol(self, filename: str) -> str:
         """Suggest appropriate sacred symbol based on filename"""
@@ -286,6 +1296,12 @@ Breathing Files Found: {len(scan_results['breathing_files'])}
                 potential = candidate['spine_potential']
                 report += f"  {symbol} {file_info['name']} (potential: {potential:.2f})\n"
         
+        trident = scan_results['trident_detections']
+        report += "\n🔱 TRIDENT FLOWS\n"
+        report += f"  Complete: {len(trident['complete_flows'])}  Partial: {len(trident['partial_implementations'])}\n"
+        for flow in trident['complete_flows'][:3]:
+            report += f"  {Path(flow['path']).name}\n"
+        
         report += f"\n🔥 RECOMMENDED SYMLINK LACING\n"
         report += "Based on detected living patterns, suggest creating symbolic links:\n"
         
@@ -311,31 +1327,114 @@ Breathing Files Found: {len(scan_results['breathing_files'])}
         return report
 
 def main():
-    scanner = FIELDSymbolicScanner()
-    print("◼ Scanning living FIELD architecture...")
+    parser = argparse.ArgumentParser(description="FIELD Symbolic Scanner")
+    parser.add_argument("--base-path", default="/Users/jbear/FIELD-DEV",
+                        help="root of the FIELD tree to scan")
+    parser.add_argument("--no-index", action="store_true",
+                        help="re-analyze every file instead of using the scan index")
+    parser.add_argument("--jobs", type=int, default=1,
+                        help="worker processes for file analysis (0 = one per CPU)")
+    parser.add_argument("--top-k", type=int, default=None,
+                        help="keep only the K best spine candidates (and at most K breathing files)")
+    parser.add_argument("--mmap", action="store_true",
+                        help="match memory-mapped bytes instead of decoding files")
+    parser.add_argument("--max-bytes", type=int, default=None,
+                        help="scan at most this many bytes of each file")
+    parser.add_argument("--sample", choices=["head", "ends"], default="head",
+                        help="which part of an oversized file to scan")
+    parser.add_argument("--ignore", action="append", default=[], metavar="PATTERN",
+                        help="gitignore-style pattern to skip, on top of the defaults (repeatable)")
+    parser.add_argument("--ignore-file", default=None,
+                        help="file of gitignore-style patterns to skip, on top of the defaults")
+    parser.add_argument("--index-all", action="store_true",
+                        help="analyze every source file so the pattern index covers the whole tree")
+    parser.add_argument("--query", nargs="+", metavar="TERM",
+                        help="list files mentioning every TERM (e.g. ATLAS 432) instead of writing reports "
+                             "(implies --index-all)")
+    parser.add_argument("--format", choices=["json", "ndjson"], default="json",
+                        help="results file format (ndjson streams records as files are analyzed)")
+    parser.add_argument("--compact", action="store_true",
+                        help="write results without indentation or padding")
+    parser.add_argument("--profile", action="store_true",
+                        help="time each scan phase, print the breakdown and add scan_metrics to the results")
+    parser.add_argument("--slowest", type=int, default=10,
+                        help="how many of the slowest files --profile reports")
+    parser.add_argument("--profile-dump", default=None, metavar="FILE",
+                        help="also run the scan under cProfile and dump pstats data to FILE")
+    parser.add_argument("--watch", action="store_true",
+                        help="keep running and re-analyze files as they change")
+    parser.add_argument("--flush-interval", type=float, default=5.0,
+                        help="seconds between report writes in watch mode")
+    parser.add_argument("--poll", action="store_true",
+                        help="watch by periodic rewalks instead of inotify")
+    parser.add_argument("--poll-interval", type=float, default=2.0,
+                        help="seconds between rewalks when polling (raise it for large trees)")
+    args = parser.parse_args()
     
-    results = scanner.scan_living_architecture()
+    index_path = None
+    if not args.no_index:
+        index_path = Path(args.base_path) / "◼_dojo" / "_reflection" / "◎_scan_index.sqlite"
     
-    # Generate report
-    report = scanner.generate_weave_report(results)
+    ignore = DEFAULT_IGNORE + args.ignore
+    if args.ignore_file:
+        with open(args.ignore_file) as f:
+            ignore += f.read().splitlines()
     
-    # Save full results
-    results_file = scanner.base_path / "◼_dojo" / "_reflection" / f"◎_weave_report_{datetime.now().strftime('%Y%m%d')}.json"
-    results_file.parent.mkdir(parents=True, exist_ok=True)
+    breathing_limit = 20 if args.top_k is None else min(20, args.top_k)
+    scanner = FIELDSymbolicScanner(args.base_path, index_path=index_path, workers=args.jobs,
+                                   breathing_limit=breathing_limit, spine_limit=args.top_k,
+                                   read_mode="mmap" if args.mmap else "text",
+                                   max_bytes=args.max_bytes, sample_policy=args.sample,
+                                   index_all=args.index_all or bool(args.query), ignore=ignore,
+                                   profile=args.profile, slowest=args.slowest)
+    if args.query:
+        scanner.scan_living_architecture()
+        matches = scanner.query(*args.query)
+        print(f"⬡ {len(matches)} files mention {' and '.join(args.query)}")
+        for path, lines in matches.items():
+            where = "; ".join(f"{term}: {', '.join(map(str, hits)) or '-'}" for term, hits in lines.items())
+            print(f"  {path}  ({where})")
+        return
     
-    with open(results_file, 'w') as f:
-        json.dump(results, f, indent=2)
+    if args.watch:
+        # Service managers stop us with SIGTERM - flush the same way as Ctrl-C
+        signal.signal(signal.SIGTERM, signal.default_int_handler)
+        print("◼ Watching living FIELD architecture (Ctrl-C to stop)...")
+        FIELDWatcher(scanner, flush_interval=args.flush_interval, poll_interval=args.poll_interval,
+                     use_inotify=not args.poll, compact=args.compact).run()
+        return
     
-    # Save human-readable report  
-    report_file = scanner.base_path / "◼_dojo" / "_reflection" / f"◎_weave_report_{datetime.now().strftime('%Y%m%d')}.md"
-    with open(report_file, 'w') as f:
-        f.write(report)
+    print("◼ Scanning living FIELD architecture...")
+    
+    profiler = cProfile.Profile() if args.profile_dump else None
+    if profiler:
+        profiler.enable()
+    
+    if args.format == "ndjson":
+        # Results stream to disk during the scan; the report reads them back
+        results_file, report_file, report = stream_reports(scanner, compact=args.compact)
+    else:
+        results = scanner.scan_living_architecture()
+        
+        # Generate report and save full results and the human-readable report
+        with scanner._phase("write"):
+            report = scanner.generate_weave_report(results)
+            results_file, report_file = save_reports(scanner, results, report, compact=args.compact)
+    
+    if profiler:
+        profiler.disable()
+        profiler.dump_stats(args.profile_dump)
     
     print(f"✓ Scan complete. Results saved to:")
     print(f"  {results_file}")
     print(f"  {report_file}")
     
     print("\n" + report)
+    
+    if scanner.metrics:
+        print(scanner.metrics.summary())
+    if profiler:
+        print(f"\n📊 cProfile data: {args.profile_dump} (python3 -m pstats {args.profile_dump})")
 
 if __name__ == "__main__":
     main()
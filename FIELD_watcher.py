@@ -0,0 +1,363 @@
+"""
+FIELD watcher
+Watch mode for FIELD_symbolic_scanner: follow changes through inotify (or
+periodic rewalks) and re-analyze only the files that changed.
+"""
+
+import os
+import ctypes
+import ctypes.util
+import select
+import stat as stat_module
+import struct
+import sys
+import time
+from pathlib import Path
+from datetime import datetime
+from typing import TYPE_CHECKING, Dict, List, Any, Optional, Tuple
+
+from FIELD_report_stream import save_reports
+
+if TYPE_CHECKING:
+    from FIELD_symbolic_scanner import FIELDSymbolicScanner
+
+class InotifySource:
+    """
+    Linux inotify change feed, driven through libc with ctypes.
+    
+    One watch per walked directory. poll() blocks (using no CPU) until
+    something changes, then drains the burst of events and returns
+    ("file" | "dir_added" | "dir_removed" | "resync", path) actions.
+    """
+    
+    IN_MODIFY = 0x00000002
+    IN_ATTRIB = 0x00000004
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_Q_OVERFLOW = 0x00004000
+    IN_IGNORED = 0x00008000
+    IN_ISDIR = 0x40000000
+    
+    MASK = (IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM |
+            IN_MOVED_TO | IN_CREATE | IN_DELETE)
+    
+    # Keep reading while events arrive within this window (a save is several events)
+    SETTLE_SECONDS = 0.05
+    
+    def __init__(self):
+        libc_name = ctypes.util.find_library("c")
+        if not sys.platform.startswith("linux") or not libc_name:
+            raise OSError("inotify is only available on Linux")
+        self.libc = ctypes.CDLL(libc_name, use_errno=True)
+        self.libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self.libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+        self.fd = self.libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+        self.watches = {}  # wd -> directory path
+    
+    def watch(self, path: str):
+        wd = self.libc.inotify_add_watch(self.fd, os.fsencode(path), self.MASK)
+        if wd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, f"inotify_add_watch {path}: {os.strerror(err)}")
+        self.watches[wd] = path
+    
+    def unwatch_tree(self, path: str):
+        prefix = path + os.sep
+        for wd, watched in list(self.watches.items()):
+            if watched == path or watched.startswith(prefix):
+                self.libc.inotify_rm_watch(self.fd, wd)
+                del self.watches[wd]
+    
+    def poll(self, timeout: float) -> List[Tuple[str, Optional[str]]]:
+        actions = []
+        if not select.select([self.fd], [], [], timeout)[0]:
+            return actions
+        while True:
+            try:
+                self._parse(os.read(self.fd, 64 * 1024), actions)
+            except BlockingIOError:
+                pass
+            if not select.select([self.fd], [], [], self.SETTLE_SECONDS)[0]:
+                return actions
+    
+    def _parse(self, data: bytes, actions: List[Tuple[str, Optional[str]]]):
+        offset = 0
+        while offset + 16 <= len(data):
+            wd, mask, _cookie, length = struct.unpack_from("iIII", data, offset)
+            name = data[offset + 16:offset + 16 + length].rstrip(b"\0")
+            offset += 16 + length
+            
+            if mask & self.IN_Q_OVERFLOW:
+                actions.append(("resync", None))
+                continue
+            if mask & self.IN_IGNORED:
+                self.watches.pop(wd, None)
+                continue
+            directory = self.watches.get(wd)
+            if directory is None or not name:
+                continue
+            
+            path = os.path.join(directory, os.fsdecode(name))
+            if mask & self.IN_ISDIR:
+                if mask & (self.IN_CREATE | self.IN_MOVED_TO):
+                    actions.append(("dir_added", path))
+                elif mask & (self.IN_DELETE | self.IN_MOVED_FROM):
+                    actions.append(("dir_removed", path))
+            else:
+                actions.append(("file", path))
+    
+    def close(self):
+        os.close(self.fd)
+
+class PollingSource:
+    """Portable change feed: a stat-only rewalk of the tree every interval seconds"""
+    
+    def __init__(self, interval: float = 2.0):
+        self.interval = interval
+        self.next_poll = time.monotonic() + interval
+    
+    def watch(self, path: str):
+        pass
+    
+    def unwatch_tree(self, path: str):
+        pass
+    
+    def poll(self, timeout: float) -> List[Tuple[str, Optional[str]]]:
+        wait = self.next_poll - time.monotonic()
+        if wait > timeout:
+            time.sleep(timeout)
+            return []
+        time.sleep(max(0.0, wait))
+        self.next_poll = time.monotonic() + self.interval
+        return [("resync", None)]
+    
+    def close(self):
+        pass
+
+class FIELDWatcher:
+    """
+    Long-running watch mode for FIELDSymbolicScanner.
+    
+    Builds the same state a full scan does once, then re-analyzes only files
+    that are created, modified or deleted, keeping a live report in memory
+    and flushing the weave report files every flush_interval seconds while
+    anything has changed (and at least hourly, as files age out of the
+    7-day breathing window).
+    """
+    
+    REFRESH_SECONDS = 3600
+    
+    def __init__(self, scanner: "FIELDSymbolicScanner", flush_interval: float = 5.0,
+                 poll_interval: float = 2.0, use_inotify: bool = True, compact: bool = False):
+        self.scanner = scanner
+        self.flush_interval = flush_interval
+        self.poll_interval = poll_interval
+        self.compact = compact
+        self.source = None
+        if use_inotify:
+            try:
+                self.source = InotifySource()
+            except OSError:
+                pass
+        if self.source is None:
+            self.source = PollingSource(poll_interval)
+        
+        self.entries = {}       # path -> {"path", "stat", "key_dir", "scannable", "spine", "features", "error"}
+        self.directories = {}   # key directory path -> visible subdirs
+        self.own_outputs = set()
+        self.dirty = False
+        self.last_flush = 0.0
+    
+    def build(self):
+        """Initial full walk - afterwards only changes are analyzed"""
+        self.entries.clear()
+        self.directories.clear()
+        self._add_tree(None)
+        if self.scanner.index:
+            self.scanner.index.prune()
+        self.dirty = True
+    
+    def _add_tree(self, top: Optional[str]):
+        cutoff_time = datetime.now().timestamp() - (7 * 24 * 3600)
+        
+        def record_listing(root, subdirs):
+            self.directories[root] = subdirs
+        
+        pending = []
+        for key, file_path, stat, key_dir, scannable, spine in self.scanner._walk_candidates(
+                top, on_directory=self._watch, on_key_directory=record_listing):
+            entry = {"path": file_path, "stat": stat, "key_dir": key_dir,
+                     "scannable": scannable, "spine": spine, "features": None, "error": None}
+            self.entries[key] = entry
+            if ((key_dir and scannable) or spine or (scannable and stat.st_mtime >= cutoff_time)
+                    or (scannable and self.scanner.index_all)):
+                pending.append(entry)
+        
+        with self.scanner._worker_pool() as pool:
+            self._analyze(pending, pool)
+    
+    def _watch(self, root: str):
+        try:
+            self.source.watch(root)
+        except OSError as e:
+            # Typically fs.inotify.max_user_watches - keep going on polling
+            print(f"⚠️  {e}; falling back to polling")
+            self.source.close()
+            self.source = PollingSource(self.poll_interval)
+    
+    def _analyze(self, entries: List[Dict[str, Any]], pool=None):
+        batch = [(str(e["path"]), e["path"], e["stat"]) for e in entries]
+        for entry, (features, error) in zip(entries, self.scanner._features_for(batch, pool)):
+            entry["features"] = features
+            entry["error"] = error
+    
+    def apply(self, actions: List[Tuple[str, Optional[str]]]) -> bool:
+        """Fold a batch of change actions into the live state; True if anything changed"""
+        changed = False
+        for kind, path in actions:
+            if kind == "resync":
+                changed |= self._resync()
+            elif kind == "dir_added":
+                if self._keep_directory(path):
+                    self._add_tree(path)
+                    changed = True
+                self._refresh_listing(os.path.dirname(path))
+            elif kind == "dir_removed":
+                self.source.unwatch_tree(path)
+                prefix = path + os.sep
+                for key in [k for k in self.entries if k.startswith(prefix)]:
+                    del self.entries[key]
+                for root in [r for r in self.directories if r == path or r.startswith(prefix)]:
+                    del self.directories[root]
+                self._refresh_listing(os.path.dirname(path))
+                changed = True
+            elif path not in self.own_outputs:
+                changed |= self._refresh_file(path)
+        
+        self.dirty |= changed
+        return changed
+    
+    def _keep_directory(self, path: str) -> bool:
+        """Whether the walk would descend into path"""
+        return not self.scanner.is_ignored(path)
+    
+    def _refresh_listing(self, root: str):
+        if root not in self.scanner._key_paths():
+            return
+        try:
+            with os.scandir(root) as it:
+                self.directories[root] = [e.name for e in it if e.is_dir() and not e.name.startswith('.')]
+        except OSError:
+            self.directories.pop(root, None)
+    
+    def _refresh_file(self, path: str, stat=None) -> bool:
+        """Re-stat and, if its content may have changed, re-analyze one file"""
+        root, name = os.path.split(path)
+        roles = self.scanner._classify_file(root, name, self.scanner._key_paths())
+        if roles is None or (stat is None and self.scanner.is_ignored(path)):
+            return False
+        
+        try:
+            if stat is None:
+                stat = os.stat(path)
+        except OSError:
+            stat = None
+        if stat is None or not stat_module.S_ISREG(stat.st_mode):
+            return self.entries.pop(path, None) is not None
+        
+        entry = self.entries.get(path)
+        if entry is not None and (entry["stat"].st_size, entry["stat"].st_mtime_ns) == (stat.st_size, stat.st_mtime_ns):
+            entry["stat"] = stat
+            return False
+        
+        key_dir, scannable, spine = roles
+        entry = {"path": Path(path), "stat": stat, "key_dir": key_dir,
+                 "scannable": scannable, "spine": spine, "features": None, "error": None}
+        self.entries[path] = entry
+        self._analyze([entry])
+        return True
+    
+    def _resync(self) -> bool:
+        """Stat-only rewalk: pick up anything the change feed missed"""
+        changed = False
+        seen = set()
+        listings = {}
+        
+        def record_listing(root, subdirs):
+            listings[root] = subdirs
+        
+        for key, file_path, stat, *_ in self.scanner._walk_candidates(on_key_directory=record_listing):
+            seen.add(key)
+            if key not in self.own_outputs:
+                changed |= self._refresh_file(key, stat)
+        for key in [k for k in self.entries if k not in seen]:
+            del self.entries[key]
+            changed = True
+        if listings != self.directories:
+            self.directories = listings
+            changed = True
+        return changed
+    
+    def live_report(self) -> Dict[str, Any]:
+        """Current scan report, rebuilt from the in-memory state"""
+        table = self.scanner._new_table()
+        for root, subdirs in self.directories.items():
+            table["directories"][root] = {"path": root, "files": [], "subdirs": list(subdirs)}
+        
+        cutoff_time = datetime.now().timestamp() - (7 * 24 * 3600)
+        for entry in self.entries.values():
+            if entry["features"] is None and entry["error"] is None:
+                continue  # never needed by any section
+            stat = entry["stat"]
+            file_info = self.scanner._file_info(entry["path"], stat, entry["features"], entry["error"])
+            listing = table["directories"].get(entry["key_dir"]) if entry["scannable"] else None
+            breathing = entry["scannable"] and stat.st_mtime >= cutoff_time
+            self.scanner._dispatch(table, file_info, listing, breathing, entry["spine"], entry["features"])
+        
+        return self.scanner._assemble_report(table)
+    
+    def flush(self) -> Tuple[Path, Path]:
+        """Write the live report to the weave report files"""
+        results = self.live_report()
+        paths = save_reports(self.scanner, results, self.scanner.generate_weave_report(results),
+                             compact=self.compact)
+        self.own_outputs.update(str(p) for p in paths)
+        if self.scanner.index:
+            self.scanner.index.flush()
+        self.dirty = False
+        self.last_flush = time.monotonic()
+        return paths
+    
+    def run(self):
+        """Build, then follow changes until interrupted"""
+        self.scanner.index = self.scanner._open_index()
+        try:
+            self.build()
+            self.flush()
+            while True:
+                since_flush = time.monotonic() - self.last_flush
+                if self.dirty:
+                    timeout = max(0.0, self.flush_interval - since_flush)
+                else:
+                    timeout = max(0.0, self.REFRESH_SECONDS - since_flush)
+                
+                self.apply(self.source.poll(timeout))
+                
+                since_flush = time.monotonic() - self.last_flush
+                if (self.dirty and since_flush >= self.flush_interval) or since_flush >= self.REFRESH_SECONDS:
+                    results_file, _ = self.flush()
+                    print(f"✓ {datetime.now().strftime('%H:%M:%S')} {len(self.entries)} files → {results_file.name}")
+        except KeyboardInterrupt:
+            if self.dirty:
+                self.flush()
+        finally:
+            self.source.close()
+            if self.scanner.index:
+                self.scanner.index.close()
+                self.scanner.index = None
@@ -5,12 +5,32 @@ Each AI partner covers the weaknesses of others through their unique strengths
 Creating infinite reflection of fractal recursive patterns with semantic interpretation
 """
 
+import argparse
+import asyncio
+import hashlib
 import json
 import os
-from typing import Dict, List, Optional
+import random
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime
 from pathlib import Path
 
+try:
+    import numpy as np
+except ImportError:  # pure-Python matrix path, same numbers
+    np = None
+
+GOLDEN_RATIO = 1.618033988749
+COMPLEMENT_BOOST = 1.5
+DEFAULT_CONCURRENCY = 4    # in-flight calls per partner
+DEFAULT_TIMEOUT = 60.0     # seconds per partner call
+STATS_WINDOW = 200         # calls kept per partner for rolling stats
+STATS_HORIZON = 60.0       # seconds of history for throughput
+CACHE_DIR = Path.home() / ".config" / "fielddev" / "response_cache"
+
 class AIPartnerConfig:
     """
     Configure AI partners as nodes in the sacred geometry
@@ -21,6 +41,7 @@ class AIPartnerConfig:
         self.config_path = Path.home() / ".config" / "fielddev" / "ai_partners.json"
         self.state_path = Path.home() / "Library" / "Mobile Documents" / "com~apple~CloudDocs" / "FIELD-DEV" / "state" / "ai_state.json"
         self.partners = self._define_partners()
+        self._resonance = None  # (partner signature, names, matrix)
         
     def _define_partners(self) -> Dict:
         """
@@ -45,6 +66,7 @@ class AIPartnerConfig:
                     "Limited to text"
                 ],
                 "complements": ["ray", "chatgpt", "gemini"],
+                "alternates": [],  # nothing else reasons and designs at this depth
                 "api_env": "ANTHROPIC_API_KEY",
                 "frequency": 432,  # Hz - wisdom frequency
                 "role": "Architect & Sacred Geometry Guardian"
@@ -67,6 +89,7 @@ class AIPartnerConfig:
                     "Less consistent personality"
                 ],
                 "complements": ["claude", "ray", "codeium"],
+                "alternates": ["gemini"],  # multimodal, tool-using generalist
                 "api_env": "OPENAI_API_KEY",
                 "frequency": 963,  # Hz - crown chakra
                 "role": "Observer & Creative Explorer"
@@ -89,6 +112,7 @@ class AIPartnerConfig:
                     "No creative generation"
                 ],
                 "complements": ["claude", "chatgpt", "perplexity"],
+                "alternates": ["perplexity"],  # sourced search
                 "api_env": "RAY_API_KEY",
                 "frequency": 528,  # Hz - love and DNA repair
                 "role": "Truth Seeker & Verifier"
@@ -111,6 +135,7 @@ class AIPartnerConfig:
                     "Inconsistent behavior"
                 ],
                 "complements": ["claude", "chatgpt", "codeium"],
+                "alternates": ["chatgpt"],  # multimodal generalist
                 "api_env": "GEMINI_API_KEY",
                 "frequency": 396,  # Hz - root chakra
                 "role": "Manifestor & Executor"
@@ -133,6 +158,7 @@ class AIPartnerConfig:
                     "No architecture design"
                 ],
                 "complements": ["claude", "chatgpt", "cursor"],
+                "alternates": ["cursor"],  # in-IDE code generation
                 "api_env": "CODEIUM_API_KEY",
                 "frequency": 396,
                 "role": "Code Manifestor"
@@ -155,6 +181,7 @@ class AIPartnerConfig:
                     "No image generation"
                 ],
                 "complements": ["claude", "ray", "chatgpt"],
+                "alternates": ["ray"],  # sourced search
                 "api_env": "PERPLEXITY_API_KEY",
                 "frequency": 432,
                 "role": "Research Scholar"
@@ -177,12 +204,17 @@ class AIPartnerConfig:
                     "No general tasks"
                 ],
                 "complements": ["claude", "codeium", "chatgpt"],
+                "alternates": ["codeium"],  # in-IDE code generation
                 "api_env": "CURSOR_API_KEY",
                 "frequency": 396,
                 "role": "Code Surgeon"
             }
         }
     
+    def is_enabled(self, partner: str) -> bool:
+        """A partner is enabled when its API key is set (as in generate_partner_config)"""
+        return partner in self.partners and os.environ.get(self.partners[partner]["api_env"]) is not None
+    
     def get_complementary_chain(self, task_type: str) -> List[str]:
         """
         Get the optimal chain of AI partners for a task type
@@ -210,16 +242,90 @@ class AIPartnerConfig:
         freq1 = self.partners[partner1]["frequency"]
         freq2 = self.partners[partner2]["frequency"]
         
-        golden_ratio = 1.618033988749
+        golden_ratio = GOLDEN_RATIO
         ratio = max(freq1, freq2) / min(freq1, freq2)
         resonance = 1.0 / abs(ratio - golden_ratio) if ratio != golden_ratio else 1.0
         
         # Check if they complement each other
         if partner2 in self.partners[partner1]["complements"]:
-            resonance *= 1.5  # Boost for complementary pairs
+            resonance *= COMPLEMENT_BOOST  # Boost for complementary pairs
             
         return min(1.0, resonance)
     
+    def _partner_signature(self) -> Tuple:
+        """What the resonance matrix depends on: names, frequencies, complements"""
+        return tuple((name, p["frequency"], tuple(p["complements"])) for name, p in self.partners.items())
+    
+    def resonance_matrix(self) -> Tuple[List[str], object]:
+        """
+        Resonance of every ordered pair at once: (names, matrix) where
+        matrix[i][j] == calculate_harmonic_resonance(names[i], names[j]).
+        Built from a frequency array and a complement adjacency bitmap -
+        a NumPy array when NumPy is installed, else a list of lists with
+        identical values - and cached until the partner set changes
+        """
+        signature = self._partner_signature()
+        if self._resonance is not None and self._resonance[0] == signature:
+            return self._resonance[1], self._resonance[2]
+        
+        names = list(self.partners)
+        position = {name: i for i, name in enumerate(names)}
+        freqs = [float(self.partners[name]["frequency"]) for name in names]
+        # Row i has bit j set when names[j] is one of names[i]'s complements
+        bitmap = [sum(1 << position[c] for c in set(self.partners[name]["complements"]) if c in position)
+                  for name in names]
+        
+        if np is not None:
+            f = np.array(freqs, dtype=np.float64)
+            ratio = np.maximum.outer(f, f) / np.minimum.outer(f, f)
+            with np.errstate(divide="ignore"):
+                resonance = np.where(ratio != GOLDEN_RATIO, 1.0 / np.abs(ratio - GOLDEN_RATIO), 1.0)
+            complements = np.zeros((len(names), len(names)), dtype=bool)
+            for i, row in enumerate(bitmap):
+                complements[i, [j for j in range(row.bit_length()) if (row >> j) & 1]] = True
+            matrix = np.minimum(1.0, np.where(complements, resonance * COMPLEMENT_BOOST, resonance))
+        else:
+            # Ratios only depend on the frequency pair, and partners share a few frequencies
+            raw = {}
+            for fi in set(freqs):
+                for fj in set(freqs):
+                    ratio = max(fi, fj) / min(fi, fj)
+                    raw[fi, fj] = 1.0 / abs(ratio - GOLDEN_RATIO) if ratio != GOLDEN_RATIO else 1.0
+            clipped = {fi: {fj: min(1.0, raw[fi, fj]) for fj in set(freqs)} for fi in set(freqs)}
+            matrix = []
+            for fi, row in zip(freqs, bitmap):
+                out = [clipped[fi][fj] for fj in freqs]
+                j = 0
+                while row:
+                    if row & 1:
+                        out[j] = min(1.0, raw[fi, freqs[j]] * COMPLEMENT_BOOST)
+                    row >>= 1
+                    j += 1
+                matrix.append(out)
+        
+        self._resonance = (signature, names, matrix)
+        return names, matrix
+    
+    def top_resonant(self, partner: str, n: int = 3) -> List[Tuple[str, float]]:
+        """
+        The n partners most resonant with `partner` (excluding itself),
+        strongest first; ties keep partner definition order
+        """
+        names, matrix = self.resonance_matrix()
+        if partner not in names:
+            return []
+        i = names.index(partner)
+        row = matrix[i]
+        if np is not None:
+            order = [int(j) for j in np.argsort(-row, kind="stable")]
+        else:
+            order = sorted(range(len(names)), key=lambda j: -row[j])
+        return [(names[j], float(row[j])) for j in order if j != i][:n]
+    
+    def resonance_top_n(self, n: int = 3) -> Dict[str, List[Tuple[str, float]]]:
+        """Top-n most resonant partners for every partner"""
+        return {name: self.top_resonant(name, n) for name in self.partners}
+    
     def generate_partner_config(self) -> Dict:
         """
         Generate configuration for all AI partners
@@ -231,7 +337,9 @@ class AIPartnerConfig:
             "partners": {}
         }
         
-        for name, partner in self.partners.items():
+        names, matrix = self.resonance_matrix()
+        
+        for i, (name, partner) in enumerate(self.partners.items()):
             # Check if API key exists
             api_key = os.environ.get(partner["api_env"])
             
@@ -245,14 +353,14 @@ class AIPartnerConfig:
                 "strengths": partner["strengths"],
                 "weaknesses": partner["weaknesses"],
                 "complements": partner["complements"],
+                "alternates": partner["alternates"],
                 "harmonic_pairs": {}
             }
             
-            # Calculate harmonic resonance with all other partners
-            for other_name in self.partners:
+            # Harmonic resonance with all other partners, from the matrix
+            for j, other_name in enumerate(names):
                 if other_name != name:
-                    resonance = self.calculate_harmonic_resonance(name, other_name)
-                    config["partners"][name]["harmonic_pairs"][other_name] = round(resonance, 3)
+                    config["partners"][name]["harmonic_pairs"][other_name] = round(float(matrix[i][j]), 3)
         
         return config
     
@@ -300,8 +408,620 @@ class AIPartnerConfig:
         print("   Infinite reflection through fractal recursive patterns")
         print("   Building confidence and meaning in the partnership\n")
 
+@dataclass
+class ChainTask:
+    """One unit of work sent through a partner chain"""
+    task_type: str
+    prompt: str
+    payload: Dict[str, Any] = field(default_factory=dict)
+
+@dataclass
+class PartnerResult:
+    """What one partner returned (or why it didn't) within a chain run"""
+    partner: str
+    output: Any = None
+    error: Optional[str] = None
+    started: float = 0.0
+    finished: float = 0.0
+    cached: bool = False  # served by the response cache or another run's call, not a call of its own
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    @property
+    def latency(self) -> float:
+        return self.finished - self.started
+
+@dataclass
+class ChainRun:
+    """A finished chain: per-partner results plus the dependency plan used"""
+    task: ChainTask
+    chain: List[str]
+    plan: Dict[str, List[str]]
+    results: Dict[str, PartnerResult]
+    elapsed: float
+
+    @property
+    def ok(self) -> bool:
+        return all(r.ok for r in self.results.values())
+
+    @property
+    def output(self) -> Any:
+        """Output of the last partner in the chain that succeeded"""
+        for name in reversed(self.chain):
+            if self.results[name].ok:
+                return self.results[name].output
+        return None
+
+class PartnerBackend:
+    """
+    Pluggable transport for partner calls: subclasses implement call(),
+    receiving the results of the partners this one hands off from
+    """
+
+    async def call(self, partner: str, task: ChainTask, context: List[PartnerResult]) -> Any:
+        raise NotImplementedError
+
+class StubBackend(PartnerBackend):
+    """
+    In-process backend for offline load tests: sleeps for a configurable
+    latency (per partner, with optional jitter) and can fail at a set rate
+    """
+
+    def __init__(self, latency: float = 0.01, jitter: float = 0.0, error_rate: float = 0.0,
+                 latencies: Optional[Dict[str, float]] = None, seed: Optional[int] = None):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.latencies = latencies or {}
+        self.rng = random.Random(seed)
+        self.calls = 0
+
+    async def call(self, partner: str, task: ChainTask, context: List[PartnerResult]) -> Any:
+        self.calls += 1
+        delay = self.latencies.get(partner, self.latency)
+        if self.jitter:
+            delay = max(0.0, delay + self.rng.uniform(-self.jitter, self.jitter))
+        await asyncio.sleep(delay)
+        if self.error_rate and self.rng.random() < self.error_rate:
+            raise RuntimeError(f"stub failure from {partner}")
+        digest = hashlib.sha1(task.prompt.encode()).hexdigest()[:8]
+        return {"partner": partner, "task_type": task.task_type, "prompt": digest,
+                "handoff_from": [r.partner for r in context]}
+
+class ResponseCache:
+    """
+    Cache of partner responses keyed by partner, task type and a hash of
+    the normalized request (whitespace-collapsed prompt, canonical payload
+    and the outputs handed off from upstream partners).
+
+    In memory it is an LRU bounded by max_entries and max_bytes (JSON size
+    of the values), with entries expiring after ttl seconds. With disk=True
+    (or a directory) JSON-serializable responses are also kept under
+    ~/.config/fielddev/response_cache/ and promoted back into memory on a
+    hit. Cached values are shared, so callers must not mutate them.
+    """
+
+    def __init__(self, max_entries: int = 4096, max_bytes: int = 64 << 20, ttl: float = 3600.0,
+                 disk=False):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.disk_dir = (CACHE_DIR if disk is True else Path(disk)) if disk else None
+        self.entries: "OrderedDict[str, Tuple[float, int, Any]]" = OrderedDict()  # key -> (expires, size, value)
+        self.bytes = 0
+        self.metrics = {"hits": 0, "disk_hits": 0, "misses": 0, "evictions": 0, "expired": 0}
+
+    @staticmethod
+    def key(partner: str, task: ChainTask, context: List[PartnerResult] = ()) -> str:
+        request = {
+            "prompt": " ".join(task.prompt.split()),
+            "payload": task.payload,
+            "context": [[r.partner, r.output] for r in context],
+        }
+        digest = hashlib.sha256(json.dumps(request, sort_keys=True, default=str).encode()).hexdigest()
+        return f"{partner}:{task.task_type}:{digest}"
+
+    def get(self, key: str, default=None):
+        entry = self.entries.get(key)
+        now = time.monotonic()
+        if entry is not None:
+            if entry[0] > now:
+                self.entries.move_to_end(key)
+                self.metrics["hits"] += 1
+                return entry[2]
+            self._drop(key)
+            self.metrics["expired"] += 1
+        if self.disk_dir is not None:
+            found = self._disk_get(key)
+            if found is not None:
+                remaining, value = found
+                self._put(key, value, now + remaining)
+                self.metrics["disk_hits"] += 1
+                return value
+        self.metrics["misses"] += 1
+        return default
+
+    def put(self, key: str, value: Any):
+        expires = time.monotonic() + self.ttl
+        self._put(key, value, expires)
+        if self.disk_dir is not None:
+            self._disk_put(key, value)
+
+    def _put(self, key: str, value: Any, expires: float):
+        try:
+            size = len(json.dumps(value, default=str))
+        except (TypeError, ValueError):
+            size = len(repr(value))
+        if size > self.max_bytes:
+            return
+        if key in self.entries:
+            self._drop(key)
+        self.entries[key] = (expires, size, value)
+        self.bytes += size
+        while len(self.entries) > self.max_entries or self.bytes > self.max_bytes:
+            self._drop(next(iter(self.entries)))
+            self.metrics["evictions"] += 1
+
+    def _drop(self, key: str):
+        self.bytes -= self.entries.pop(key)[1]
+
+    def _disk_path(self, key: str) -> Path:
+        name = hashlib.sha256(key.encode()).hexdigest()
+        return self.disk_dir / name[:2] / f"{name}.json"
+
+    def _disk_get(self, key: str) -> Optional[Tuple[float, Any]]:
+        path = self._disk_path(key)
+        try:
+            with open(path) as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        remaining = entry.get("expires", 0) - time.time()
+        if entry.get("key") != key or remaining <= 0:
+            return None
+        return remaining, entry["value"]
+
+    def _disk_put(self, key: str, value: Any):
+        path = self._disk_path(key)
+        try:
+            body = json.dumps({"key": key, "expires": time.time() + self.ttl, "value": value})
+        except (TypeError, ValueError):
+            return  # not JSON: memory tier only
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(body)
+        os.replace(tmp, path)
+
+    def purge_disk(self) -> int:
+        """Delete expired or unreadable disk entries; returns how many"""
+        removed = 0
+        if self.disk_dir is None or not self.disk_dir.exists():
+            return 0
+        for path in self.disk_dir.glob("*/*.json"):
+            try:
+                with open(path) as f:
+                    expired = json.load(f).get("expires", 0) <= time.time()
+            except (OSError, ValueError):
+                expired = True
+            if expired:
+                path.unlink(missing_ok=True)
+                removed += 1
+        return removed
+
+    def clear(self):
+        self.entries.clear()
+        self.bytes = 0
+
+    def stats(self) -> Dict:
+        lookups = self.metrics["hits"] + self.metrics["disk_hits"] + self.metrics["misses"]
+        return dict(self.metrics, entries=len(self.entries), bytes=self.bytes,
+                    hit_ratio=round((lookups - self.metrics["misses"]) / lookups, 3) if lookups else None)
+
+class ChainEngine:
+    """
+    Runs tasks through complementary partner chains with asyncio.
+
+    A chain becomes a dependency plan: a partner waits for (and receives
+    the results of) the earlier chain members it complements - it covers
+    their weaknesses - and otherwise starts immediately, so independent
+    partners fan out in parallel and a run takes as long as its critical
+    path rather than the sum of its calls. Each partner has a concurrency
+    limit ("max_concurrency" in its definition, else DEFAULT_CONCURRENCY)
+    and a per-call timeout ("timeout", else DEFAULT_TIMEOUT). A partner
+    whose upstream failed is skipped.
+    """
+
+    def __init__(self, config: Optional[AIPartnerConfig] = None,
+                 backends: Optional[Dict[str, PartnerBackend]] = None,
+                 default_backend: Optional[PartnerBackend] = None,
+                 scheduler: Optional["AdaptiveScheduler"] = None,
+                 cache: Optional[ResponseCache] = None):
+        self.config = config or AIPartnerConfig()
+        self.backends = dict(backends or {})
+        self.default_backend = default_backend
+        self.scheduler = scheduler
+        self.cache = cache
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._limits: Dict[str, asyncio.Semaphore] = {}
+
+    def register_backend(self, partner: str, backend: PartnerBackend):
+        self.backends[partner] = backend
+
+    def backend_for(self, partner: str) -> PartnerBackend:
+        backend = self.backends.get(partner, self.default_backend)
+        if backend is None:
+            raise LookupError(f"no backend registered for {partner}")
+        return backend
+
+    def chain_for(self, task: ChainTask) -> List[str]:
+        if self.scheduler is not None:
+            return self.scheduler.chain(task.task_type)
+        return self.config.get_complementary_chain(task.task_type)
+
+    def plan(self, chain: List[str]) -> Dict[str, List[str]]:
+        """For each chain member, the earlier members it hands off from"""
+        partners = self.config.partners
+        return {name: [earlier for earlier in chain[:i]
+                       if name in partners.get(earlier, {}).get("complements", [])]
+                for i, name in enumerate(chain)}
+
+    def _limit(self, partner: str) -> asyncio.Semaphore:
+        # Created lazily so they bind to the running loop
+        if partner not in self._limits:
+            limit = self.config.partners.get(partner, {}).get("max_concurrency", DEFAULT_CONCURRENCY)
+            self._limits[partner] = asyncio.Semaphore(limit)
+        return self._limits[partner]
+
+    async def _dispatch(self, partner: str, task: ChainTask, context: List[PartnerResult],
+                        result: PartnerResult) -> Any:
+        """
+        A partner's response: from the cache when there is one, else one
+        backend call (shared by identical requests already in flight);
+        result.cached is set when no call of its own was made
+        """
+        if self.cache is None:
+            return await self._call(partner, task, context)
+        key = self.cache.key(partner, task, context)
+        missing = object()
+        value = self.cache.get(key, missing)
+        if value is not missing:
+            result.cached = True
+            return value
+        if key in self._inflight:
+            result.cached = True
+            return await asyncio.shield(self._inflight[key])
+        future = self._inflight[key] = asyncio.get_running_loop().create_future()
+        try:
+            value = await self._call(partner, task, context)
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # retrieved: waiters may be none
+            raise
+        else:
+            self.cache.put(key, value)
+            future.set_result(value)
+            return value
+        finally:
+            del self._inflight[key]
+
+    async def _call(self, partner: str, task: ChainTask, context: List[PartnerResult]) -> Any:
+        """One backend call under the partner's concurrency limit and timeout"""
+        timeout = self.config.partners.get(partner, {}).get("timeout", DEFAULT_TIMEOUT)
+        async with self._limit(partner):
+            return await asyncio.wait_for(self.backend_for(partner).call(partner, task, context), timeout)
+
+    async def _run_partner(self, partner: str, task: ChainTask, upstream: List["asyncio.Task"]) -> PartnerResult:
+        context = list(await asyncio.gather(*upstream)) if upstream else []
+        result = PartnerResult(partner, started=time.perf_counter())
+        failed = [r.partner for r in context if not r.ok]
+        if failed:
+            result.error = f"skipped: upstream failed ({', '.join(failed)})"
+        else:
+            try:
+                result.output = await self._dispatch(partner, task, context, result)
+            except TimeoutError:
+                result.error = "timeout"
+            except Exception as e:
+                result.error = f"{type(e).__name__}: {e}"
+        result.finished = time.perf_counter()
+        if self.scheduler is not None:
+            self.scheduler.record(result)
+        return result
+
+    async def run(self, task: ChainTask, chain: Optional[List[str]] = None) -> ChainRun:
+        """Run one task through its chain (or an explicit one)"""
+        chain = list(dict.fromkeys(chain or self.chain_for(task)))
+        plan = self.plan(chain)
+        started = time.perf_counter()
+        tasks: Dict[str, asyncio.Task] = {}
+        for name in chain:
+            tasks[name] = asyncio.ensure_future(
+                self._run_partner(name, task, [tasks[up] for up in plan[name]]))
+        results = dict(zip(chain, await asyncio.gather(*tasks.values())))
+        return ChainRun(task, chain, plan, results, time.perf_counter() - started)
+
+    async def run_many(self, tasks: List[ChainTask], concurrency: int = 64) -> List[ChainRun]:
+        """Run many tasks, at most `concurrency` chains in flight"""
+        gate = asyncio.Semaphore(concurrency)
+
+        async def one(task: ChainTask) -> ChainRun:
+            async with gate:
+                return await self.run(task)
+
+        return list(await asyncio.gather(*(one(t) for t in tasks)))
+
+def load_test(tasks: int = 1000, task_type: str = "architecture", latency: float = 0.02,
+              jitter: float = 0.005, error_rate: float = 0.0, concurrency: int = 64,
+              partner_concurrency: Optional[int] = None, seed: int = 0,
+              cache: Optional[ResponseCache] = None, distinct: Optional[int] = None) -> Dict:
+    """
+    Drive the chain engine with the stub backend and report throughput;
+    with a cache, prompts repeat over `distinct` variants. Latency includes
+    queueing: once `concurrency` chains outrun the per-partner limits
+    (limit / latency calls per second), p50 grows past the critical path
+    """
+    backend = StubBackend(latency=latency, jitter=jitter, error_rate=error_rate, seed=seed)
+    config = AIPartnerConfig()
+    if partner_concurrency:
+        for partner in config.partners.values():
+            partner["max_concurrency"] = partner_concurrency
+    engine = ChainEngine(config, default_backend=backend, cache=cache)
+    work = [ChainTask(task_type, f"load test #{i % distinct if distinct else i}") for i in range(tasks)]
+    started = time.perf_counter()
+    runs = asyncio.run(engine.run_many(work, concurrency))
+    elapsed = time.perf_counter() - started
+    latencies = sorted(r.elapsed for r in runs)
+    chain = runs[0].chain if runs else []
+    plan = runs[0].plan if runs else {}
+    depth: Dict[str, int] = {}
+    for name in chain:
+        depth[name] = 1 + max((depth[up] for up in plan[name]), default=0)
+    limits = {name: config.partners.get(name, {}).get("max_concurrency", DEFAULT_CONCURRENCY) for name in chain}
+    return {
+        "tasks": tasks,
+        "task_type": task_type,
+        "chain": chain,
+        "plan": plan,
+        "backend_calls": backend.calls,
+        "failed": sum(not r.ok for r in runs),
+        "elapsed_s": round(elapsed, 3),
+        "chains_per_s": round(tasks / elapsed, 1) if elapsed else None,
+        "p50_ms": round(latencies[len(latencies) // 2] * 1000, 2) if latencies else None,
+        "p99_ms": round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000, 2) if latencies else None,
+        "sequential_ms": round(latency * len(chain) * 1000, 2),
+        "critical_path_ms": round(latency * max(depth.values(), default=0) * 1000, 2),
+        "partner_limits": limits,
+        "saturation_chains_per_s": round(min(limits.values()) / latency, 1) if limits and latency else None,
+        "cache": cache.stats() if cache is not None else None,
+    }
+
+class PartnerStats:
+    """Rolling latency, error-rate and throughput of one partner's calls"""
+
+    def __init__(self, window: int = STATS_WINDOW, horizon: float = STATS_HORIZON):
+        self.calls = deque(maxlen=window)  # (finished monotonic, latency, ok)
+        self.horizon = horizon
+
+    def record(self, latency: float, ok: bool, now: Optional[float] = None):
+        self.calls.append((time.monotonic() if now is None else now, latency, ok))
+
+    def __len__(self) -> int:
+        return len(self.calls)
+
+    @property
+    def error_rate(self) -> float:
+        return sum(not ok for _, _, ok in self.calls) / len(self.calls) if self.calls else 0.0
+
+    @property
+    def latency(self) -> Optional[float]:
+        """Mean latency of successful calls"""
+        good = [latency for _, latency, ok in self.calls if ok]
+        return sum(good) / len(good) if good else None
+
+    def throughput(self, now: Optional[float] = None) -> float:
+        """Calls finished per second over the horizon"""
+        since = (time.monotonic() if now is None else now) - self.horizon
+        return sum(1 for finished, _, _ in self.calls if finished >= since) / self.horizon
+
+    def expected_cost(self) -> Optional[float]:
+        """Expected seconds to one successful call (retrying failures)"""
+        if self.latency is None:
+            return None
+        return self.latency / max(1.0 - self.error_rate, 0.05)
+
+    def to_dict(self) -> Dict:
+        return {"calls": len(self), "latency_ms": None if self.latency is None else round(self.latency * 1000, 2),
+                "error_rate": round(self.error_rate, 3), "throughput_per_s": round(self.throughput(), 2)}
+
+class AdaptiveScheduler:
+    """
+    Picks chain members from live partner statistics.
+
+    Starts from the static chain for the task type and, position by
+    position, may swap a member for one of its "alternates" (partners
+    whose strengths cover the same work) that is not already in the
+    chain; a member that takes a hand-off is only replaced by one that
+    complements an earlier chosen member too. Only enabled
+    partners are used. Among candidates with at least min_samples calls
+    the lowest expected cost wins; a member without data is kept, and a
+    small explore share of picks tries an under-sampled candidate so
+    alternatives get measured. With no data at all the static chain is
+    returned as is.
+    """
+
+    def __init__(self, config: AIPartnerConfig, min_samples: int = 5, explore: float = 0.05,
+                 enabled: Optional[List[str]] = None, seed: Optional[int] = None):
+        self.config = config
+        self.min_samples = min_samples
+        self.explore = explore
+        self.enabled = set(enabled) if enabled is not None else None
+        self.stats: Dict[str, PartnerStats] = {}
+        self.rng = random.Random(seed)
+
+    def is_enabled(self, partner: str) -> bool:
+        if self.enabled is not None:
+            return partner in self.enabled
+        return self.config.is_enabled(partner)
+
+    def record(self, result: PartnerResult):
+        if result.cached or (result.error and result.error.startswith("skipped")):
+            return  # no backend call of its own: says nothing about the partner
+        self.stats.setdefault(result.partner, PartnerStats()).record(result.latency, result.ok)
+
+    def cost(self, partner: str) -> Optional[float]:
+        stats = self.stats.get(partner)
+        if stats is None or len(stats) < self.min_samples:
+            return None
+        return stats.expected_cost()
+
+    def candidates(self, chain: List[str], i: int, chosen: List[str]) -> List[str]:
+        """Partners that can stand in for chain[i] given the members chosen so far"""
+        partners = self.config.partners
+        member = chain[i]
+        if member not in partners:
+            return [member]
+        takes_handoff = any(member in partners.get(p, {}).get("complements", []) for p in chain[:i])
+        out = [member]
+        for name in partners[member].get("alternates", []):
+            if name not in partners or name in chain or name in chosen:
+                continue
+            # A member that covers an earlier one's weakness must stay a hand-off
+            if takes_handoff and not any(name in partners.get(q, {}).get("complements", []) for q in chosen):
+                continue
+            out.append(name)
+        return out
+
+    def chain(self, task_type: str) -> List[str]:
+        static = self.config.get_complementary_chain(task_type)
+        chosen: List[str] = []
+        for i, member in enumerate(static):
+            options = [c for c in self.candidates(static, i, chosen) if self.is_enabled(c)]
+            if not options:
+                chosen.append(member)  # nothing enabled can replace it
+                continue
+            unmeasured = [c for c in options if self.cost(c) is None]
+            if unmeasured and self.explore and self.rng.random() < self.explore:
+                chosen.append(self.rng.choice(unmeasured))
+                continue
+            measured = [c for c in options if self.cost(c) is not None]
+            if (member in options and self.cost(member) is None) or not measured:
+                chosen.append(member if member in options else options[0])
+                continue
+            chosen.append(min(measured, key=self.cost))
+        return chosen
+
+    def report(self) -> Dict[str, Dict]:
+        return {name: stats.to_dict() for name, stats in sorted(self.stats.items())}
+
+class SyntheticBackend(StubBackend):
+    """
+    Stub backend drawing each partner's latency from a lognormal
+    distribution: profiles maps partner -> (median seconds, sigma, error rate)
+    """
+
+    def __init__(self, profiles: Dict[str, Tuple[float, float, float]], default=(0.02, 0.3, 0.0),
+                 seed: Optional[int] = None):
+        super().__init__(seed=seed)
+        self.profiles = profiles
+        self.default = default
+
+    async def call(self, partner: str, task: ChainTask, context: List[PartnerResult]) -> Any:
+        median, sigma, error_rate = self.profiles.get(partner, self.default)
+        self.latencies[partner] = median * self.rng.lognormvariate(0.0, sigma)
+        self.error_rate = error_rate
+        return await super().call(partner, task, context)
+
+# Synthetic partner profiles for simulate_scheduler: (median s, sigma, error rate)
+SIMULATED_PROFILES = {
+    "claude": (0.040, 0.3, 0.01),
+    "chatgpt": (0.030, 0.4, 0.02),
+    "ray": (0.060, 0.6, 0.10),
+    "gemini": (0.015, 0.3, 0.02),
+    "codeium": (0.010, 0.2, 0.01),
+    "perplexity": (0.020, 0.3, 0.02),
+    "cursor": (0.080, 0.5, 0.05),
+}
+
+def simulate_scheduler(tasks: int = 2000, task_types: Optional[List[str]] = None,
+                       profiles: Optional[Dict[str, Tuple[float, float, float]]] = None,
+                       concurrency: int = 64, seed: int = 0) -> Dict:
+    """Same synthetic workload through the static chains and the adaptive scheduler"""
+    task_types = task_types or ["architecture", "research", "coding", "verification",
+                                "creative", "manifestation", "observation"]
+    profiles = profiles or SIMULATED_PROFILES
+    rng = random.Random(seed)
+    work = [ChainTask(rng.choice(task_types), f"simulated #{i}") for i in range(tasks)]
+    report = {}
+    for mode in ("static", "adaptive"):
+        config = AIPartnerConfig()
+        scheduler = AdaptiveScheduler(config, enabled=list(config.partners), seed=seed) if mode == "adaptive" else None
+        engine = ChainEngine(config, default_backend=SyntheticBackend(profiles, seed=seed), scheduler=scheduler)
+        started = time.perf_counter()
+        runs = asyncio.run(engine.run_many(work, concurrency))
+        elapsed = time.perf_counter() - started
+        latencies = sorted(r.elapsed for r in runs)
+        report[mode] = {
+            "elapsed_s": round(elapsed, 3),
+            "chains_per_s": round(tasks / elapsed, 1),
+            "ok_ratio": round(sum(r.ok for r in runs) / tasks, 3),
+            "p50_ms": round(latencies[len(latencies) // 2] * 1000, 2),
+            "p99_ms": round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000, 2),
+        }
+        if scheduler:
+            report[mode]["partners"] = scheduler.report()
+            report[mode]["chains"] = {t: scheduler.chain(t) for t in task_types}
+    report["speedup"] = round(report["adaptive"]["chains_per_s"] / report["static"]["chains_per_s"], 2)
+    return report
+
 def main():
     """Configure AI partners for the DOJO"""
+    parser = argparse.ArgumentParser(description="Configure AI partners, or load-test the chain engine offline")
+    parser.add_argument("--load-test", type=int, metavar="TASKS", help="run TASKS chains through the stub backend")
+    parser.add_argument("--task-type", default="architecture")
+    parser.add_argument("--latency", type=float, default=0.02, help="stub latency per call (s)")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--concurrency", type=int, default=64, help="chains in flight")
+    parser.add_argument("--partner-concurrency", type=int, help="override every partner's max_concurrency")
+    parser.add_argument("--cache", action="store_true", help="load test through a ResponseCache")
+    parser.add_argument("--distinct", type=int, help="distinct prompts in the load test (repeats hit the cache)")
+    parser.add_argument("--simulate", type=int, metavar="TASKS",
+                        help="compare static chains with the adaptive scheduler on synthetic latencies")
+    args = parser.parse_args()
+    
+    if args.simulate:
+        report = simulate_scheduler(args.simulate, concurrency=args.concurrency)
+        print(f"⚡ Scheduler simulation: {args.simulate} chains, mixed task types")
+        for mode in ("static", "adaptive"):
+            r = report[mode]
+            print(f"   {mode:>8}: {r['chains_per_s']}/s, p50 {r['p50_ms']}ms, p99 {r['p99_ms']}ms, "
+                  f"{r['ok_ratio']:.1%} ok")
+        print(f"   Speedup: {report['speedup']}x")
+        for task_type, chain in report["adaptive"]["chains"].items():
+            print(f"   {task_type}: {' → '.join(chain)} (static: {' → '.join(AIPartnerConfig().get_complementary_chain(task_type))})")
+        return
+    
+    if args.load_test:
+        report = load_test(args.load_test, args.task_type, args.latency,
+                           error_rate=args.error_rate, concurrency=args.concurrency,
+                           partner_concurrency=args.partner_concurrency,
+                           cache=ResponseCache() if args.cache else None, distinct=args.distinct)
+        print(f"⚡ Chain engine load test: {report['task_type']} ({' → '.join(report['chain'])})")
+        print(f"   Plan: {json.dumps(report['plan'])}")
+        print(f"   {report['tasks']} chains in {report['elapsed_s']}s = {report['chains_per_s']}/s, "
+              f"{report['failed']} failed")
+        print(f"   Latency p50 {report['p50_ms']}ms, p99 {report['p99_ms']}ms "
+              f"(critical path {report['critical_path_ms']}ms, sequential {report['sequential_ms']}ms)")
+        saturation = report["saturation_chains_per_s"]
+        if saturation and args.concurrency > min(report["partner_limits"].values()):
+            print(f"   Per-partner limit {min(report['partner_limits'].values())} caps the engine at ~{saturation} chains/s; "
+                  f"with {args.concurrency} chains in flight the rest is queueing "
+                  f"(--partner-concurrency {args.concurrency} shows the unqueued latency)")
+        if report["cache"]:
+            print(f"   Cache: {json.dumps(report['cache'])} ({report['backend_calls']} backend calls)")
+        return
+    
     print("🌟 Configuring AI Partners for Sacred DOJO Manifestation...")
     
     config = AIPartnerConfig()
@@ -0,0 +1,363 @@
+#!/usr/bin/env python3
+"""
+FIELD Symbolic Scanner Benchmark
+Measure what the scanner costs per file so regressions show up as numbers, not feelings
+
+Suites:
+  matcher - per-file matching cost, legacy loop vs compiled matcher
+  scan    - a synthetic FIELD tree: full scan (cold and index-warm),
+            _analyze_file per file, and report generation, timed separately
+
+Runs offline; --json output carries the commit and settings so results
+from different commits can be compared directly.
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from functools import partial
+from pathlib import Path
+from typing import Dict, List, Any, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from FIELD_symbolic_scanner import FIELDSymbolicScanner
+from FIELD_report_stream import NDJSONReportWriter
+
+# Tokens seeded into synthetic sources - symbols, trident nodes, sacred numbers
+LIVING_TOKENS = [
+    "●", "▼", "▲", "◼", "⬡", "✦",
+    "OB1", "TATA", "ATLAS", "DOJO", "DOJOController",
+    "432.0", "0.85", "1.618",
+    "chakra", "energy", "frequency", "resonance",
+    "FIELD", "field", "sacred", "geometric", "harmony", "fractal"
+]
+
+SWIFT_LINES = [
+    "import SwiftUI",
+    "struct {name}View: View {{",
+    "    @State private var {name}Value: Double = {number}",
+    "    var body: some View {{ VStack {{ Text(\"{token}\") }} }}",
+    "    func update{name}(_ input: Double) -> Double {{ return input * {number} }}",
+    "    // {token} keeps the {token} loop aligned",
+    "}}"
+]
+
+TSX_LINES = [
+    "import React, {{ useState }} from 'react';",
+    "export const {name}Panel = ({{ value }}: {{ value: number }}) => {{",
+    "  const [{name}, set{name}] = useState<number>({number});",
+    "  return <div className=\"{name}\" data-node=\"{token}\">{{value * {number}}}</div>;",
+    "  // {token} resonance bridge for {name}",
+    "}};"
+]
+
+PY_LINES = [
+    "class {name}Processor:",
+    "    \"\"\"{token} stage of the {name} flow\"\"\"",
+    "    threshold = {number}",
+    "    def run(self, value: float) -> float:",
+    "        # {token} alignment check",
+    "        return value * {number}",
+    ""
+]
+
+MD_LINES = [
+    "## {name} {token}",
+    "",
+    "The {name} layer keeps {token} at {number} and hands off to the next node.",
+    "- status: {token}",
+    ""
+]
+
+# Spread of file types in a synthetic tree (weights roughly like FIELD-DEV)
+TREE_SUFFIXES = [(".swift", 3), (".py", 3), (".json", 1), (".md", 2), (".tsx", 2)]
+TEMPLATES = {".swift": SWIFT_LINES, ".py": PY_LINES, ".md": MD_LINES, ".tsx": TSX_LINES}
+STEMS = ["Orbit", "Pulse", "Carrier", "Gate", "Spiral", "Lattice", "Weave", "Resonance"]
+ROLES = ["", "", "", "Controller", "Manager", "Bridge", "Engine", "Processor"]
+
+def synthetic_source(template: List[str], target_bytes: int, seed: int = 432) -> str:
+    """Generate roughly target_bytes of source text seeded with living tokens"""
+    rng = random.Random(seed)
+    names = ["Orbit", "Pulse", "Carrier", "Gate", "Spiral", "Lattice", "Weave"]
+    lines = []
+    size = 0
+    while size < target_bytes:
+        for line in template:
+            token = rng.choice(LIVING_TOKENS) if rng.random() < 0.3 else "value"
+            text = line.format(name=rng.choice(names), number=rng.choice(["1", "2.5", "432", "0.85"]), token=token)
+            lines.append(text)
+            size += len(text) + 1
+    return "\n".join(lines)
+
+def synthetic_json(target_bytes: int, seed: int = 432) -> str:
+    """Generate roughly target_bytes of JSON config seeded with living tokens"""
+    rng = random.Random(seed)
+    entries = {}
+    size = 2
+    while size < target_bytes:
+        key = f"{rng.choice(STEMS).lower()}_{len(entries)}"
+        value = {"node": rng.choice(LIVING_TOKENS), "frequency": rng.choice([432.0, 528, 0.85, 1.618])}
+        entries[key] = value
+        size += len(json.dumps({key: value}))
+    return json.dumps(entries, indent=2)
+
+def build_tree(root: Path, files: int, depth: int, file_kb: float, seed: int = 432) -> Dict[str, Any]:
+    """
+    Write a synthetic FIELD tree under root: the scanner's key directories
+    plus plain source dirs, nested up to depth levels, holding files spread
+    over TREE_SUFFIXES. About half the files are backdated past the 7-day
+    breathing window, and a node_modules/.git pair is added that the walk
+    should skip. Returns a description of what was built.
+    """
+    rng = random.Random(seed)
+    tops = ["◼_dojo", "DOJO-App", "sacred_repositories", "config", "monitoring", "src", "docs"]
+    
+    directories = []
+    for top in tops:
+        directories.append(root / top)
+    for i in range(max(1, files // 25)):
+        path = root / rng.choice(tops)
+        for level in range(rng.randint(1, max(1, depth))):
+            path = path / f"layer{level}_{rng.randint(0, 3)}"
+        directories.append(path)
+    
+    suffixes = [suffix for suffix, _ in TREE_SUFFIXES]
+    weights = [weight for _, weight in TREE_SUFFIXES]
+    old = time.time() - 30 * 24 * 3600
+    total_bytes = 0
+    for i in range(files):
+        directory = rng.choice(directories)
+        directory.mkdir(parents=True, exist_ok=True)
+        suffix = rng.choices(suffixes, weights)[0]
+        target = int(file_kb * 1024 * rng.uniform(0.5, 1.5))
+        if suffix == ".json":
+            content = synthetic_json(target, seed + i)
+        else:
+            content = synthetic_source(TEMPLATES[suffix], target, seed + i)
+        file_path = directory / f"{rng.choice(STEMS)}{rng.choice(ROLES)}{i}{suffix}"
+        file_path.write_text(content, encoding="utf-8")
+        total_bytes += len(content.encode("utf-8"))
+        if rng.random() < 0.5:
+            os.utime(file_path, (old, old))
+    
+    # Noise the scanner must not descend into
+    for noise in ("node_modules/pkg", ".git/objects"):
+        (root / noise).mkdir(parents=True, exist_ok=True)
+        (root / noise / "index.tsx").write_text(synthetic_source(TSX_LINES, 2048, seed), encoding="utf-8")
+    
+    return {"files": files, "depth": depth, "file_kb": file_kb, "directories": len(set(directories)),
+            "bytes": total_bytes, "seed": seed}
+
+def legacy_features(scanner: FIELDSymbolicScanner, content: str) -> Dict[str, Any]:
+    """The original per-pattern _analyze_file matching loop, kept as the baseline"""
+    features = {"sacred_symbols": [], "living_patterns": []}
+    for symbol, meaning in scanner.sacred_symbols.items():
+        if symbol in content:
+            features["sacred_symbols"].append({"symbol": symbol, "meaning": meaning})
+    for pattern_name, pattern_regex in scanner.living_patterns.items():
+        matches = re.findall(pattern_regex, content, re.IGNORECASE)
+        if matches:
+            features["living_patterns"].append({
+                "pattern": pattern_name,
+                "matches": len(matches),
+                "examples": matches[:3]
+            })
+    return features
+
+def best_of(fn, repeat: int) -> float:
+    """Fastest wall time of fn over repeat runs, in seconds"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def best_and_result(fn, repeat: int):
+    """(fastest wall time in seconds, last return value) of fn over repeat runs"""
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+def benchmark_matcher(size_mb: float, repeat: int) -> List[Dict[str, Any]]:
+    """Per-file matching cost of the legacy loop vs the compiled matcher"""
+    scanner = FIELDSymbolicScanner("/nonexistent")
+    target = int(size_mb * 1024 * 1024)
+    samples = {
+        ".swift": synthetic_source(SWIFT_LINES, target),
+        ".tsx": synthetic_source(TSX_LINES, target)
+    }
+
+    results = []
+    for suffix, content in samples.items():
+        # Postings for the pattern index are extra output the legacy loop never had
+        features = scanner.matcher.scan(content)
+        features.pop("postings", None)
+        if legacy_features(scanner, content) != features:
+            raise AssertionError(f"matcher output differs from legacy loop on {suffix}")
+        legacy = best_of(partial(legacy_features, scanner, content), repeat)
+        compiled = best_of(partial(scanner.matcher.scan, content), repeat)
+        results.append({
+            "benchmark": "matcher",
+            "suffix": suffix,
+            "bytes": len(content.encode("utf-8")),
+            "legacy_ms": round(legacy * 1000, 3),
+            "compiled_ms": round(compiled * 1000, 3),
+            "speedup": round(legacy / compiled, 2) if compiled else None
+        })
+    return results
+
+def benchmark_scan(root: Path, repeat: int, jobs: int) -> List[Dict[str, Any]]:
+    """Time the scan, per-file analysis and report generation on the tree at root"""
+    results = []
+    
+    def scan_cold():
+        return FIELDSymbolicScanner(root, workers=jobs).scan_living_architecture()
+    
+    elapsed, report = best_and_result(scan_cold, repeat)
+    results.append({"benchmark": "scan_living_architecture", "mode": "cold", "jobs": jobs,
+                    "ms": round(elapsed * 1000, 3),
+                    "breathing_files": len(report["breathing_files"]),
+                    "spine_candidates": len(report["field_spine_candidates"])})
+    
+    # Warm: every file served from the scan index (built by an untimed first run)
+    with tempfile.TemporaryDirectory() as index_dir:
+        index_path = Path(index_dir) / "scan_index.sqlite"
+        FIELDSymbolicScanner(root, index_path=index_path, workers=jobs).scan_living_architecture()
+        elapsed, _ = best_and_result(
+            lambda: FIELDSymbolicScanner(root, index_path=index_path, workers=jobs).scan_living_architecture(),
+            repeat)
+        results.append({"benchmark": "scan_living_architecture", "mode": "index_warm", "jobs": jobs,
+                        "ms": round(elapsed * 1000, 3)})
+    
+    # _analyze_file on its own, once per scannable file
+    scanner = FIELDSymbolicScanner(root)
+    paths = [p for p in root.rglob("*")
+             if p.suffix in scanner.scan_suffixes and p.is_file()
+             and not any(part.startswith(".") or part == "node_modules" for part in p.relative_to(root).parts)]
+    timings = []
+    for path in paths:
+        start = time.perf_counter()
+        scanner._analyze_file(path)
+        timings.append(time.perf_counter() - start)
+    timings.sort()
+    if timings:
+        results.append({"benchmark": "_analyze_file", "files": len(timings),
+                        "total_ms": round(sum(timings) * 1000, 3),
+                        "mean_us": round(sum(timings) / len(timings) * 1e6, 1),
+                        "p95_us": round(timings[min(len(timings) - 1, int(len(timings) * 0.95))] * 1e6, 1),
+                        "max_us": round(timings[-1] * 1e6, 1)})
+    
+    # Report generation, from the in-memory results
+    elapsed, text = best_and_result(lambda: scanner.generate_weave_report(report), repeat)
+    results.append({"benchmark": "generate_weave_report", "ms": round(elapsed * 1000, 3), "chars": len(text)})
+    elapsed, text = best_and_result(lambda: json.dumps(report, indent=2), repeat)
+    results.append({"benchmark": "json_report", "format": "json", "ms": round(elapsed * 1000, 3),
+                    "bytes": len(text.encode("utf-8"))})
+    elapsed, text = best_and_result(lambda: json.dumps(report, separators=(",", ":")), repeat)
+    results.append({"benchmark": "json_report", "format": "json_compact", "ms": round(elapsed * 1000, 3),
+                    "bytes": len(text.encode("utf-8"))})
+    
+    def ndjson():
+        with open(os.devnull, "w") as f:
+            NDJSONReportWriter(f, compact=True).finish(report)
+    
+    elapsed, _ = best_and_result(ndjson, repeat)
+    results.append({"benchmark": "json_report", "format": "ndjson", "ms": round(elapsed * 1000, 3)})
+    
+    return results
+
+def git_commit() -> Optional[str]:
+    """Current commit of the checkout, when it is a git work tree"""
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              cwd=Path(__file__).resolve().parent, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def print_results(results: List[Dict[str, Any]]):
+    matcher = [r for r in results if r["benchmark"] == "matcher"]
+    if matcher:
+        print("\n⬡ Symbolic matcher - per-file cost\n")
+        for r in matcher:
+            print(f"   {r['suffix']:<7} {r['bytes'] / 1e6:6.2f} MB   legacy {r['legacy_ms']:9.2f} ms"
+                  f"   compiled {r['compiled_ms']:9.2f} ms   ×{r['speedup']}")
+    
+    scan = [r for r in results if r["benchmark"] != "matcher"]
+    if scan:
+        print("\n◼ Synthetic tree scan\n")
+        for r in scan:
+            if r["benchmark"] == "_analyze_file":
+                print(f"   {'_analyze_file':<28} {r['files']} files   mean {r['mean_us']:.0f} µs"
+                      f"   p95 {r['p95_us']:.0f} µs   max {r['max_us']:.0f} µs")
+            else:
+                label = r["benchmark"] + (f" ({r.get('mode') or r.get('format')})" if r.get("mode") or r.get("format") else "")
+                print(f"   {label:<40} {r['ms']:10.2f} ms")
+    print()
+
+def main():
+    parser = argparse.ArgumentParser(description="FIELD symbolic scanner benchmark")
+    parser.add_argument("--suite", choices=["matcher", "scan", "all"], default="all",
+                        help="which benchmarks to run")
+    parser.add_argument("--size-mb", type=float, default=2.0, help="size of each synthetic source file (matcher)")
+    parser.add_argument("--files", type=int, default=500, help="files in the synthetic tree (scan)")
+    parser.add_argument("--depth", type=int, default=4, help="maximum directory nesting of the tree (scan)")
+    parser.add_argument("--file-kb", type=float, default=8.0, help="average file size in the tree (scan)")
+    parser.add_argument("--seed", type=int, default=432, help="seed for the synthetic tree")
+    parser.add_argument("--jobs", type=int, default=1, help="scanner worker processes (scan)")
+    parser.add_argument("--tree", default=None,
+                        help="build the tree here and keep it (default: a temporary directory)")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per measurement (best is kept)")
+    parser.add_argument("--json", action="store_true", help="print machine-readable results")
+    parser.add_argument("--output", default=None, help="also write the JSON results to this file")
+    args = parser.parse_args()
+
+    results = []
+    tree = None
+    if args.suite in ("matcher", "all"):
+        results += benchmark_matcher(args.size_mb, args.repeat)
+    if args.suite in ("scan", "all"):
+        root = Path(args.tree) if args.tree else Path(tempfile.mkdtemp(prefix="field_bench_"))
+        try:
+            if args.tree is None or not root.exists() or not any(root.iterdir()):
+                tree = build_tree(root, args.files, args.depth, args.file_kb, args.seed)
+            results += benchmark_scan(root, args.repeat, args.jobs)
+        finally:
+            if args.tree is None:
+                shutil.rmtree(root, ignore_errors=True)
+
+    output = {
+        "meta": {
+            "commit": git_commit(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "repeat": args.repeat,
+            "tree": tree
+        },
+        "results": results
+    }
+    if args.output:
+        Path(args.output).write_text(json.dumps(output, indent=2) + "\n")
+    if args.json:
+        print(json.dumps(output, indent=2))
+        return
+
+    print_results(results)
+
+if __name__ == "__main__":
+    main()
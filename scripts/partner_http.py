@@ -0,0 +1,543 @@
+#!/usr/bin/env python3
+"""
+Partner HTTP Client Layer - Pooled, Rate-Limited Connections per api_env
+One shared client per partner API key: keep-alive connection pools, token
+bucket rate limiting from partner config, jittered retry and batching.
+A local stand-in server makes the whole layer testable offline.
+"""
+
+import argparse
+import asyncio
+import http.client
+import json
+import os
+import queue
+import random
+import select
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+try:
+    from .ai_partners_config import (AIPartnerConfig, ChainTask, PartnerBackend, PartnerResult,
+                                     DEFAULT_CONCURRENCY)
+except ImportError:  # run as a script from scripts/
+    from ai_partners_config import (AIPartnerConfig, ChainTask, PartnerBackend, PartnerResult,
+                                    DEFAULT_CONCURRENCY)
+
+# Known endpoints per api_env; others need "base_url" in the partner
+# definition or <API_ENV minus _API_KEY>_BASE_URL in the environment
+DEFAULT_BASE_URLS = {
+    "ANTHROPIC_API_KEY": "https://api.anthropic.com",
+    "OPENAI_API_KEY": "https://api.openai.com",
+    "GEMINI_API_KEY": "https://generativelanguage.googleapis.com",
+    "PERPLEXITY_API_KEY": "https://api.perplexity.ai",
+}
+# Header carrying the key, per api_env (default: Authorization: Bearer <key>)
+AUTH_HEADERS = {
+    "ANTHROPIC_API_KEY": ("x-api-key", "{key}"),
+    "GEMINI_API_KEY": ("x-goog-api-key", "{key}"),
+}
+DEFAULT_RATE = 5.0       # requests per second, unless the partner sets "rate_limit"
+DEFAULT_BURST = 10       # bucket size, unless the partner sets "burst"
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+# Safe to send twice; anything else is retried only when it never left
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE", "TRACE"}
+
+class PartnerHTTPError(Exception):
+    """A partner answered with an error status (after any retries)"""
+
+    def __init__(self, status: int, body: bytes, partner: str = ""):
+        super().__init__(f"{partner or 'partner'} returned HTTP {status}: {body[:200]!r}")
+        self.status = status
+        self.body = body
+
+class ConnectFailed(ConnectionError):
+    """The connection could not be opened, so the request was never sent"""
+
+class TokenBucket:
+    """
+    Thread-safe token bucket: `rate` tokens per second up to `burst`.
+    throttle() (on a 429) empties it for the Retry-After and halves the
+    rate for every caller; recover() (on success) adds back a hundredth of
+    the configured rate, so clients settle just under what the server allows
+    """
+
+    def __init__(self, rate: Optional[float], burst: int = 1):
+        self.limit = rate
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self.lock = threading.Lock()
+
+    def _refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def try_acquire(self, n: int = 1) -> bool:
+        if not self.rate:
+            return True
+        with self.lock:
+            now = time.monotonic()
+            if now < self.paused_until:
+                return False
+            self._refill(now)
+            if self.tokens >= n:
+                self.tokens -= n
+                return True
+            return False
+
+    def acquire(self, n: int = 1) -> float:
+        """Block until n tokens are available; returns seconds waited"""
+        if not self.rate:
+            return 0.0
+        waited = 0.0
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                if now < self.paused_until:
+                    wait = self.paused_until - now
+                else:
+                    self._refill(now)
+                    if self.tokens >= n:
+                        self.tokens -= n
+                        return waited
+                    wait = (n - self.tokens) / self.rate
+            time.sleep(wait)
+            waited += wait
+
+    def throttle(self, pause: Optional[float] = None):
+        if not self.rate:
+            return
+        with self.lock:
+            now = time.monotonic()
+            self._refill(max(now, self.updated))
+            self.rate = max(self.limit / 64, self.rate / 2)
+            if pause:
+                self.paused_until = max(self.paused_until, now + pause)
+                self.updated = max(now, self.paused_until)
+            self.tokens = 0.0
+
+    def recover(self):
+        if self.rate and self.rate < self.limit:
+            with self.lock:
+                self.rate = min(self.limit, self.rate + self.limit / 100)
+
+class ConnectionPool:
+    """
+    Keep-alive HTTP(S) connections to one origin, at most max_connections
+    open. Idle connections the server has closed are dropped before use;
+    one that turns out stale mid-request is retried once on a fresh
+    connection, for idempotent methods only. Failing to connect raises
+    ConnectFailed
+    """
+
+    def __init__(self, base_url: str, max_connections: int = DEFAULT_CONCURRENCY, timeout: float = 30.0):
+        parts = urlsplit(base_url)
+        self.https = parts.scheme == "https"
+        self.host = parts.hostname
+        self.port = parts.port
+        self.prefix = parts.path.rstrip("/")
+        self.timeout = timeout
+        self.idle: "queue.LifoQueue[http.client.HTTPConnection]" = queue.LifoQueue()
+        self.slots = threading.BoundedSemaphore(max_connections)
+        self.opened = 0
+        self.lock = threading.Lock()
+
+    def _connect(self) -> http.client.HTTPConnection:
+        with self.lock:
+            self.opened += 1
+        cls = http.client.HTTPSConnection if self.https else http.client.HTTPConnection
+        return cls(self.host, self.port, timeout=self.timeout)
+
+    @staticmethod
+    def _dropped(conn: http.client.HTTPConnection) -> bool:
+        # An idle connection with something to read has been closed (or
+        # answered out of turn) by the server
+        if conn.sock is None:
+            return True
+        try:
+            return bool(select.select([conn.sock], [], [], 0)[0])
+        except (OSError, ValueError):
+            return True
+
+    def _checkout(self) -> Tuple[http.client.HTTPConnection, bool]:
+        while True:
+            try:
+                conn = self.idle.get_nowait()
+            except queue.Empty:
+                return self._connect(), False
+            if not self._dropped(conn):
+                return conn, True
+            conn.close()
+
+    def _exchange(self, conn, method, path, body, headers) -> Tuple[int, Dict[str, str], bytes, bool]:
+        if conn.sock is None:
+            try:
+                conn.connect()
+            except OSError as e:
+                raise ConnectFailed(f"{self.host}:{self.port}: {e}") from e
+        conn.request(method, self.prefix + path, body=body, headers=headers)
+        response = conn.getresponse()
+        data = response.read()
+        return response.status, {k.lower(): v for k, v in response.getheaders()}, data, response.will_close
+
+    def request(self, method: str, path: str, body: Optional[bytes] = None,
+                headers: Optional[Dict[str, str]] = None,
+                idempotent: Optional[bool] = None) -> Tuple[int, Dict[str, str], bytes]:
+        if idempotent is None:
+            idempotent = method.upper() in IDEMPOTENT_METHODS
+        with self.slots:
+            conn, reused = self._checkout()
+            try:
+                try:
+                    status, head, data, closing = self._exchange(conn, method, path, body, headers or {})
+                except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                    if not reused or not idempotent:
+                        raise  # the server may have acted on it
+                    conn.close()  # stale keep-alive connection
+                    conn = self._connect()
+                    status, head, data, closing = self._exchange(conn, method, path, body, headers or {})
+            except BaseException:
+                conn.close()
+                raise
+            if closing:
+                conn.close()
+            else:
+                self.idle.put(conn)
+            return status, head, data
+
+    def close(self):
+        while True:
+            try:
+                self.idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+def retry_after_seconds(value: Optional[str]) -> Optional[float]:
+    """Retry-After as seconds (delta-seconds, fractional allowed, or HTTP date)"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+class PartnerClient:
+    """
+    Shared HTTP client for one partner api_env.
+
+    Every request takes a token from the bucket, goes out on a pooled
+    keep-alive connection and is retried on 429, 5xx and failures to
+    connect with full-jitter exponential backoff (or the Retry-After); a
+    429 pauses the whole bucket for its Retry-After and lowers its rate, so
+    concurrent callers back off together. Other connection errors and
+    timeouts are retried only for idempotent methods, or when the caller
+    passes an idempotency_key (sent as Idempotency-Key) - a POST that timed
+    out waiting for its response may already have been acted on. batch() packs
+    payloads into batch_path requests when the partner supports batching,
+    else sends them concurrently. a*-methods run on the client's own thread
+    pool, one thread per pooled connection.
+    """
+
+    def __init__(self, name: str, base_url: str, api_key: Optional[str] = None,
+                 auth: Tuple[str, str] = ("Authorization", "Bearer {key}"),
+                 rate: Optional[float] = DEFAULT_RATE, burst: int = DEFAULT_BURST,
+                 max_connections: int = DEFAULT_CONCURRENCY, retries: int = 4,
+                 backoff: float = 0.25, max_backoff: float = 8.0, timeout: float = 30.0,
+                 batch_path: Optional[str] = None, batch_size: int = 1, seed: Optional[int] = None):
+        self.name = name
+        self.pool = ConnectionPool(base_url, max_connections, timeout)
+        self.bucket = TokenBucket(rate, burst)
+        self.headers = {"Content-Type": "application/json", "Accept": "application/json"}
+        if api_key:
+            self.headers[auth[0]] = auth[1].format(key=api_key)
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.batch_path = batch_path
+        self.batch_size = max(1, batch_size)
+        self.rng = random.Random(seed)
+        self.executor = ThreadPoolExecutor(max_connections, thread_name_prefix=f"http-{name}")
+        self.metrics = {"requests": 0, "retries": 0, "throttled": 0, "errors": 0, "batches": 0, "rate_wait_s": 0.0}
+        self.metrics_lock = threading.Lock()
+
+    def _count(self, key: str, amount=1):
+        with self.metrics_lock:
+            self.metrics[key] += amount
+
+    def request(self, method: str, path: str, payload: Any = None, idempotency_key: Optional[str] = None) -> Any:
+        """One JSON request (with retries); returns the decoded response body"""
+        body = None if payload is None else json.dumps(payload).encode()
+        headers = self.headers
+        if idempotency_key is not None:
+            headers = dict(headers, **{"Idempotency-Key": idempotency_key})
+        idempotent = idempotency_key is not None or method.upper() in IDEMPOTENT_METHODS
+        for attempt in range(self.retries + 1):
+            self._count("rate_wait_s", self.bucket.acquire())
+            self._count("requests")
+            retry_after = paused = None
+            try:
+                status, head, data = self.pool.request(method, path, body, headers, idempotent)
+            except (OSError, http.client.HTTPException) as e:
+                error: Exception = e
+                if not idempotent and not isinstance(e, ConnectFailed):
+                    self._count("errors")
+                    raise
+            else:
+                if status < 400:
+                    self.bucket.recover()
+                    return json.loads(data) if data else None
+                error = PartnerHTTPError(status, data, self.name)
+                if status not in RETRY_STATUSES:
+                    self._count("errors")
+                    raise error
+                retry_after = retry_after_seconds(head.get("retry-after"))
+                if status == 429:
+                    self._count("throttled")
+                    self.bucket.throttle(retry_after)
+                    paused = self.bucket.rate
+            if attempt == self.retries:
+                self._count("errors")
+                raise error
+            self._count("retries")
+            if retry_after is None:
+                time.sleep(self.rng.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt)))
+            elif not paused:  # else the bucket waits it out for every caller
+                time.sleep(retry_after)
+
+    def batch(self, path: str, payloads: List[Any]) -> List[Any]:
+        """Responses for many payloads, in order"""
+        if self.batch_path and self.batch_size > 1:
+            out: List[Any] = []
+            chunks = [payloads[i:i + self.batch_size] for i in range(0, len(payloads), self.batch_size)]
+            for response in self.executor.map(
+                    lambda chunk: self.request("POST", self.batch_path, {"requests": chunk}), chunks):
+                self._count("batches")
+                out.extend(response["responses"])
+            return out
+        return list(self.executor.map(lambda p: self.request("POST", path, p), payloads))
+
+    async def arequest(self, method: str, path: str, payload: Any = None,
+                       idempotency_key: Optional[str] = None) -> Any:
+        return await asyncio.get_running_loop().run_in_executor(
+            self.executor, self.request, method, path, payload, idempotency_key)
+
+    async def abatch(self, path: str, payloads: List[Any]) -> List[Any]:
+        # batch() fans out on the executor itself, so wait for it on a plain thread
+        return await asyncio.to_thread(self.batch, path, payloads)
+
+    def stats(self) -> Dict:
+        return dict(self.metrics, rate_wait_s=round(self.metrics["rate_wait_s"], 3),
+                    connections_opened=self.pool.opened)
+
+    def close(self):
+        self.executor.shutdown(wait=True)
+        self.pool.close()
+
+class ClientRegistry:
+    """
+    One PartnerClient per api_env, configured from the partner definition:
+    base_url, rate_limit (requests/s), burst, max_connections (else
+    max_concurrency), batch_path and batch_size
+    """
+
+    def __init__(self, config: Optional[AIPartnerConfig] = None, env: Optional[Dict[str, str]] = None):
+        self.config = config or AIPartnerConfig()
+        self.env = os.environ if env is None else env
+        self.clients: Dict[str, PartnerClient] = {}
+        self.lock = threading.Lock()
+
+    def base_url(self, partner: Dict) -> str:
+        api_env = partner["api_env"]
+        prefix = api_env[:-len("_API_KEY")] if api_env.endswith("_API_KEY") else api_env
+        url = partner.get("base_url") or self.env.get(f"{prefix}_BASE_URL") or DEFAULT_BASE_URLS.get(api_env)
+        if not url:
+            raise LookupError(f"no base URL for {api_env}: set base_url or {prefix}_BASE_URL")
+        return url
+
+    def client(self, name: str) -> PartnerClient:
+        partner = self.config.partners[name]
+        api_env = partner["api_env"]
+        with self.lock:
+            if api_env not in self.clients:
+                self.clients[api_env] = PartnerClient(
+                    name, self.base_url(partner), self.env.get(api_env),
+                    auth=AUTH_HEADERS.get(api_env, ("Authorization", "Bearer {key}")),
+                    rate=partner.get("rate_limit", DEFAULT_RATE),
+                    burst=partner.get("burst", DEFAULT_BURST),
+                    max_connections=partner.get("max_connections", partner.get("max_concurrency", DEFAULT_CONCURRENCY)),
+                    timeout=partner.get("timeout", 30.0),
+                    batch_path=partner.get("batch_path"),
+                    batch_size=partner.get("batch_size", 1))
+            return self.clients[api_env]
+
+    def stats(self) -> Dict[str, Dict]:
+        return {api_env: client.stats() for api_env, client in self.clients.items()}
+
+    def close(self):
+        with self.lock:
+            for client in self.clients.values():
+                client.close()
+            self.clients.clear()
+
+def default_request(partner: str, task: ChainTask, context: List[PartnerResult]) -> Dict:
+    return {"partner": partner, "task_type": task.task_type, "prompt": task.prompt,
+            "payload": task.payload, "context": [{"partner": r.partner, "output": r.output} for r in context]}
+
+class HTTPBackend(PartnerBackend):
+    """
+    ChainEngine backend over the shared clients: POSTs build(partner, task,
+    context) to `path`. Provider-specific request shapes plug in through build
+    """
+
+    def __init__(self, registry: Optional[ClientRegistry] = None, path: str = "/v1/chain", build=default_request):
+        self.registry = registry or ClientRegistry()
+        self.path = path
+        self.build = build
+
+    async def call(self, partner: str, task: ChainTask, context: List[PartnerResult]) -> Any:
+        return await self.registry.client(partner).arequest("POST", self.path, self.build(partner, task, context))
+
+class StandInServer:
+    """
+    Local HTTP/1.1 keep-alive server standing in for a partner API: echoes
+    JSON, answers POST /batch as {"responses": [...]}, optionally sleeps
+    `latency` and enforces its own token bucket with 429 + Retry-After
+    """
+
+    def __init__(self, rate: Optional[float] = None, burst: int = 1, latency: float = 0.0):
+        self.limiter = TokenBucket(rate, burst)
+        self.latency = latency
+        self.counts = {"requests": 0, "throttled": 0, "connections": 0, "batches": 0}
+        self.lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True  # headers and body go out in separate writes
+
+            def setup(self):
+                super().setup()
+                server._count("connections")
+
+            def log_message(self, *args):
+                pass
+
+            def reply(self, status: int, obj: Any, headers: Optional[Dict[str, str]] = None):
+                body = json.dumps(obj).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                for k, v in (headers or {}).items():
+                    self.send_header(k, v)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_POST(self):
+                data = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+                server._count("requests")
+                if not server.limiter.try_acquire():
+                    server._count("throttled")
+                    retry = 1 / server.limiter.rate
+                    self.reply(429, {"error": "rate limited"}, {"Retry-After": f"{retry:.3f}"})
+                    return
+                if server.latency:
+                    time.sleep(server.latency)
+                payload = json.loads(data) if data else None
+                if self.path.endswith("/batch"):
+                    server._count("batches")
+                    self.reply(200, {"responses": [{"echo": p} for p in payload["requests"]]})
+                else:
+                    self.reply(200, {"echo": payload})
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.httpd.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        self.thread = threading.Thread(target=self.httpd.serve_forever, name="stand-in", daemon=True)
+
+    def _count(self, key: str):
+        with self.lock:
+            self.counts[key] += 1
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+def bench(requests: int = 2000, server_rate: float = 400.0, client_rate: Optional[float] = None,
+          connections: int = 8, latency: float = 0.002, batch_size: int = 1) -> Dict:
+    """
+    Sustained throughput against a rate-limited stand-in: the pooled,
+    bucketed client vs. a naive one (new connection per request, no limiter)
+    """
+    client_rate = server_rate if client_rate is None else client_rate
+    burst = max(1, int(server_rate / 10))
+    report = {}
+    with StandInServer(server_rate, burst, latency) as server:
+        client = PartnerClient("bench", server.url, rate=client_rate, burst=burst, max_connections=connections,
+                               batch_path="/batch" if batch_size > 1 else None, batch_size=batch_size, seed=0)
+        started = time.perf_counter()
+        client.batch("/echo", [{"n": i} for i in range(requests)])
+        elapsed = time.perf_counter() - started
+        client.close()
+        report["pooled"] = dict(client.stats(), elapsed_s=round(elapsed, 3),
+                                per_s=round(requests / elapsed, 1), server=dict(server.counts))
+
+    with StandInServer(server_rate, burst, latency) as server:
+        def naive(i: int) -> int:
+            parts = urlsplit(server.url)
+            conn = http.client.HTTPConnection(parts.hostname, parts.port, timeout=30)
+            try:
+                conn.request("POST", "/echo", body=json.dumps({"n": i}), headers={"Content-Type": "application/json"})
+                response = conn.getresponse()
+                response.read()
+                return response.status
+            finally:
+                conn.close()
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(connections) as pool:
+            statuses = list(pool.map(naive, range(requests)))
+        elapsed = time.perf_counter() - started
+        ok = sum(s == 200 for s in statuses)
+        report["naive"] = {"ok": ok, "throttled": requests - ok, "elapsed_s": round(elapsed, 3),
+                           "ok_per_s": round(ok / elapsed, 1), "server": dict(server.counts)}
+    return report
+
+def main():
+    """Benchmark the client layer against the local stand-in server"""
+    parser = argparse.ArgumentParser(description="Pooled, rate-limited partner HTTP clients")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--server-rate", type=float, default=400.0, help="stand-in limit (requests/s)")
+    parser.add_argument("--client-rate", type=float, help="client bucket rate (default: the server's)")
+    parser.add_argument("--connections", type=int, default=8)
+    parser.add_argument("--latency", type=float, default=0.002, help="stand-in latency per request (s)")
+    parser.add_argument("--batch-size", type=int, default=1, help=">1 packs requests into POST /batch")
+    args = parser.parse_args()
+
+    print(f"⚡ Partner HTTP client vs. stand-in limited to {args.server_rate:g} req/s")
+    report = bench(args.requests, args.server_rate, args.client_rate, args.connections,
+                   args.latency, args.batch_size)
+    pooled, naive = report["pooled"], report["naive"]
+    print(f"   Pooled: {args.requests} ok in {pooled['elapsed_s']}s = {pooled['per_s']}/s, "
+          f"{pooled['throttled']} throttled, {pooled['retries']} retries, "
+          f"{pooled['connections_opened']} connections, {pooled['server']['requests']} HTTP requests")
+    print(f"   Naive:  {naive['ok']} ok, {naive['throttled']} throttled (429) in {naive['elapsed_s']}s, "
+          f"{naive['server']['connections']} connections")
+
+if __name__ == "__main__":
+    main()
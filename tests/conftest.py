@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Repo root, so tests import FIELD_symbolic_scanner, FIELD.petals.la_paz.* and scripts.*
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,189 @@
+import asyncio
+
+import pytest
+
+from scripts import ai_partners_config
+from scripts.ai_partners_config import (AdaptiveScheduler, AIPartnerConfig, ChainEngine, ChainTask, PartnerResult,
+                                        ResponseCache, StubBackend)
+
+
+@pytest.fixture(params=["numpy", "pure"])
+def config(request, monkeypatch):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(ai_partners_config, "np", None)
+    return AIPartnerConfig()
+
+
+def test_resonance_matrix_matches_pairwise(config):
+    names, matrix = config.resonance_matrix()
+    assert names == list(config.partners)
+    for i, a in enumerate(names):
+        for j, b in enumerate(names):
+            assert float(matrix[i][j]) == pytest.approx(config.calculate_harmonic_resonance(a, b), abs=1e-12)
+
+
+def test_resonance_matrix_rebuilt_when_partners_change(config):
+    first = config.resonance_matrix()
+    assert config.resonance_matrix()[1] is first[1]  # cached while the partners stay the same
+    config.partners["claude"]["frequency"] = 700
+    names, matrix = config.resonance_matrix()
+    i, j = names.index("claude"), names.index("chatgpt")
+    assert float(matrix[i][j]) == pytest.approx(config.calculate_harmonic_resonance("claude", "chatgpt"))
+    top = config.top_resonant("claude", n=len(names))
+    assert [name for name, _ in top] == sorted((n for n in names if n != "claude"),
+                                               key=lambda n: -config.calculate_harmonic_resonance("claude", n))
+
+
+class FailingBackend(StubBackend):
+    def __init__(self, fail, **kwargs):
+        super().__init__(**kwargs)
+        self.fail = fail
+        self.seen = []
+
+    async def call(self, partner, task, context):
+        self.seen.append(partner)
+        if partner in self.fail:
+            raise RuntimeError(f"{partner} down")
+        return await super().call(partner, task, context)
+
+
+def test_engine_runs_independent_partners_in_parallel():
+    engine = ChainEngine(AIPartnerConfig(), default_backend=StubBackend(latency=0.1))
+    run = asyncio.run(engine.run(ChainTask("architecture", "design it")))
+    assert run.chain == ["claude", "chatgpt", "cursor"]
+    assert run.plan == {"claude": [], "chatgpt": ["claude"], "cursor": []}
+    assert run.ok
+    assert run.results["chatgpt"].output["handoff_from"] == ["claude"]
+    assert run.results["cursor"].started < run.results["claude"].finished  # didn't wait for claude
+    assert run.results["chatgpt"].started >= run.results["claude"].finished
+    assert run.elapsed < 0.28  # critical path 2 x 100ms, not 3 x 100ms
+
+
+def test_engine_skips_partners_whose_upstream_failed():
+    backend = FailingBackend({"ray"}, latency=0.001)
+    engine = ChainEngine(AIPartnerConfig(), default_backend=backend)
+    run = asyncio.run(engine.run(ChainTask("research", "look it up")))
+    assert not run.ok
+    assert run.results["ray"].error == "RuntimeError: ray down"
+    assert run.results["perplexity"].error == "skipped: upstream failed (ray)"
+    assert run.results["claude"].error.startswith("skipped: upstream failed (ray")
+    assert backend.seen == ["ray"]
+    assert run.output is None
+
+
+def test_engine_times_out_a_slow_partner():
+    config = AIPartnerConfig()
+    config.partners["cursor"]["timeout"] = 0.01
+    engine = ChainEngine(config, default_backend=StubBackend(latency=0.001, latencies={"cursor": 1.0}))
+    run = asyncio.run(engine.run(ChainTask("architecture", "design it")))
+    assert run.results["cursor"].error == "timeout"
+    assert run.results["chatgpt"].ok
+    assert run.output == run.results["chatgpt"].output
+
+
+TASK_TYPES = ["architecture", "research", "coding", "verification", "creative", "manifestation", "observation"]
+
+
+def measured(config, costs, samples=5):
+    scheduler = AdaptiveScheduler(config, enabled=list(config.partners), explore=0.0)
+    for name, latency in costs.items():
+        for _ in range(samples):
+            scheduler.record(PartnerResult(name, output="ok", started=0.0, finished=latency))
+    return scheduler
+
+
+def test_scheduler_without_data_keeps_static_chains():
+    config = AIPartnerConfig()
+    scheduler = AdaptiveScheduler(config, enabled=list(config.partners), explore=0.0)
+    for task_type in TASK_TYPES:
+        assert scheduler.chain(task_type) == config.get_complementary_chain(task_type)
+
+
+def test_scheduler_only_substitutes_alternates():
+    config = AIPartnerConfig()
+    # Every partner measured, the slow ones slowest: any allowed swap happens
+    scheduler = measured(config, {name: 1.0 if name in ("claude", "chatgpt", "ray", "cursor") else 0.01
+                                  for name in config.partners})
+    for task_type in TASK_TYPES:
+        static = config.get_complementary_chain(task_type)
+        chain = scheduler.chain(task_type)
+        assert len(set(chain)) == len(chain) == len(static)
+        for member, pick in zip(static, chain):
+            assert pick == member or pick in config.partners[member]["alternates"], (task_type, member, pick)
+    assert scheduler.chain("architecture")[0] == "claude"  # has no alternates
+    assert scheduler.chain("architecture")[2] == "codeium"
+
+
+def test_scheduler_keeps_unmeasured_members_and_disabled_alternates_out():
+    config = AIPartnerConfig()
+    scheduler = measured(config, {"codeium": 0.01})
+    assert scheduler.chain("architecture") == ["claude", "chatgpt", "cursor"]  # cursor has no data yet
+    scheduler = measured(config, {"codeium": 0.01, "cursor": 1.0})
+    assert scheduler.chain("architecture")[2] == "codeium"
+    scheduler.enabled.discard("codeium")
+    assert scheduler.chain("architecture")[2] == "cursor"
+
+
+def test_cache_evicts_least_recently_used():
+    cache = ResponseCache(max_entries=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1  # b is now the oldest
+    cache.put("c", 3)
+    assert cache.get("b") is None
+    assert (cache.get("a"), cache.get("c")) == (1, 3)
+    assert cache.stats()["evictions"] == 1
+    small = ResponseCache(max_bytes=20)
+    small.put("x", "a" * 10)
+    small.put("y", "b" * 10)  # 12 + 12 bytes of JSON: x goes
+    assert small.get("x") is None and small.bytes == 12
+    small.put("z", "c" * 30)  # never fits
+    assert small.get("z") is None and small.get("y") == "b" * 10
+
+
+def test_cache_entries_expire(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(ai_partners_config.time, "monotonic", lambda: now[0])
+    cache = ResponseCache(ttl=10)
+    cache.put("a", {"v": 1})
+    now[0] += 9
+    assert cache.get("a") == {"v": 1}
+    now[0] += 2
+    assert cache.get("a") is None
+    assert cache.stats()["expired"] == 1 and cache.stats()["entries"] == 0
+
+
+def test_cache_disk_tier_survives_a_new_cache(tmp_path):
+    ResponseCache(disk=tmp_path).put("a", {"v": 1})
+    fresh = ResponseCache(disk=tmp_path)
+    assert fresh.get("a") == {"v": 1}
+    assert fresh.stats()["disk_hits"] == 1
+    assert fresh.purge_disk() == 0
+
+
+def test_cache_key_normalizes_whitespace_and_payload_order():
+    a = ResponseCache.key("claude", ChainTask("coding", "fix  the\nbug", {"x": 1, "y": 2}))
+    b = ResponseCache.key("claude", ChainTask("coding", "fix the bug", {"y": 2, "x": 1}))
+    assert a == b
+    assert a != ResponseCache.key("cursor", ChainTask("coding", "fix the bug", {"x": 1, "y": 2}))
+
+
+def test_engine_coalesces_identical_requests_and_serves_repeats_from_cache():
+    config = AIPartnerConfig()
+    backend = StubBackend(latency=0.02)
+    scheduler = AdaptiveScheduler(config, enabled=list(config.partners), explore=0.0)
+    engine = ChainEngine(config, default_backend=backend, cache=ResponseCache(), scheduler=scheduler)
+
+    async def main():
+        first = await engine.run_many([ChainTask("architecture", "same prompt") for _ in range(5)])
+        again = await engine.run(ChainTask("architecture", "same   prompt"))
+        return first, again
+
+    first, again = asyncio.run(main())
+    assert backend.calls == 3  # one call per partner, shared by the five concurrent runs
+    assert all(r.ok for r in first) and again.ok
+    assert sum(not run.results["claude"].cached for run in first) == 1
+    assert all(r.cached for r in again.results.values())
+    assert len(scheduler.stats["claude"]) == 1  # coalesced and cached results aren't samples
@@ -0,0 +1,41 @@
+import pytest
+
+from FIELD_symbolic_scanner import DEFAULT_IGNORE, FIELDSymbolicScanner, IgnoreRules
+
+
+@pytest.mark.parametrize("patterns, relative, is_dir, expected", [
+    (["node_modules/"], "a/b/node_modules", True, True),
+    (["node_modules/"], "a/node_modules", False, False),       # directories only
+    (["*.log"], "deep/down/run.log", False, True),             # name at any depth
+    (["docs/*.md"], "docs/a.md", False, True),                 # "/" anchors to base_path
+    (["docs/*.md"], "x/docs/a.md", False, False),
+    (["docs/*.md"], "docs/sub/a.md", False, False),            # "*" stays within a segment
+    (["docs/**/*.md"], "docs/sub/deep/a.md", False, True),
+    (["docs/**/*.md"], "docs/a.md", False, True),
+    (["/build"], "build", True, True),
+    (["/build"], "src/build", True, False),
+    (["file?.txt"], "file1.txt", False, True),
+    (["file?.txt"], "file10.txt", False, False),
+    (["[!a]*.py"], "b.py", False, True),
+    (["[!a]*.py"], "a.py", False, False),
+    (["*.py", "!keep.py"], "keep.py", False, False),           # last match wins
+    (["!keep.py", "*.py"], "keep.py", False, True),
+    (["# comment", "", "  "], "# comment", False, False),
+    (DEFAULT_IGNORE, ".git", True, True),
+    (DEFAULT_IGNORE, "src/__pycache__", True, True),
+    (DEFAULT_IGNORE, ".env", False, False),
+])
+def test_gitignore_semantics(patterns, relative, is_dir, expected):
+    assert IgnoreRules(patterns).ignored(relative, relative.rsplit("/", 1)[-1], is_dir) is expected
+
+
+def test_scan_skips_ignored_paths(tmp_path):
+    for path in ["◼_dojo/Controller.py", "◼_dojo/node_modules/Controller.py", "◼_dojo/debug.md",
+                 "◼_dojo/keep.md", "config/Bridge.py", "config/generated/Bridge.py"]:
+        (tmp_path / path).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / path).write_text("ATLAS 432.0 DOJO")
+    scanner = FIELDSymbolicScanner(tmp_path, index_all=True,
+                                   ignore=DEFAULT_IGNORE + ["*.md", "!keep.md", "config/generated/"])
+    scanner.scan_living_architecture()
+    found = {p[len(str(tmp_path)) + 1:] for p in scanner.query("atlas")}
+    assert found == {"◼_dojo/Controller.py", "◼_dojo/keep.md", "config/Bridge.py"}
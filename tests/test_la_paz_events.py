@@ -0,0 +1,141 @@
+import asyncio
+import contextlib
+import json
+import os
+import socket
+import subprocess
+import sys
+import threading
+
+import pytest
+
+from FIELD.petals.la_paz import emit_event
+from FIELD.petals.la_paz.emit_event import EventWriter, emit_stream, parse_line, record, send
+from FIELD.petals.la_paz.event_daemon import EventDaemon, GroupCommit
+
+EMIT = emit_event.__file__
+
+
+@pytest.mark.parametrize("ts", ["2026-03-01T05:00:00Z", "2026-03-01T05:00:00.123456Z",
+                                "2026-03-01 05:00:00", "2026-03-01T05:00:00+00:00"])
+def test_parse_line_accepts_utc_timestamps(ts):
+    rec = parse_line(json.dumps({"kind": "note", "value": "x", "ts": ts}))
+    assert rec["ts"] == ts and rec["data"] == {"value": "x"}
+
+
+@pytest.mark.parametrize("line", [
+    '{"kind": "note", "ts": 1741000000}',
+    '{"kind": "note", "ts": null}',
+    '{"kind": "note", "ts": "2026-03-01"}',
+    '{"kind": "note", "ts": "yesterday"}',
+    '{"kind": "note", "ts": "2026-13-01T05:00:00Z"}',
+    '{"kind": "note", "ts": "20260301T050000Z"}',
+    '{"kind": "note", "ts": "2026-03-01T05:00:00+02:00"}',
+    '{"kind": 7}',
+    '["note"]',
+    'not json',
+])
+def test_parse_line_rejects_bad_lines(line):
+    with pytest.raises((TypeError, ValueError)):
+        parse_line(line)
+
+
+def test_emit_stream_writes_only_valid_lines(tmp_path):
+    path = str(tmp_path / "ev.jsonl")
+    lines = ['{"kind": "note", "value": 1, "ts": "2026-03-01T05:00:00Z"}',
+             '{"kind": "note", "ts": 5}',
+             "",
+             '{"kind": "note", "data": {"value": 2}}']
+    with EventWriter(path, flush_interval=0) as w:
+        assert emit_stream(lines, w) == (2, 1)
+    with open(path) as f:
+        assert [json.loads(line)["data"] for line in f] == [{"value": 1}, {"value": 2}]
+
+
+def run_stdin(tmp_path, *args):
+    env = dict(os.environ, PETAL_LAPAZ_SOCKET=str(tmp_path / "ev.sock"))
+    return subprocess.run([sys.executable, EMIT, "--stdin", *args], input='{"kind": "note"}\n',
+                          env=env, cwd=tmp_path, capture_output=True, text=True, timeout=30)
+
+
+def test_stdin_refuses_fsync_while_the_daemon_runs(tmp_path):
+    daemon = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    daemon.bind(str(tmp_path / "ev.sock"))
+    daemon.listen()
+    try:
+        result = run_stdin(tmp_path, "--fsync", "always")
+    finally:
+        daemon.close()
+    assert result.returncode == 2
+    assert "--fsync" in result.stderr
+
+
+
+@pytest.fixture
+def daemon(tmp_path, monkeypatch):
+    """EventDaemon on a loop thread; yields (daemon, stop(), records per commit)"""
+    commits = []
+    commit = GroupCommit.commit
+
+    def counted(self):
+        commits.append(len(self.events.pending))
+        commit(self)
+
+    monkeypatch.setattr(GroupCommit, "commit", counted)
+    d = EventDaemon(str(tmp_path / "ev.sock"), str(tmp_path / "ev.jsonl"), kinds={"note", "carrier_lock"})
+    loop = asyncio.new_event_loop()
+    ready = threading.Event()
+    task = loop.create_task(d.serve(ready))
+
+    def run():
+        with contextlib.suppress(asyncio.CancelledError):
+            loop.run_until_complete(task)
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    assert ready.wait(10)
+
+    def stop():
+        if not task.done():
+            loop.call_soon_threadsafe(task.cancel)
+        thread.join(10)
+
+    yield d, stop, commits
+    stop()
+    loop.close()
+
+
+def test_daemon_group_commits_each_connection_in_order(daemon, tmp_path):
+    d, stop, commits = daemon
+
+    def client(n, replies):
+        recs = [record("note", {"client": n, "seq": i}, f"2026-03-01T05:{i // 60:02d}:{i % 60:02d}Z")
+                for i in range(500)]
+        recs[10] = {"kind": "unknown_kind", "value": 1}
+        recs[20] = {"kind": "note", "ts": "soon"}
+        replies[n] = send(recs, path=d.path)
+
+    replies = {}
+    threads = [threading.Thread(target=client, args=(n, replies)) for n in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    for n in range(4):
+        assert [i for i, r in enumerate(replies[n]) if not r["ok"]] == [10, 20]
+        assert "unknown kind" in replies[n][10]["error"] and "ts" in replies[n][20]["error"]
+    stop()
+
+    with open(tmp_path / "ev.jsonl") as f:
+        written = [json.loads(line)["data"] for line in f]
+    assert len(written) == d.accepted == 4 * 498 and d.rejected == 4 * 2
+    for n in range(4):
+        assert [w["seq"] for w in written if w["client"] == n] == [i for i in range(500) if i not in (10, 20)]
+    # One write-out per loop turn, not per record
+    assert sum(commits) == len(written) and len(commits) < len(written) / 10
+
+
+def test_daemon_refuses_a_second_instance(daemon, tmp_path):
+    d, _, _ = daemon
+    with pytest.raises(RuntimeError, match="already running"):
+        EventDaemon(d.path, str(tmp_path / "other.jsonl"), kinds={"note"}).claim_socket()
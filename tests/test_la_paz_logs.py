@@ -0,0 +1,251 @@
+import gzip
+import json
+import os
+import random
+
+import pytest
+
+from FIELD.petals.la_paz.emit_event import EventWriter
+from FIELD.petals.la_paz.query_events import EventIndex
+from FIELD.petals.la_paz.rollups import EMPTY, Rollups, fold
+from FIELD.petals.la_paz.segments import SEAL_MEMBER, MemberReader, SegmentedLog, gzip_members, ts_key
+
+KINDS = {"carrier_lock": ["on", "off"], "daily_pulse": ["present", "absent"],
+         "threshold_liminality": [9.5, 12, 15.5, 17], "note": ["hello"]}
+
+
+def events(days, per_day):
+    out = []
+    for day in range(1, days + 1):
+        for i in range(per_day):
+            kind = list(KINDS)[i % len(KINDS)]
+            value = KINDS[kind][(i // len(KINDS) + day) % len(KINDS[kind])]
+            out.append({"ts": f"2026-03-{day:02d}T{i % 24:02d}:{i % 60:02d}:00.{i:06d}Z", "petal": "P",
+                        "kind": kind, "data": {"value": value}})
+    return out
+
+
+def write(log, recs):
+    fd = None
+    for rec in recs:
+        fd = log.append(fd, (json.dumps(rec) + "\n").encode(), rec["ts"])
+    if fd is not None:
+        os.close(fd)
+
+
+def brute(recs, kind=None, value=None, since=None, until=None):
+    return sorted((r for r in recs
+                   if (kind is None or r["kind"] == kind) and (value is None or str(r["data"]["value"]) == value)
+                   and (since is None or ts_key(r["ts"]) >= ts_key(since))
+                   and (until is None or ts_key(r["ts"]) <= ts_key(until))),
+                  key=lambda r: ts_key(r["ts"]))
+
+
+def test_segments_roll_daily_and_by_size(tmp_path):
+    path = str(tmp_path / "ev.jsonl")
+    log = SegmentedLog(path, max_bytes=4096)
+    recs = events(4, 60)
+    write(log, recs)
+    manifest = log.manifest()["segments"]
+    assert len(manifest) > 4  # daily rolls plus size rolls
+    for seg in manifest:
+        assert seg["first_ts"][:10] == seg["last_ts"][:10]
+        with gzip.open(tmp_path / seg["file"], "rb") as f:
+            assert sum(1 for line in f if line.strip()) == seg["records"]
+    assert list(log.records()) == recs
+    window = list(log.records(since="2026-03-02T00:00:00", until="2026-03-02T23:59:59.999999"))
+    assert window == [r for r in recs if r["ts"].startswith("2026-03-02")]
+
+
+def test_background_seal_and_retention(tmp_path):
+    path = str(tmp_path / "ev.jsonl")
+    log = SegmentedLog(path, keep=2, background=True)
+    write(log, events(5, 10))
+    log.wait()
+    assert [s["first_ts"][:10] for s in log.manifest()["segments"]] == ["2026-03-03", "2026-03-04"]
+    assert sorted(n for n in os.listdir(tmp_path) if n.endswith(".gz")) == sorted(
+        s["file"] for s in log.manifest()["segments"])
+    assert not [n for n in os.listdir(tmp_path) if n.startswith("ev.2026") and n.endswith(".jsonl")]
+
+
+def test_recover_seals_segments_an_exit_left_raw(tmp_path):
+    path = str(tmp_path / "ev.jsonl")
+    log = SegmentedLog(path)
+    recs = events(2, 10)
+    write(log, recs[:10])
+    os.rename(path, str(tmp_path / "ev.20260301T000000.jsonl"))  # renamed, never sealed
+    write(log, recs[10:])
+    log.recover(min_age=0)
+    assert [s["records"] for s in log.manifest()["segments"]] == [10]
+    assert not os.path.exists(tmp_path / "ev.20260301T000000.jsonl")
+    assert list(log.records()) == recs
+
+
+@pytest.mark.parametrize("query", [
+    {},
+    {"kind": "daily_pulse", "value": "present"},
+    {"kind": "carrier_lock", "since": "2026-03-02T12:00:00", "until": "2026-03-04"},
+    {"since": "2026-03-05"},
+])
+def test_index_queries_across_segments(tmp_path, query):
+    path = str(tmp_path / "ev.jsonl")
+    log = SegmentedLog(path, max_bytes=8192)
+    recs = events(6, 50)
+    write(log, recs[:150])
+    with EventIndex(path) as idx:
+        idx.sync()
+        write(log, recs[150:])  # rolls the indexed active file
+        idx.sync()
+        expected = brute(recs, **query)
+        assert idx.count(**query) == len(expected)
+        assert sorted(map(json.dumps, idx.select(**query))) == sorted(map(json.dumps, expected))
+        assert [r["ts"] for r in idx.select(**query)] == [r["ts"] for r in expected]
+        if expected:
+            assert ts_key(idx.last(**query)["ts"]) == ts_key(expected[-1]["ts"])
+
+
+def test_index_survives_a_roll_mid_query(tmp_path):
+    path = str(tmp_path / "ev.jsonl")
+    log = SegmentedLog(path)
+    recs = events(1, 200)
+    write(log, recs)
+    with EventIndex(path) as idx:
+        idx.sync()
+        rows = idx.select()
+        first = [next(rows) for _ in range(20)]
+        log.roll()
+        assert first + list(rows) == brute(recs)
+
+
+def test_writer_rolls_and_index_counts(tmp_path):
+    path = str(tmp_path / "ev.jsonl")
+    recs = events(3, 40)
+    with EventWriter(path, batch_size=16, flush_interval=0) as w:
+        w.write_many(recs)
+    assert len(SegmentedLog(path).manifest()["segments"]) == 2
+    with EventIndex(path) as idx:
+        idx.sync()
+        assert [d for d, _ in idx.days()] == ["2026-03-01", "2026-03-02", "2026-03-03"]
+        assert idx.count(kind="note") == len(brute(recs, kind="note"))
+
+
+
+
+def big_segment(tmp_path, n=20000):
+    path = str(tmp_path / "ev.jsonl")
+    log = SegmentedLog(path)
+    rnd = random.Random(16)
+    recs = [{"ts": f"2026-03-01T{i // 3600 % 24:02d}:{i // 60 % 60:02d}:{i % 60:02d}Z", "kind": "note",
+             "data": {"value": i, "pad": "x" * rnd.randrange(0, 300)}} for i in range(n)]
+    write(log, recs)
+    entry = log.roll()
+    return log, str(tmp_path / entry["file"]), recs
+
+
+class Counting:
+    """Raw segment file that counts the compressed bytes read through it"""
+
+    def __init__(self, f):
+        self.f, self.read_bytes = f, 0
+
+    def read(self, n):
+        data = self.f.read(n)
+        self.read_bytes += len(data)
+        return data
+
+    def seek(self, offset):
+        self.f.seek(offset)
+
+    def close(self):
+        self.f.close()
+
+
+def test_sealed_segments_read_from_the_nearest_member(tmp_path):
+    _, seg, recs = big_segment(tmp_path)
+    raw = b"".join((json.dumps(r) + "\n").encode() for r in recs)
+    with gzip.open(seg, "rb") as f:
+        assert f.read() == raw
+    members = gzip_members(seg)
+    assert [u for u, _ in members] == list(range(0, len(raw), SEAL_MEMBER))
+
+    offsets = [0]
+    for line in raw.splitlines(keepends=True)[:-1]:
+        offsets.append(offsets[-1] + len(line))
+    picks = sorted(random.Random(1).sample(range(len(offsets)), 200)) + [len(offsets) - 1, 0, 5]
+    with MemberReader(Counting(open(seg, "rb")), members) as reader:
+        for i in picks:
+            reader.seek(offsets[i])
+            assert json.loads(reader.readline()) == recs[i]
+
+    # One record deep in the segment costs about one member, not the segment
+    size = os.path.getsize(seg)
+    with MemberReader(Counting(open(seg, "rb")), members) as reader:
+        reader.seek(offsets[-2])
+        assert json.loads(reader.readline()) == recs[-2]
+        assert json.loads(reader.readline()) == recs[-1]
+        assert reader.readline() == b""
+        assert reader.f.read_bytes == size - members[-1][1] < size / 4
+
+
+def test_single_member_segments_still_read(tmp_path):
+    path = tmp_path / "old.jsonl.gz"
+    lines = [b'{"n": %d}\n' % i for i in range(1000)]
+    with gzip.open(path, "wb") as f:
+        f.write(b"".join(lines))
+    assert gzip_members(str(path)) == [(0, 0)]
+    with MemberReader(open(path, "rb"), gzip_members(str(path))) as reader:
+        reader.seek(sum(map(len, lines[:700])))
+        assert reader.readline() == lines[700]
+        assert reader.readline() == lines[701]
+
+
+def test_index_reads_deep_records_without_inflating_the_segment(tmp_path, monkeypatch):
+    log, seg, recs = big_segment(tmp_path)
+    readers = []
+    init = MemberReader.__init__
+
+    def counted(self, f, members):
+        init(self, Counting(f), members)
+        readers.append(self)
+
+    monkeypatch.setattr(MemberReader, "__init__", counted)
+    size = os.path.getsize(seg)
+    with EventIndex(log.path) as idx:
+        idx.sync()
+        assert idx.last() == recs[-1]
+        assert readers[-1].f.read_bytes < size / 4
+        window = list(idx.select(since="2026-03-01T05:00:00", until="2026-03-01T05:00:59"))
+        assert window == [r for r in recs if r["ts"].startswith("2026-03-01T05:00:")]
+        assert readers[-1].f.read_bytes < size / 4
+
+
+def test_rollups_count_past_uint16(tmp_path):
+    path = str(tmp_path / "ev.jsonl")
+    line = json.dumps({"ts": "2026-03-01T05:00:00Z", "kind": "carrier_lock", "data": {"value": "on"}}) + "\n"
+    with open(path, "w") as f:
+        f.write(line * 70000)
+    r = Rollups(path, band=(10, 16))
+    assert r.update() == 1
+    assert list(r.column("carrier_on")) == [70000]
+    assert r.carrier_uptime() == 1.0
+
+
+def test_rollups_match_a_brute_force_fold_after_backfill(tmp_path):
+    path = str(tmp_path / "ev.jsonl")
+    recs = events(6, 30)
+    log = SegmentedLog(path)
+    write(log, recs[90:])  # days 4-6 first
+    r = Rollups(path, band=(10, 16))
+    assert r.update() == 3
+    write(log, recs[:90])  # then history before the origin
+    assert r.update() == 3
+    assert r.update() == 0
+
+    expected = {}
+    for rec in sorted(recs, key=lambda rec: ts_key(rec["ts"])):
+        fold(expected.setdefault(rec["ts"][:10], dict(EMPTY)), rec, (10, 16))
+    days = sorted(expected)
+    for name in ("carrier_on", "carrier_off", "carrier", "pulse", "liminal", "band"):
+        assert list(r.column(name)) == [expected[d][name] for d in days], name
+    assert list(r.column("liminal", since=days[1], until=days[2])) == [expected[d]["liminal"] for d in days[1:3]]
+    assert sum(r.column("carrier_on", resolution="hour")) == sum(e["carrier_on"] for e in expected.values())
@@ -0,0 +1,69 @@
+import json
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+from FIELD.petals.la_paz import manifest
+from FIELD.petals.la_paz.manifest import SNAPSHOT, load_manifest
+
+LA_PAZ = Path(manifest.__file__).parent
+
+
+@pytest.fixture
+def petal(tmp_path):
+    for name in manifest.SOURCES:
+        shutil.copy(LA_PAZ / name, tmp_path)
+    return tmp_path
+
+
+def no_parsing(monkeypatch):
+    def fail(text):
+        raise AssertionError("petal.yml parsed again")
+    monkeypatch.setattr(manifest, "parse_yaml", fail)
+
+
+def test_snapshot_serves_unchanged_and_touched_manifests(petal, monkeypatch):
+    first = load_manifest(str(petal))
+    assert (petal / SNAPSHOT).exists()
+    no_parsing(monkeypatch)
+    assert load_manifest(str(petal)) == first
+    os.utime(petal / "petal.yml", ns=(1, 1))  # mtime moved, content didn't
+    assert load_manifest(str(petal)) == first
+    assert manifest.read_snapshot(str(petal))["stat"] == manifest.sources_stat(str(petal))
+
+
+def test_changed_manifest_is_parsed_again(petal):
+    load_manifest(str(petal))
+    with open(petal / "petal.yml", "a") as f:
+        f.write("extra: 1\n")
+    y, _, digest = load_manifest(str(petal))
+    assert y["extra"] == 1
+    assert digest == manifest.digest(str(petal))
+
+
+@pytest.mark.parametrize("extra, value", [
+    ("released: 2025-08-09\n", "2025-08-09"),     # a datetime.date: not JSON at all
+    ("bands:\n  10: low\n  16: high\n", "low"),    # int keys would come back as "10"
+])
+def test_manifests_json_cannot_hold_are_not_cached(petal, extra, value):
+    with open(petal / "petal.yml", "a") as f:
+        f.write(extra)
+    y, _, _ = load_manifest(str(petal))
+    assert not (petal / SNAPSHOT).exists()
+    assert not list(petal.rglob("*.tmp"))
+    again, _, _ = load_manifest(str(petal))
+    assert again == y
+    assert str(y.get("released", y.get("bands", {}).get(10))) == value
+
+
+def test_unwritable_snapshot_leaves_no_tmp(petal, monkeypatch):
+    def refuse(src, dst):
+        raise PermissionError(dst)
+    monkeypatch.setattr(manifest.os, "replace", refuse)
+    y, c, _ = load_manifest(str(petal))
+    assert c == json.loads((petal / "constants.json").read_text())
+    assert load_manifest(str(petal))[0] == y
+    assert not (petal / SNAPSHOT).exists()
+    assert not list(petal.rglob("*.tmp"))
@@ -0,0 +1,123 @@
+import json
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+import yaml
+
+from FIELD.petals.la_paz import register_petal
+from FIELD.petals.la_paz.registry_store import RegistryStore
+
+LA_PAZ = Path(register_petal.__file__).parent
+
+
+@pytest.fixture
+def petals(tmp_path, monkeypatch):
+    monkeypatch.setattr(register_petal, "REGISTRY_AUDIT", str(tmp_path / "logs" / "registry.audit.jsonl"))
+    root = tmp_path / "petals"
+
+    def make(name, petal_id, key):
+        d = root / name
+        d.mkdir(parents=True, exist_ok=True)
+        doc = yaml.safe_load((LA_PAZ / "petal.yml").read_text(encoding="utf-8"))
+        doc["id"], doc["outputs"]["registry_key"] = petal_id, key
+        (d / "petal.yml").write_text(yaml.safe_dump(doc, allow_unicode=True), encoding="utf-8")
+        shutil.copy(LA_PAZ / "constants.json", d)
+        return str(d)
+
+    make.root, make.registry = str(root), str(tmp_path / "registry")
+    return make
+
+
+def stored(registry):
+    with RegistryStore(registry, export=False) as store:
+        return store.keys()
+
+
+def payload(petal_id, key, registry):
+    return {"id": petal_id, "symbol": "🌸", "signals": ["daily_pulse"], "archetype": {"tata": {}},
+            "coords": {"lat": "▼TATA"}, "paths": {"registry_file": f"{registry}/{key}.json"}}
+
+
+def test_put_many_rejects_repeated_ids(tmp_path):
+    registry = str(tmp_path / "registry")
+    with RegistryStore(registry) as store:
+        store.put_many([payload("A", "KA", registry), payload("B", "KB", registry)])
+        with pytest.raises(ValueError):
+            store.put_many([payload("C", "KC", registry), payload("C", "KD", registry)])
+        # Another key reusing a stored id is refused, not an overwrite of A's row
+        with pytest.raises(ValueError):
+            store.put(payload("A", "KZ", registry))
+        store.put_many([payload("A", "KA2", registry)], retire=["KA"])
+    assert stored(registry) == {"A": "KA2", "B": "KB"}
+
+
+def test_register_all_reports_id_clashes(petals):
+    a = petals("a", "A", "KA")
+    petals("b", "B", "KB")
+    assert register_petal.register_all(petals.root, petals.registry)["invalid"] == {}
+
+    b = petals("b", "A", "KB")  # a changed petal takes A's id
+    c = petals("c", "C", "KC")
+    d = petals("d", "C", "KD")  # two new petals share an id
+    batch = register_petal.register_all(petals.root, petals.registry)
+    assert batch["registered"] == ["C"]
+    assert set(batch["invalid"]) == {b, d}
+    assert a in batch["invalid"][b]
+    assert stored(petals.registry) == {"A": "KA", "B": "KB", "C": "KC"}
+
+    with open(f"{petals.registry}/.register_state.json") as f:
+        assert set(json.load(f)) == {a, c}
+    audit = Path(register_petal.REGISTRY_AUDIT).read_text().splitlines()
+    assert [json.loads(line)["kind"] for line in audit] == ["register_batch", "register_batch"]
+
+
+def test_register_all_skips_unchanged_and_follows_key_moves(petals):
+    petals("a", "A", "KA")
+    petals("b", "B", "KB")
+    register_petal.register_all(petals.root, petals.registry)
+    again = register_petal.register_all(petals.root, petals.registry)
+    assert again["registered"] == [] and again["unchanged"] == 2
+
+    petals("a", "A", "KA2")
+    moved = register_petal.register_all(petals.root, petals.registry)
+    assert moved["registered"] == ["A"]
+    assert stored(petals.registry) == {"A": "KA2", "B": "KB"}
+    assert not Path(f"{petals.registry}/KA.json").exists()
+    assert Path(f"{petals.registry}/KA2.json").exists()
+
+
+def test_register_all_uses_a_pool_for_big_batches(petals):
+    dirs = [petals(f"p{i}", f"P{i}", f"K{i}") for i in range(register_petal.INLINE_BELOW + 2)]
+    with open(f"{dirs[0]}/petal.yml", "w") as f:
+        f.write("- not\n- a mapping\n")
+    batch = register_petal.register_all(petals.root, petals.registry, jobs=2)
+    assert sorted(batch["registered"]) == sorted(f"P{i}" for i in range(1, len(dirs)))
+    assert "mappings" in batch["invalid"][dirs[0]]
+
+
+@pytest.mark.parametrize("jobs", ["0", "-2"])
+def test_cli_rejects_non_positive_jobs(tmp_path, jobs):
+    result = subprocess.run([sys.executable, register_petal.__file__, "--all", "--petals", str(tmp_path),
+                             "--registry", str(tmp_path / "registry"), "--jobs", jobs],
+                            capture_output=True, text=True, timeout=30)
+    assert result.returncode == 2
+    assert "--jobs" in result.stderr and "at least 1" in result.stderr
+
+
+def test_coords_with_list_and_mapping_values_are_indexed(tmp_path, capsys):
+    registry = str(tmp_path / "registry")
+    a, b, c = payload("A", "KA", registry), payload("B", "KB", registry), payload("C", "KC", registry)
+    a["coords"] = {"lat_lon": [-16.5, -68.1], "lat": "▼TATA"}
+    b["coords"] = {"frame": {"z": 1, "x": 0}}
+    c["coords"] = ["not", "a", "mapping"]
+    with RegistryStore(registry, export=False) as store:
+        store.put_many([a, b, c])
+        reg = store.load()
+    assert [p["id"] for p in reg.at("lat_lon", [-16.5, -68.1])] == ["A"]
+    assert [p["id"] for p in reg.at("lat", "▼TATA")] == ["A"]
+    assert [p["id"] for p in reg.at("frame", {"x": 0, "z": 1})] == ["B"]
+    assert reg.get("C")["coords"] == ["not", "a", "mapping"]
+    assert "C: coords is not a mapping" in capsys.readouterr().err
@@ -0,0 +1,114 @@
+import socket
+import threading
+import time
+
+import pytest
+
+from scripts.partner_http import ConnectFailed, ConnectionPool, PartnerClient, StandInServer, TokenBucket
+
+
+def client(server_url, **kwargs):
+    return PartnerClient("test", server_url, rate=None, backoff=0.01, seed=0, **kwargs)
+
+
+def test_bucket_paces_to_its_rate_and_backs_off_on_throttle():
+    bucket = TokenBucket(100.0, burst=1)
+    started = time.monotonic()
+    for _ in range(11):
+        bucket.acquire()
+    assert 0.08 < time.monotonic() - started < 0.5
+    bucket.throttle(0.05)
+    assert bucket.rate == 50.0
+    assert not bucket.try_acquire()
+    time.sleep(0.08)
+    assert bucket.try_acquire()
+    for _ in range(100):
+        bucket.recover()
+    assert bucket.rate == 100.0
+
+
+def test_bucket_is_shared_between_threads():
+    bucket = TokenBucket(200.0, burst=1)
+    started = time.monotonic()
+    threads = [threading.Thread(target=lambda: [bucket.acquire() for _ in range(10)]) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert time.monotonic() - started > 0.15  # 40 tokens at 200/s, not 10
+
+
+def test_post_is_retried_after_429():
+    with StandInServer(rate=5.0, burst=1) as server:
+        c = client(server.url)
+        try:
+            assert c.request("POST", "/echo", {"n": 1}) == {"echo": {"n": 1}}
+            assert c.request("POST", "/echo", {"n": 2}) == {"echo": {"n": 2}}  # bucket empty: 429, then ok
+        finally:
+            c.close()
+    assert server.counts["throttled"] >= 1
+    assert c.stats()["retries"] == server.counts["throttled"]
+    assert server.counts["requests"] == 2 + server.counts["throttled"]
+
+
+def test_post_is_not_retried_after_a_read_timeout():
+    with StandInServer(latency=0.3) as server:
+        c = client(server.url, timeout=0.05, retries=3)
+        try:
+            with pytest.raises(TimeoutError):
+                c.request("POST", "/echo", {"n": 1})
+            assert server.counts["requests"] == 1  # the server got it, and may have acted on it
+            assert c.stats()["retries"] == 0
+            with pytest.raises(TimeoutError):
+                c.request("POST", "/echo", {"n": 1}, idempotency_key="job-1")
+            assert c.stats()["retries"] == 3
+        finally:
+            c.close()
+
+
+def test_post_is_retried_when_it_never_connected():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]  # closed again: connections are refused
+    c = client(f"http://127.0.0.1:{port}", retries=2)
+    try:
+        with pytest.raises(ConnectFailed):
+            c.request("POST", "/echo", {"n": 1})
+    finally:
+        c.close()
+    assert c.stats()["requests"] == 3
+
+
+def test_pool_reuses_keep_alive_connections():
+    with StandInServer() as server:
+        c = client(server.url, max_connections=2)
+        try:
+            assert c.batch("/echo", [{"n": i} for i in range(20)]) == [{"echo": {"n": i}} for i in range(20)]
+        finally:
+            c.close()
+    assert c.stats()["connections_opened"] <= 2
+    assert server.counts["connections"] == c.stats()["connections_opened"]
+
+
+def test_pool_replaces_idle_connections_the_server_closed():
+    with socket.socket() as listener:
+        listener.bind(("127.0.0.1", 0))
+        listener.listen()
+
+        def serve():
+            for _ in range(2):
+                conn, _ = listener.accept()
+                with conn:
+                    conn.recv(65536)
+                    conn.sendall(b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\n{}")  # keep-alive, then hang up
+                    time.sleep(0.05)
+
+        thread = threading.Thread(target=serve, daemon=True)
+        thread.start()
+        pool = ConnectionPool(f"http://127.0.0.1:{listener.getsockname()[1]}")
+        assert pool.request("POST", "/echo", b"{}")[0] == 200
+        time.sleep(0.2)
+        assert pool.request("POST", "/echo", b"{}")[0] == 200  # not sent on the dead connection
+        assert pool.opened == 2
+        pool.close()
+        thread.join(1)
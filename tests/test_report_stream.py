@@ -0,0 +1,41 @@
+import io
+import json
+
+from FIELD_report_stream import NDJSONReportWriter, load_report_stream, summarize_report_stream
+from FIELD_symbolic_scanner import FIELDSymbolicScanner
+from test_symbolic_scanner import build_tree, normalized
+
+
+def stream(tree, compact=False):
+    buffer = io.StringIO()
+    report = FIELDSymbolicScanner(tree).scan_living_architecture(NDJSONReportWriter(buffer, compact))
+    return report, [json.loads(line) for line in buffer.getvalue().splitlines()]
+
+
+def test_stream_loads_back_into_the_report(tmp_path):
+    build_tree(tmp_path / "tree")
+    expected = FIELDSymbolicScanner(tmp_path / "tree").scan_living_architecture()
+    _, records = stream(tmp_path / "tree")
+    assert records[0]["record"] == "scan"
+    assert normalized(load_report_stream(records)) == normalized(expected)
+
+
+def test_compact_stream_has_the_same_records(tmp_path):
+    build_tree(tmp_path / "tree")
+    _, pretty = stream(tmp_path / "tree")
+    _, compact = stream(tmp_path / "tree", compact=True)
+    strip = lambda records: [r for r in normalized({"r": records})["r"] if r["record"] != "scan"]
+    assert strip(compact) == strip(pretty)
+
+
+def test_summary_keeps_what_the_weave_report_renders(tmp_path):
+    build_tree(tmp_path / "tree")
+    report, records = stream(tmp_path / "tree")
+    summary = summarize_report_stream(records)
+    assert summary["breathing_files"] == json.loads(json.dumps(report["breathing_files"], default=str))
+    assert summary["field_spine_candidates"] == report["field_spine_candidates"][:5]
+    assert summary["trident_detections"] == report["trident_detections"]
+    # The header is stamped when the scan starts, the report when it is assembled
+    summary["scan_timestamp"] = report["scan_timestamp"]
+    scanner = FIELDSymbolicScanner(tmp_path / "tree")
+    assert scanner.generate_weave_report(summary) == scanner.generate_weave_report(report)
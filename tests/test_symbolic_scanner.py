@@ -0,0 +1,128 @@
+import json
+import os
+import random
+import re
+import time
+
+import pytest
+
+from FIELD_scan_index import ScanIndex
+from FIELD_symbolic_scanner import FIELDSymbolicScanner, SymbolicMatcher, TopK
+
+WORDS = ["OB1", "tata", "Atlas", "DOJO", "dojocontroller", "DOJOController", "432.0", "432", "4320",
+         "0.85", "1.618", "Chakra", "ENERGY", "frequency", "Resonance", "FIELD", "field", "Field",
+         "sacred", "GEOMETRIC", "harmony", "Fractal", "●", "▲", "⬡", "İ", "ı", "ſacred", "K",
+         "plain", "text", "\n", "  "]
+
+
+def random_content(rnd, words=400):
+    return " ".join(rnd.choice(WORDS) for _ in range(words))
+
+
+@pytest.fixture(scope="module")
+def scanner():
+    return FIELDSymbolicScanner(base_path="/nonexistent")
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_matcher_agrees_with_findall(scanner, seed):
+    content = random_content(random.Random(seed))
+    features = SymbolicMatcher(scanner.sacred_symbols, scanner.living_patterns).scan(content)
+    found = {p["pattern"]: p for p in features["living_patterns"]}
+    for name, regex in scanner.living_patterns.items():
+        expected = re.findall(regex, content, re.IGNORECASE)
+        if not expected:
+            assert name not in found
+            continue
+        assert found[name]["matches"] == len(expected), name
+        assert found[name]["examples"] == expected[:3], name
+
+
+def test_matcher_segments_and_indexing_keep_counts(scanner):
+    content = random_content(random.Random(99), 2000)
+    plain = SymbolicMatcher(scanner.sacred_symbols, scanner.living_patterns).scan(content)
+    indexed = SymbolicMatcher(scanner.sacred_symbols, scanner.living_patterns, scanner.indexed_patterns)
+    with_postings = indexed.scan(content)
+    assert with_postings["living_patterns"] == plain["living_patterns"]
+    assert with_postings["sacred_symbols"] == plain["sacred_symbols"]
+    assert set(with_postings["postings"]) <= set(scanner.indexed_patterns)
+
+
+@pytest.mark.parametrize("k", [0, 1, 3, 10, 50, None])
+def test_topk_matches_stable_sort(k):
+    rnd = random.Random(k or 7)
+    scored = [(rnd.choice([0.1, 0.5, 0.5, 0.9, 1.0]), f"item{i}") for i in range(200)]
+    top = TopK(k)
+    for score, item in scored:
+        top.push(score, item)
+    expected = [item for _, item in sorted(scored, key=lambda s: -s[0])]
+    assert top.items() == (expected if k is None else expected[:k])
+
+
+def test_spine_limit_keeps_the_best_candidates(tmp_path):
+    build_tree(tmp_path / "tree")
+    full = FIELDSymbolicScanner(tmp_path / "tree").scan_living_architecture()
+    limited = FIELDSymbolicScanner(tmp_path / "tree", spine_limit=3).scan_living_architecture()
+    assert limited["field_spine_candidates"] == full["field_spine_candidates"][:3]
+
+
+def build_tree(root, files=40, seed=432):
+    rnd = random.Random(seed)
+    old = time.time() - 30 * 86400
+    dirs = [root / "◼_dojo", root / "DOJO-App" / "Sources", root / "config", root / "misc" / "deep"]
+    for i in range(files):
+        d = dirs[i % len(dirs)]
+        d.mkdir(parents=True, exist_ok=True)
+        name = rnd.choice(["Controller", "Manager", "Bridge", "notes", "util"]) + f"{i}" + rnd.choice([".py", ".md", ".swift", ".json"])
+        path = d / name
+        path.write_text(random_content(rnd, 150), encoding="utf-8")
+        if i % 3:
+            os.utime(path, (old, old))
+
+
+def normalized(report):
+    report = json.loads(json.dumps(report, default=str))
+    report.pop("scan_timestamp", None)
+    return report
+
+
+def test_index_warm_scan_matches_cold(tmp_path):
+    build_tree(tmp_path / "tree")
+    index_path = tmp_path / "scan_index.sqlite"
+    cold = FIELDSymbolicScanner(tmp_path / "tree", index_path=index_path).scan_living_architecture()
+    assert index_path.exists()
+    warm = FIELDSymbolicScanner(tmp_path / "tree", index_path=index_path).scan_living_architecture()
+    unindexed = FIELDSymbolicScanner(tmp_path / "tree").scan_living_architecture()
+    assert normalized(warm) == normalized(cold)
+    assert normalized(unindexed) == normalized(cold)
+
+
+def test_index_entries_go_stale_with_the_file(tmp_path):
+    path = tmp_path / "notes.md"
+    path.write_text("Atlas 432")
+    old = time.time() - 60
+    os.utime(path, (old, old))
+    index = ScanIndex(tmp_path / "index.sqlite", "sig")
+    index.store(str(path), path.stat(), {"living_patterns": []})
+    index.close()
+
+    index = ScanIndex(tmp_path / "index.sqlite", "sig")
+    assert index.lookup(str(path), path.stat()) == {"living_patterns": []}
+    path.write_text("Atlas 432 and more")
+    os.utime(path, (old + 1, old + 1))
+    assert index.lookup(str(path), path.stat()) is None
+    index.close()
+    # New pattern definitions invalidate everything
+    assert ScanIndex(tmp_path / "index.sqlite", "other").lookup(str(path), path.stat()) is None
+
+
+def test_query_covers_files_outside_report_sections(tmp_path):
+    build_tree(tmp_path / "tree")
+    full = FIELDSymbolicScanner(tmp_path / "tree", index_all=True)
+    full.scan_living_architecture()
+    expected = sorted(
+        str(p) for p in (tmp_path / "tree").rglob("*")
+        if p.is_file() and re.search("atlas", p.read_text(encoding="utf-8"), re.IGNORECASE)
+        and re.search(r"432\.0?", p.read_text(encoding="utf-8"))
+    )
+    assert sorted(full.query("atlas", "432")) == expected
@@ -0,0 +1,85 @@
+import json
+import os
+import sys
+
+import pytest
+
+from FIELD_symbolic_scanner import FIELDSymbolicScanner
+from FIELD_watcher import FIELDWatcher, InotifySource, PollingSource
+from test_symbolic_scanner import build_tree, normalized
+
+
+def unordered(value):
+    """Report with every list sorted - changed files join the live state at the end"""
+    if isinstance(value, dict):
+        return {k: unordered(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return sorted((unordered(v) for v in value), key=lambda v: json.dumps(v, sort_keys=True))
+    return value
+
+
+def same_report(a, b):
+    return unordered(normalized(a)) == unordered(normalized(b))
+
+
+def live(tree, **kwargs):
+    watcher = FIELDWatcher(FIELDSymbolicScanner(tree), use_inotify=False, **kwargs)
+    watcher.build()
+    return watcher
+
+
+def test_live_report_follows_changes(tmp_path):
+    tree = tmp_path / "tree"
+    build_tree(tree)
+    watcher = live(tree)
+    assert same_report(watcher.live_report(), FIELDSymbolicScanner(tree).scan_living_architecture())
+
+    changed = next((tree / "◼_dojo").iterdir())
+    changed.write_text("ATLAS 432.0 sacred geometric harmony")
+    added = tree / "config" / "BridgeNew.py"
+    added.write_text("OB1 TATA DOJO resonance")
+    removed = next(p for p in (tree / "config").iterdir() if p != added)
+    removed.unlink()
+    assert watcher.apply([("file", str(changed)), ("file", str(added)), ("file", str(removed))])
+    assert same_report(watcher.live_report(), FIELDSymbolicScanner(tree).scan_living_architecture())
+    # Nothing new since: a resync finds no changes
+    assert not watcher.apply([("resync", None)])
+
+
+def test_resync_picks_up_missed_changes(tmp_path):
+    tree = tmp_path / "tree"
+    build_tree(tree)
+    watcher = live(tree)
+    (tree / "misc" / "deep" / "Manager99.swift").write_text("DOJOController frequency 1.618")
+    assert watcher.apply([("resync", None)])
+    assert same_report(watcher.live_report(), FIELDSymbolicScanner(tree).scan_living_architecture())
+
+
+def test_watch_failure_falls_back_to_configured_poll_interval(tmp_path):
+    watcher = FIELDWatcher(FIELDSymbolicScanner(tmp_path), poll_interval=7.5, use_inotify=False)
+
+    class Exhausted(PollingSource):
+        def watch(self, path):
+            raise OSError(28, "No space left on device")
+
+    watcher.source = Exhausted()
+    watcher._watch(str(tmp_path))
+    assert type(watcher.source) is PollingSource
+    assert watcher.source.interval == 7.5
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is Linux-only")
+def test_inotify_reports_files_and_directories(tmp_path):
+    source = InotifySource()
+    try:
+        source.watch(str(tmp_path))
+        (tmp_path / "a.py").write_text("x")
+        os.mkdir(tmp_path / "sub")
+        actions = source.poll(2.0)
+        assert ("file", str(tmp_path / "a.py")) in actions
+        assert ("dir_added", str(tmp_path / "sub")) in actions
+        os.rmdir(tmp_path / "sub")
+        assert ("dir_removed", str(tmp_path / "sub")) in source.poll(2.0)
+        assert source.poll(0.05) == []
+    finally:
+        source.close()